@@ -0,0 +1,48 @@
+"""ingredient trigram indexes
+
+Postgres 에서 재료 이름/초성 부분 일치 검색(LIKE '%...%')이 순차 스캔을 하지 않도록
+pg_trgm GIN 색인을 추가합니다. SQLite 에서는 아무 작업도 하지 않습니다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_ingredients_name_trgm",
+        "ingredients",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_ingredients_chosung_trgm",
+        "ingredients",
+        ["chosung"],
+        postgresql_using="gin",
+        postgresql_ops={"chosung": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_index("ix_ingredients_chosung_trgm", table_name="ingredients")
+    op.drop_index("ix_ingredients_name_trgm", table_name="ingredients")
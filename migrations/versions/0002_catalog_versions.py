@@ -0,0 +1,40 @@
+"""catalog versions
+
+워커 간 참조 데이터 스냅샷/캐시 동기화를 위한 엔티티 종류별 버전 테이블을 추가합니다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CATALOG_ENTITIES = ("categories", "cooking_tools", "ingredients", "cooking_settings")
+
+
+def upgrade() -> None:
+    # 앱 시작 시 init_db 의 create_all 로 이미 만들어졌을 수 있습니다.
+    if sa.inspect(op.get_bind()).has_table("catalog_versions"):
+        return
+
+    table = op.create_table(
+        "catalog_versions",
+        sa.Column("entity", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("entity"),
+    )
+    op.bulk_insert(table, [{"entity": entity, "version": 0} for entity in CATALOG_ENTITIES])
+
+
+def downgrade() -> None:
+    op.drop_table("catalog_versions")
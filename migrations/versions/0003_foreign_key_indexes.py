@@ -0,0 +1,45 @@
+"""foreign key indexes
+
+조리 설정/팁/타이머/피드백/영양 태그 연결의 외래 키 조회용 색인을 추가합니다.
+새로 만든 DB 는 init_db 의 create_all 로 이미 색인이 있으므로 if_not_exists 로 건너뜁니다.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    (
+        "ix_cooking_settings_ingredient_id_cooking_tool_id",
+        "cooking_settings",
+        ["ingredient_id", "cooking_tool_id"],
+    ),
+    ("ix_cooking_setting_tips_cooking_setting_id", "cooking_setting_tips", ["cooking_setting_id"]),
+    ("ix_timers_cooking_setting_id", "timers", ["cooking_setting_id"]),
+    ("ix_timer_feedbacks_timer_id", "timer_feedbacks", ["timer_id"]),
+    (
+        "ix_ingredient_nutrition_links_nutrition_tag_id",
+        "ingredient_nutrition_links",
+        ["nutrition_tag_id"],
+    ),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,88 @@
+"""catalog sync tracking
+
+오프라인 내보내기의 delta 동기화를 위해 참조 데이터 테이블에 updated_at/sync_version 컬럼과
+삭제 기록(catalog_tombstones) 테이블, 내보내기 버전 행을 추가합니다.
+init_db 의 create_all 로 이미 만들어진 테이블/컬럼은 건너뜁니다.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRACKED_TABLES = (
+    "categories",
+    "cooking_tools",
+    "nutrition_tags",
+    "ingredients",
+    "cooking_settings",
+    "cooking_setting_tips",
+)
+
+EXPORT_VERSION_ENTITY = "export"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    for table in TRACKED_TABLES:
+        columns = {column["name"] for column in inspector.get_columns(table)}
+        if "updated_at" not in columns:
+            op.add_column(table, sa.Column("updated_at", sa.DateTime(), nullable=True))
+        if "sync_version" not in columns:
+            op.add_column(
+                table,
+                sa.Column("sync_version", sa.Integer(), nullable=False, server_default="0"),
+            )
+        op.create_index(f"ix_{table}_sync_version", table, ["sync_version"], if_not_exists=True)
+
+    if not inspector.has_table("catalog_tombstones"):
+        op.create_table(
+            "catalog_tombstones",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("entity", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+            sa.Column("row_id", sa.Integer(), nullable=False),
+            sa.Column("sync_version", sa.Integer(), nullable=False),
+            sa.Column("deleted_at", sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+        )
+    op.create_index(
+        "ix_catalog_tombstones_sync_version",
+        "catalog_tombstones",
+        ["sync_version"],
+        if_not_exists=True,
+    )
+
+    versions = sa.table(
+        "catalog_versions", sa.column("entity", sa.String), sa.column("version", sa.Integer)
+    )
+    exists = bind.execute(
+        sa.select(versions.c.entity).where(versions.c.entity == EXPORT_VERSION_ENTITY)
+    ).first()
+    if exists is None:
+        op.bulk_insert(versions, [{"entity": EXPORT_VERSION_ENTITY, "version": 0}])
+
+
+def downgrade() -> None:
+    versions = sa.table("catalog_versions", sa.column("entity", sa.String))
+    op.execute(versions.delete().where(versions.c.entity == EXPORT_VERSION_ENTITY))
+
+    op.drop_index("ix_catalog_tombstones_sync_version", table_name="catalog_tombstones")
+    op.drop_table("catalog_tombstones")
+    for table in reversed(TRACKED_TABLES):
+        op.drop_index(f"ix_{table}_sync_version", table_name=table)
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column("sync_version")
+            batch_op.drop_column("updated_at")
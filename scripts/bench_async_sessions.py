@@ -0,0 +1,148 @@
+"""
+async def 엔드포인트의 동기 Session vs AsyncSession 동시성 벤치마크.
+
+임시 SQLite 파일에 사용자 테이블을 만들고, 같은 조회를 하는 두 엔드포인트를 비교합니다.
+- before: async def 안에서 동기 Session 사용 (쿼리 동안 이벤트 루프가 멈춤)
+- after:  async def + AsyncSession(aiosqlite) 사용 (쿼리 동안 다른 요청을 처리)
+
+DB 왕복 지연은 접속마다 등록한 latency(ms) SQL 함수로 흉내 냅니다.
+동시 클라이언트 200 개의 지연 분포와 처리량, 이벤트 루프 지연(예정보다 늦게 깨어난 시간)을 출력합니다.
+before 는 요청이 사실상 하나씩 실행되므로 개별 지연은 작아 보이지만, 그동안 루프가 멈춰
+다른 모든 요청(DB 를 쓰지 않는 요청 포함)이 기다립니다. 처리량과 루프 지연을 함께 보세요.
+
+    python scripts/bench_async_sessions.py
+"""
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append("src")
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from sqlalchemy import event, func  # noqa: E402
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+from sqlmodel import Session, SQLModel, create_engine, select  # noqa: E402
+from sqlmodel.ext.asyncio.session import AsyncSession  # noqa: E402
+
+from models.user import User  # noqa: E402
+
+CLIENTS = 200
+REQUESTS_PER_CLIENT = 3
+LATENCY_MS = 5
+POOL = {"pool_size": 10, "max_overflow": 20}
+
+
+def _latency(ms: int) -> int:
+    time.sleep(ms / 1000)
+    return 1
+
+
+def add_latency(sync_engine) -> None:
+    @event.listens_for(sync_engine, "connect")
+    def _register(dbapi_connection, connection_record):
+        dbapi_connection.create_function("latency", 1, _latency)
+
+
+def lookup_query():
+    # WHERE 절에서 latency() 를 한 번 호출해 DB 왕복 한 번을 흉내 냅니다.
+    return select(User).where(User.id == 1, func.latency(LATENCY_MS) == 1)
+
+
+def build_apps(path: str):
+    engine = create_engine(
+        f"sqlite:///{path}", connect_args={"check_same_thread": False}, **POOL
+    )
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}", **POOL)
+    add_latency(engine)
+    add_latency(async_engine.sync_engine)
+
+    SQLModel.metadata.create_all(engine, tables=[User.__table__])
+    with Session(engine) as session:
+        session.add(User(email="bench@example.com", username="bench", hashed_password="x"))
+        session.commit()
+
+    before = FastAPI()
+
+    @before.get("/me")
+    async def read_me_sync():
+        with Session(engine) as session:
+            return {"id": session.exec(lookup_query()).first().id}
+
+    after = FastAPI()
+
+    @after.get("/me")
+    async def read_me_async():
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            return {"id": (await session.exec(lookup_query())).first().id}
+
+    return engine, async_engine, before, after
+
+
+async def probe_loop(stop: asyncio.Event, lags: list) -> None:
+    """10ms 마다 깨어나며 예정보다 늦은 시간을 기록합니다."""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.01)
+        lags.append((time.perf_counter() - started - 0.01) * 1000)
+
+
+async def run(app: FastAPI) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.get("/me")  # 워밍업 (풀 접속, 라우트 준비)
+
+        latencies = []
+
+        async def worker():
+            for _ in range(REQUESTS_PER_CLIENT):
+                started = time.perf_counter()
+                response = await client.get("/me")
+                assert response.status_code == 200, response.text
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        lags: list = []
+        stop = asyncio.Event()
+        probe = asyncio.create_task(probe_loop(stop, lags))
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(CLIENTS)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await probe
+
+    latencies.sort()
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "max": latencies[-1],
+        "lag": max(lags) if lags else elapsed * 1000,
+    }
+
+
+def report(name: str, result: dict) -> None:
+    print(
+        f"{name:<22} | {result['rps']:7.1f} req/s | p50 {result['p50']:8.1f} ms"
+        f" | p95 {result['p95']:8.1f} ms | max {result['max']:8.1f} ms"
+        f" | loop lag max {result['lag']:8.1f} ms"
+    )
+
+
+async def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, async_engine, before, after = build_apps(os.path.join(tmp, "bench.db"))
+        print(
+            f"clients {CLIENTS} x {REQUESTS_PER_CLIENT} requests, "
+            f"simulated DB latency {LATENCY_MS} ms, pool {POOL}"
+        )
+        report("before: sync Session", await run(before))
+        report("after:  AsyncSession", await run(after))
+        await async_engine.dispose()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+"""
+오타 허용(fuzzy) 재료 검색 벤치마크.
+
+BK-tree 조회 시간과 전체 재료와 편집 거리를 모두 계산하는 방식을
+카탈로그 크기(1k/10k/100k)별로 비교합니다.
+staged 는 fuzzy_search 와 같이 큰 트리에서 거리 1 로 먼저 조회하고, 부족할 때만
+FUZZY_MAX_VISITS 한도 안에서 반경을 넓히는 방식입니다 (recall 은 전체 반경 대비 결과 비율).
+
+    python scripts/bench_fuzzy_search.py
+"""
+import random
+import sys
+import time
+
+sys.path.append("src")
+
+from core.search import FUZZY_MAX_VISITS, _BKTree, fuzzy_max_distance  # noqa: E402
+from utils.utils import decompose_jamo, edit_distance  # noqa: E402
+
+SIZES = [1_000, 10_000, 100_000]
+QUERIES = 100
+SEED = 42
+LIMIT = 100
+
+
+def make_names(size: int, rng: random.Random) -> list:
+    # 실제 재료 이름처럼 자주 쓰이는 음절 집합에서 2~4 글자를 조합
+    syllables = [chr(rng.randint(0xAC00, 0xD7A3)) for _ in range(400)]
+    names = set()
+    while len(names) < size:
+        names.add("".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))))
+    return sorted(names)
+
+
+def make_typo(name: str, rng: random.Random) -> str:
+    # 자모 하나를 바꿔 오타를 흉내냄
+    jamo = list(decompose_jamo(name))
+    jamo[rng.randrange(len(jamo))] = rng.choice("ㄱㄴㄷㄹㅁㅂㅅㅇㅈㅏㅓㅗㅜㅡㅣ")
+    return "".join(jamo)
+
+
+def staged_query(tree: _BKTree, query: str) -> set:
+    max_distance = fuzzy_max_distance(query)
+    if max_distance == 1 or tree.size <= FUZZY_MAX_VISITS:
+        return set(tree.query(query, max_distance))
+    found = set(tree.query(query, 1))
+    if len(found) < LIMIT:
+        found.update(tree.query(query, max_distance, FUZZY_MAX_VISITS))
+    return found
+
+
+def bench(size: int) -> None:
+    rng = random.Random(SEED)
+    keys = [decompose_jamo(name) for name in make_names(size, rng)]
+
+    started = time.perf_counter()
+    tree = _BKTree.from_keys(enumerate(keys))
+    build_seconds = time.perf_counter() - started
+
+    queries = [make_typo(rng.choice(keys), rng) for _ in range(QUERIES)]
+
+    started = time.perf_counter()
+    full = [set(tree.query(query, fuzzy_max_distance(query))) for query in queries]
+    bktree_ms = (time.perf_counter() - started) / QUERIES * 1000
+
+    started = time.perf_counter()
+    staged = [staged_query(tree, query) for query in queries]
+    staged_ms = (time.perf_counter() - started) / QUERIES * 1000
+    recall = sum(len(s) for s in staged) / max(1, sum(len(f) for f in full))
+
+    scan_queries = queries[:5]
+    started = time.perf_counter()
+    for query in scan_queries:
+        max_distance = fuzzy_max_distance(query)
+        [key for key in keys if edit_distance(query, key) <= max_distance]
+    scan_ms = (time.perf_counter() - started) / len(scan_queries) * 1000
+
+    print(
+        f"{size:>7} names | build {build_seconds:6.2f}s | "
+        f"bk-tree {bktree_ms:8.2f} ms/query | staged {staged_ms:8.2f} ms/query "
+        f"(recall {recall:.0%}) | full scan {scan_ms:8.2f} ms/query"
+    )
+
+
+if __name__ == "__main__":
+    for size in SIZES:
+        bench(size)
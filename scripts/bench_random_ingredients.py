@@ -0,0 +1,75 @@
+"""
+무작위 재료 조회 벤치마크.
+
+ORDER BY random() LIMIT n, id 구간 기각 추출(sample_rows), 메모리 스냅샷 random.sample 을
+재료 수(10k/100k)별로 비교합니다. 임시 SQLite 파일을 사용하며 id 의 10% 는 삭제된 상태로 만듭니다.
+
+    python scripts/bench_random_ingredients.py
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append("src")
+
+from sqlalchemy import create_engine, delete, func, insert  # noqa: E402
+from sqlmodel import Session, SQLModel, select  # noqa: E402
+
+from core.sampling import sample_rows  # noqa: E402
+from models.common import Category, Ingredient  # noqa: E402
+
+SIZES = [10_000, 100_000]
+LIMIT = 20
+REPEAT = 50
+SEED = 42
+
+
+def seed_db(session: Session, size: int) -> None:
+    session.execute(insert(Category), [{"id": 1, "name": "채소"}])
+    session.execute(
+        insert(Ingredient),
+        [
+            {"id": i, "name": f"재료{i}", "chosung": "ㅈㄹ", "category_id": 1, "color_theme": "BLACK"}
+            for i in range(1, size + 1)
+        ],
+    )
+    # 삭제로 생긴 빈 id 흉내
+    session.execute(delete(Ingredient).where(Ingredient.id % 10 == 0))
+    session.commit()
+
+
+def timed(fn) -> float:
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        fn()
+    return (time.perf_counter() - started) / REPEAT * 1000
+
+
+def bench(size: int) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(engine)
+    rng = random.Random(SEED)
+
+    with Session(engine) as session:
+        seed_db(session, size)
+        snapshot = tuple(session.exec(select(Ingredient).order_by(Ingredient.id)).all())
+
+        order_by_ms = timed(
+            lambda: session.exec(select(Ingredient).order_by(func.random()).limit(LIMIT)).all()
+        )
+        sample_ms = timed(lambda: sample_rows(session, Ingredient, LIMIT, rng))
+        memory_ms = timed(lambda: rng.sample(snapshot, LIMIT))
+
+    print(
+        f"{size:>7} rows | ORDER BY random() {order_by_ms:8.2f} ms"
+        f" | id-range sample {sample_ms:6.2f} ms | in-memory sample {memory_ms:6.3f} ms"
+    )
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    for size in SIZES:
+        bench(size)
@@ -0,0 +1,91 @@
+"""
+재료 목록 응답 직렬화 벤치마크.
+
+FastAPI 기본 경로(response_model 검증 + jsonable_encoder + JSONResponse)와
+encode_as(pydantic-core 로 바로 bytes 인코딩), 인코딩된 bytes 캐시 적중을 비교합니다.
+세 경로의 본문이 같은지도 확인합니다. DB 는 사용하지 않습니다.
+
+    python scripts/bench_response_encoding.py
+"""
+import asyncio
+import sys
+import time
+from typing import List
+
+sys.path.append("src")
+
+from fastapi import Request, Response  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_model_field  # noqa: E402
+
+from core.cache import ResponseCache  # noqa: E402
+from core.serialization import encode_as, encoded_response, orjson  # noqa: E402
+from models.common import NutritionTag  # noqa: E402
+from models.response import IngredientListResponse, IngredientResponse  # noqa: E402
+
+SIZES = [20, 100]
+REPEAT = 200
+ICON_URL = "https://welldone-prod.kr.object.ncloudstorage.com/ingredients/{}-3f1c2a9e-8d7b-4e6f-a5c4-1b2d3e4f5a6b.svg"
+
+
+def make_ingredients(size: int) -> tuple:
+    tags = [NutritionTag(id=i, name=f"영양{i}", description="설명" * 10) for i in range(1, 4)]
+    return tuple(
+        IngredientResponse(
+            id=i,
+            name=f"재료{i}",
+            category_id=1,
+            color_theme="black",
+            icon_url=ICON_URL.format(i),
+            home_icon_url=ICON_URL.format(f"home-{i}"),
+            nutrition_tags=tags,
+        )
+        for i in range(1, size + 1)
+    )
+
+
+def fastapi_body(loop, field, items) -> bytes:
+    content = loop.run_until_complete(serialize_response(field=field, response_content=items))
+    return JSONResponse(content).body
+
+
+def timed(fn) -> float:
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        fn()
+    return (time.perf_counter() - started) / REPEAT * 1000
+
+
+def bench(loop, size: int) -> None:
+    items = make_ingredients(size)
+    field = create_model_field(
+        name="Response", type_=List[IngredientListResponse], mode="serialization"
+    )
+    cache = ResponseCache(max_entries=16, ttl_seconds=300)
+    key = cache.make_key("ingredients", ("list", None, 0, size))
+    cache.set(key, (encode_as(List[IngredientListResponse], items), None))
+
+    # 압축 없이 비교하도록 Accept-Encoding 없는 요청을 사용합니다.
+    request = Request({"type": "http", "headers": []})
+
+    expected = fastapi_body(loop, field, items)
+    assert encode_as(List[IngredientListResponse], items) == expected
+    assert encoded_response(request, Response(), cache.get(key)[0]).body == expected
+
+    response_model_ms = timed(lambda: fastapi_body(loop, field, items))
+    encode_ms = timed(lambda: encode_as(List[IngredientListResponse], items))
+    cached_ms = timed(lambda: encoded_response(request, Response(), cache.get(key)[0]))
+
+    print(
+        f"{size:>4} items ({len(expected):>6} bytes) | response_model {response_model_ms:7.3f} ms"
+        f" | encode_as {encode_ms:6.3f} ms | cached bytes {cached_ms:6.3f} ms"
+    )
+
+
+if __name__ == "__main__":
+    print(f"orjson: {'yes' if orjson is not None else 'no (json fallback)'}")
+    loop = asyncio.new_event_loop()
+    for size in SIZES:
+        bench(loop, size)
+    loop.close()
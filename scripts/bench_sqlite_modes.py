@@ -0,0 +1,135 @@
+"""
+SQLite 기본 설정 vs 튜닝 모드(WAL + 읽기 전용 풀) 혼합 부하 벤치마크.
+
+임시 DB 파일에 피드백 테이블을 만들고, 읽기 스레드(최근 50건 + 건수 조회)와
+쓰기 스레드(피드백 1건 insert + commit)를 동시에 DURATION 초 동안 돌립니다.
+- default: create_engine("sqlite:///...") 그대로 (rollback journal, synchronous=FULL, 한 풀 공유)
+- tuned:   core.sqlite.tune_sqlite 적용 + 읽기는 query_only 읽기 풀 사용 (앱과 같은 구성)
+
+모드별 읽기/쓰기 처리량, p95 지연, 잠금 오류 수를 출력합니다.
+
+    python scripts/bench_sqlite_modes.py
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.append("src")
+
+from sqlalchemy import func  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from sqlmodel import Session, SQLModel, create_engine, select  # noqa: E402
+
+from core.sqlite import sqlite_pragmas, tune_sqlite  # noqa: E402
+from models.common import IngredientRequestFeedback  # noqa: E402
+
+READERS = 8
+WRITERS = 4
+DURATION = 5.0
+POOL = {"pool_size": 10, "max_overflow": 20}
+
+
+def make_engines(path: str, tuned: bool):
+    url = f"sqlite:///{path}"
+    engine = create_engine(url, connect_args={"check_same_thread": False}, **POOL)
+    if not tuned:
+        return engine, engine
+
+    tune_sqlite(engine)
+    read_engine = create_engine(url, connect_args={"check_same_thread": False}, **POOL)
+    tune_sqlite(read_engine, read_only=True)
+    return engine, read_engine
+
+
+def p95(values: list) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[max(int(len(values) * 0.95) - 1, 0)]
+
+
+def run(tuned: bool) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, read_engine = make_engines(os.path.join(tmp, "bench.db"), tuned)
+        SQLModel.metadata.create_all(engine, tables=[IngredientRequestFeedback.__table__])
+        with Session(engine) as session:
+            session.add_all(IngredientRequestFeedback(comment=f"seed {i}") for i in range(1000))
+            session.commit()
+
+        stop = threading.Event()
+        lock = threading.Lock()
+        result = {"reads": [], "writes": [], "errors": 0}
+
+        def reader():
+            latencies = []
+            while not stop.is_set():
+                started = time.perf_counter()
+                try:
+                    with Session(read_engine) as session:
+                        query = select(IngredientRequestFeedback).order_by(
+                            IngredientRequestFeedback.id.desc()
+                        )
+                        session.exec(query.limit(50)).all()
+                        session.exec(select(func.count(IngredientRequestFeedback.id))).one()
+                except OperationalError:
+                    with lock:
+                        result["errors"] += 1
+                    continue
+                latencies.append((time.perf_counter() - started) * 1000)
+            with lock:
+                result["reads"].extend(latencies)
+
+        def writer(n: int):
+            latencies = []
+            i = 0
+            while not stop.is_set():
+                started = time.perf_counter()
+                try:
+                    with Session(engine) as session:
+                        session.add(IngredientRequestFeedback(comment=f"writer {n} #{i}"))
+                        session.commit()
+                except OperationalError:
+                    with lock:
+                        result["errors"] += 1
+                    continue
+                latencies.append((time.perf_counter() - started) * 1000)
+                i += 1
+            with lock:
+                result["writes"].extend(latencies)
+
+        threads = [threading.Thread(target=reader) for _ in range(READERS)]
+        threads += [threading.Thread(target=writer, args=(n,)) for n in range(WRITERS)]
+        for thread in threads:
+            thread.start()
+        time.sleep(DURATION)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        engine.dispose()
+        read_engine.dispose()
+
+    return {
+        "reads_per_sec": len(result["reads"]) / DURATION,
+        "writes_per_sec": len(result["writes"]) / DURATION,
+        "read_p95": p95(result["reads"]),
+        "write_p95": p95(result["writes"]),
+        "errors": result["errors"],
+    }
+
+
+def report(name: str, result: dict) -> None:
+    print(
+        f"{name:<8} | reads {result['reads_per_sec']:8.1f}/s (p95 {result['read_p95']:7.1f} ms)"
+        f" | writes {result['writes_per_sec']:7.1f}/s (p95 {result['write_p95']:7.1f} ms)"
+        f" | lock errors {result['errors']}"
+    )
+
+
+if __name__ == "__main__":
+    print(f"readers {READERS}, writers {WRITERS}, {DURATION:.0f}s per mode")
+    print("tuned pragmas: " + "; ".join(sqlite_pragmas()))
+    report("default", run(tuned=False))
+    report("tuned", run(tuned=True))
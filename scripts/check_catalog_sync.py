@@ -0,0 +1,89 @@
+"""
+다른 워커의 쓰기가 이 워커의 조리 설정 조회 표에 반영되는지 확인합니다.
+
+    python scripts/check_catalog_sync.py
+
+1. 다른 워커처럼 조리 설정을 추가하고 버전을 올립니다 (이 워커의 상태는 건드리지 않음).
+2. 이 워커에서 쓰기를 한 것처럼 버전을 올리고 catalog.refresh 를 호출합니다.
+3. 주기 동기화(catalog.sync)를 한 번 실행한 뒤
+   GET /cooking-settings/?ingredient_id=..&cooking_tool_id=.. 가 200 인지,
+   이 워커의 버전(ETag)이 DB 버전과 같은지 확인합니다.
+refresh 가 다른 워커의 쓰기를 섞어 읽고도 리스너를 실행하지 않으면 조회 표가 갱신되지 않아 404 가 되고,
+버전을 올리지 않으면 새 데이터가 이전 ETag 로 나갑니다.
+설정된 DB 에 조리 설정을 하나 추가했다가 마지막에 지웁니다. 실패하면 exit 1 입니다.
+"""
+import os
+import sys
+
+os.environ.update(
+    CATALOG_SNAPSHOT_ENABLED="true",
+    SEARCH_INDEX_ENABLED="false",
+    CATALOG_SYNC_INTERVAL_SECONDS="0",
+    ENVIRONMENT="local",
+)
+sys.path.append("src")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlmodel import Session, select  # noqa: E402
+
+from core.catalog import bump_catalog_version, catalog, load_catalog_versions  # noqa: E402
+from core.config import settings  # noqa: E402
+from core.database import engine  # noqa: E402
+from main import app  # noqa: E402
+from models.common import CookingSetting, CookingTool, Ingredient  # noqa: E402
+
+
+def free_pair(session: Session):
+    """조리 설정이 없는 (재료 id, 조리도구 id) 조합을 찾습니다."""
+    used = set(session.exec(select(CookingSetting.ingredient_id, CookingSetting.cooking_tool_id)).all())
+    tool_ids = session.exec(select(CookingTool.id).order_by(CookingTool.id)).all()
+    for ingredient_id in session.exec(select(Ingredient.id).order_by(Ingredient.id)).all():
+        for tool_id in tool_ids:
+            if (ingredient_id, tool_id) not in used:
+                return ingredient_id, tool_id
+    return None
+
+
+if __name__ == "__main__":
+    with TestClient(app) as client, Session(engine) as session:
+        pair = free_pair(session)
+        if pair is None:
+            print("skip: no ingredient/cooking tool pair without a cooking setting")
+            sys.exit(0)
+        ingredient_id, cooking_tool_id = pair
+        path = f"{settings.API_V1_STR}/cooking-settings/"
+        params = {"ingredient_id": ingredient_id, "cooking_tool_id": cooking_tool_id}
+
+        # 1. 다른 워커의 쓰기
+        with Session(engine) as other:
+            setting = CookingSetting(
+                ingredient_id=ingredient_id, cooking_tool_id=cooking_tool_id, cooking_time=60
+            )
+            other.add(setting)
+            bump_catalog_version(other, "cooking_settings")
+            other.commit()
+            setting_id = setting.id
+
+        try:
+            # 2. 이 워커의 쓰기 (다음 sync 보다 먼저 refresh)
+            bump_catalog_version(session, "cooking_settings")
+            session.commit()
+            catalog.refresh(session, "cooking_settings")
+
+            # 3. 주기 동기화
+            changed = catalog.sync(session)
+            status = client.get(path, params=params).status_code
+            seen = catalog.versions.get("cooking_settings")
+            latest = load_catalog_versions(session).get("cooking_settings")
+            ok = status == 200 and seen == latest
+            print(f"sync changed: {', '.join(changed) or '-'}")
+            print(f"{'ok' if status == 200 else 'FAIL'} {status} GET {path} {params}")
+            print(f"{'ok' if seen == latest else 'FAIL'} version seen={seen} db={latest}")
+        finally:
+            with Session(engine) as other:
+                other.delete(other.get(CookingSetting, setting_id))
+                bump_catalog_version(other, "cooking_settings")
+                other.commit()
+            catalog.sync(session)
+
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,102 @@
+"""
+공개 엔드포인트가 선언한 쿼리 예산(@query_budget)을 넘지 않는지 확인합니다.
+
+    python scripts/check_query_budgets.py
+
+스냅샷/검색 색인/응답 캐시를 끄고 DB 로 처리하는 최악의 경우를 요청해
+X-Query-Count 헤더를 예산과 비교하며, 넘는 엔드포인트가 있으면 실패(exit 1)합니다.
+설정된 DB 에 GET 요청만 보냅니다.
+"""
+import os
+import sys
+
+os.environ.update(
+    CATALOG_SNAPSHOT_ENABLED="false",
+    SEARCH_INDEX_ENABLED="false",
+    RESPONSE_CACHE_MAX_ENTRIES="0",
+    CATALOG_SYNC_INTERVAL_SECONDS="0",
+    ENVIRONMENT="local",
+)
+sys.path.append("src")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlmodel import Session, select  # noqa: E402
+
+from core.config import settings  # noqa: E402
+from core.database import engine  # noqa: E402
+from core.query_budget import QUERY_COUNT_HEADER  # noqa: E402
+from main import app  # noqa: E402
+from models.common import (  # noqa: E402
+    Category,
+    CookingSetting,
+    CookingSettingTip,
+    CookingTool,
+    Ingredient,
+    Timer,
+)
+
+
+def sample_requests(session: Session) -> list:
+    ingredient = session.exec(select(Ingredient).limit(1)).first()
+    category = session.exec(select(Category).limit(1)).first()
+    tool = session.exec(select(CookingTool).limit(1)).first()
+    setting = session.exec(select(CookingSetting).limit(1)).first()
+    tip = session.exec(select(CookingSettingTip).limit(1)).first()
+    timer = session.exec(select(Timer).limit(1)).first()
+
+    api = settings.API_V1_STR
+    requests = [
+        (f"{api}/categories/", {}),
+        (f"{api}/cooking-tools/", {}),
+        (f"{api}/ingredients/", {}),
+        (f"{api}/ingredients/", {"is_random": True, "limit": 10}),
+        (f"{api}/catalog/export", {}),
+        (f"{api}/catalog/export", {"since": 0}),
+    ]
+    if ingredient:
+        requests += [
+            (f"{api}/ingredients/{ingredient.id}", {}),
+            (f"{api}/ingredients/{ingredient.id}/tags", {}),
+            (f"{api}/ingredients/search", {"keyword": ingredient.name[:1]}),
+            (f"{api}/ingredients/autocomplete", {"keyword": ingredient.name[:1]}),
+        ]
+    if category:
+        requests.append((f"{api}/categories/{category.id}", {}))
+    if tool:
+        requests.append((f"{api}/cooking-tools/{tool.id}", {}))
+    if setting:
+        requests += [
+            (
+                f"{api}/cooking-settings/",
+                {"ingredient_id": setting.ingredient_id, "cooking_tool_id": setting.cooking_tool_id},
+            ),
+            (f"{api}/cooking-settings/{setting.id}/tips", {}),
+        ]
+    if tip:
+        requests.append((f"{api}/cooking-settings/{tip.cooking_setting_id}/tips/{tip.id}", {}))
+    if timer:
+        requests.append((f"{api}/timers/{timer.id}", {}))
+    return requests
+
+
+if __name__ == "__main__":
+    failed = False
+
+    with TestClient(app) as client, Session(engine) as session:
+        for path, params in sample_requests(session):
+            response = client.get(path, params=params)
+            count = int(response.headers.get(QUERY_COUNT_HEADER, -1))
+
+            budget = None
+            for candidate in app.routes:
+                match, _ = candidate.matches({"type": "http", "path": path, "method": "GET"})
+                if match.name == "FULL":
+                    budget = getattr(candidate.endpoint, "__query_budget__", None)
+                    break
+
+            over = budget is not None and count > budget
+            failed = failed or over or response.status_code >= 500
+            status = "OVER" if over else "ok"
+            print(f"{status:4} {count:>2}/{budget} {response.status_code} GET {path} {params or ''}")
+
+    sys.exit(1 if failed else 0)
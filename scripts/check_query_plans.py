@@ -0,0 +1,161 @@
+"""
+자주 호출되는 엔드포인트 쿼리가 외래 키 색인을 사용하는지 SQLite 실행 계획으로 확인합니다.
+
+    python scripts/check_query_plans.py [--ingredients 2000]
+
+메모리 SQLite DB 에 모델 기준으로 테이블/색인을 만들고 데이터를 채운 뒤 ANALYZE 하고,
+각 쿼리의 EXPLAIN QUERY PLAN 에 기대한 색인이 없으면 실패(exit 1)합니다.
+"""
+import argparse
+import random
+import sys
+
+sys.path.append("src")
+
+from sqlalchemy import create_engine, func, insert, text  # noqa: E402
+from sqlmodel import Session, SQLModel, select  # noqa: E402
+
+from models.common import (  # noqa: E402
+    Category,
+    CookingSetting,
+    CookingSettingTip,
+    CookingTool,
+    Ingredient,
+    IngredientNutritionLink,
+    NutritionTag,
+    Timer,
+    TimerFeedback,
+)
+from models.user import User  # noqa: E402, F401  (users 테이블 생성용)
+
+TOOLS = 3
+TAGS = 24
+TIPS_PER_SETTING = 3
+TIMERS_PER_SETTING = 5
+
+
+def seed(session: Session, ingredients: int) -> None:
+    rng = random.Random(0)
+    session.execute(insert(Category), [{"id": 1, "name": "채소"}])
+    session.execute(insert(CookingTool), [{"id": i, "name": f"도구{i}"} for i in range(1, TOOLS + 1)])
+    session.execute(insert(NutritionTag), [{"id": i, "name": f"태그{i}"} for i in range(1, TAGS + 1)])
+    session.execute(
+        insert(Ingredient),
+        [
+            {"id": i, "name": f"재료{i}", "chosung": "ㅈㄹ", "category_id": 1, "color_theme": "BLACK"}
+            for i in range(1, ingredients + 1)
+        ],
+    )
+    session.execute(
+        insert(IngredientNutritionLink),
+        [
+            {"ingredient_id": i, "nutrition_tag_id": tag_id}
+            for i in range(1, ingredients + 1)
+            for tag_id in rng.sample(range(1, TAGS + 1), 3)
+        ],
+    )
+
+    settings = [
+        {"ingredient_id": i, "cooking_tool_id": tool_id, "temperature": 100, "cooking_time": 60}
+        for i in range(1, ingredients + 1)
+        for tool_id in range(1, TOOLS + 1)
+    ]
+    session.execute(insert(CookingSetting), settings)
+    setting_count = len(settings)
+    session.execute(
+        insert(CookingSettingTip),
+        [
+            {"cooking_setting_id": s, "tip_type": "COOKING", "message": "팁"}
+            for s in range(1, setting_count + 1)
+            for _ in range(TIPS_PER_SETTING)
+        ],
+    )
+    session.execute(
+        insert(Timer),
+        [
+            {"cooking_setting_id": rng.randint(1, setting_count)}
+            for _ in range(setting_count * TIMERS_PER_SETTING)
+        ],
+    )
+    timer_count = setting_count * TIMERS_PER_SETTING
+    session.execute(
+        insert(TimerFeedback),
+        [
+            {"timer_id": rng.randint(1, timer_count), "timer_feedback_type": "PERFECT"}
+            for _ in range(timer_count // 2)
+        ],
+    )
+    session.commit()
+    session.exec(text("ANALYZE"))
+
+
+def hot_queries():
+    """
+    (설명, 쿼리, 사용해야 하는 색인) 목록. 엔드포인트에서 쓰는 조건과 같게 유지합니다.
+    """
+    return [
+        (
+            "GET /cooking-settings (ingredient, tool)",
+            select(CookingSetting)
+            .where(CookingSetting.ingredient_id == 7)
+            .where(CookingSetting.cooking_tool_id == 2),
+            "ix_cooking_settings_ingredient_id_cooking_tool_id",
+        ),
+        (
+            "GET /ingredients/{id} available_cooking_tools",
+            select(CookingTool)
+            .join(CookingSetting, CookingTool.id == CookingSetting.cooking_tool_id)
+            .where(CookingSetting.ingredient_id == 7)
+            .distinct()
+            .order_by(CookingTool.id),
+            "ix_cooking_settings_ingredient_id_cooking_tool_id",
+        ),
+        (
+            "GET /cooking-settings/{id}/tips",
+            select(CookingSettingTip).where(CookingSettingTip.cooking_setting_id == 7),
+            "ix_cooking_setting_tips_cooking_setting_id",
+        ),
+        (
+            "timers by cooking setting",
+            select(Timer).where(Timer.cooking_setting_id == 7),
+            "ix_timers_cooking_setting_id",
+        ),
+        (
+            "feedbacks by timer",
+            select(TimerFeedback).where(TimerFeedback.timer_id == 7),
+            "ix_timer_feedbacks_timer_id",
+        ),
+        (
+            "ingredients by nutrition tag",
+            select(func.count())
+            .select_from(IngredientNutritionLink)
+            .where(IngredientNutritionLink.nutrition_tag_id == 7),
+            "ix_ingredient_nutrition_links_nutrition_tag_id",
+        ),
+    ]
+
+
+def explain(session: Session, query) -> str:
+    compiled = query.compile(session.get_bind(), compile_kwargs={"literal_binds": True})
+    rows = session.exec(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    return "\n".join(str(row[-1]) for row in rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ingredients", type=int, default=2000)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    failed = False
+
+    with Session(engine) as session:
+        seed(session, args.ingredients)
+        for name, query, index_name in hot_queries():
+            plan = explain(session, query)
+            ok = index_name in plan
+            print(f"-- {name}: {'ok' if ok else 'MISSING ' + index_name}\n{plan}\n")
+            failed = failed or not ok
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,56 @@
+"""
+재료 검색 쿼리의 실행 계획을 확인합니다.
+
+    python scripts/explain_ingredient_search.py [keyword ...]
+
+Postgres 에서는 pg_trgm GIN 색인(ix_ingredients_*_trgm)을 사용하지 않으면 실패(exit 1)합니다.
+테이블이 작으면 플래너가 순차 스캔을 고르므로 enable_seqscan 을 끄고 확인합니다.
+SQLite 에는 trigram 색인이 없으므로 실행 계획만 출력합니다.
+"""
+import sys
+
+sys.path.append("src")
+
+from sqlalchemy import text  # noqa: E402
+from sqlmodel import Session, select  # noqa: E402
+
+from core.database import engine  # noqa: E402
+from core.search import db_contains  # noqa: E402
+from models.common import Ingredient  # noqa: E402
+from utils.utils import is_chosung  # noqa: E402
+
+DEFAULT_KEYWORDS = ["고구마", "ㄱㄱㅁ"]
+
+
+def explain(session: Session, keyword: str) -> str:
+    dialect_name = engine.dialect.name
+    column = Ingredient.chosung if is_chosung(keyword) else Ingredient.name
+    query = select(Ingredient).where(db_contains(column, keyword, dialect_name))
+
+    if dialect_name == "postgresql":
+        compiled = query.compile(engine)
+        session.exec(text("SET LOCAL enable_seqscan = off"))
+        rows = session.connection().exec_driver_sql(
+            f"EXPLAIN {compiled}", compiled.params
+        )
+        return "\n".join(row[0] for row in rows)
+
+    compiled = query.compile(engine, compile_kwargs={"literal_binds": True})
+    rows = session.exec(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    return "\n".join(str(row[-1]) for row in rows)
+
+
+if __name__ == "__main__":
+    keywords = sys.argv[1:] or DEFAULT_KEYWORDS
+    failed = False
+
+    with Session(engine) as session:
+        for keyword in keywords:
+            plan = explain(session, keyword)
+            print(f"-- {keyword}\n{plan}\n")
+            if engine.dialect.name == "postgresql" and "_trgm" not in plan:
+                print(f"Trigram index not used for {keyword!r}")
+                failed = True
+        session.rollback()
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,30 @@
+"""
+배포 시 DB 스키마를 최신으로 맞춥니다.
+
+    python scripts/migrate.py
+
+새 DB 면 모델 기준으로 테이블을 먼저 만든 뒤(init_db 와 같은 create_all) alembic upgrade head 를 실행합니다.
+마이그레이션은 이미 있는 테이블/컬럼/색인을 건너뛰므로 기존 DB 와 새 DB 모두에 안전합니다.
+Elastic Beanstalk 에서는 .ebextensions 의 container_commands 로 새 코드를 띄우기 전에
+leader 인스턴스 한 곳에서만 실행합니다.
+"""
+import os
+import sys
+
+sys.path.append("src")
+
+from alembic import command  # noqa: E402
+from alembic.config import Config  # noqa: E402
+from sqlmodel import SQLModel  # noqa: E402
+
+from core.database import engine  # noqa: E402
+import models.common  # noqa: E402,F401 (메타데이터 등록)
+import models.user  # noqa: E402,F401
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "alembic.ini")
+
+
+if __name__ == "__main__":
+    SQLModel.metadata.create_all(engine)
+    command.upgrade(Config(ALEMBIC_INI), "head")
+    print("Database migrated to head")
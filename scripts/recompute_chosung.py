@@ -0,0 +1,71 @@
+"""
+모든 재료의 초성(chosung) 컬럼을 이름 기준으로 다시 계산합니다.
+
+    python scripts/recompute_chosung.py [--chunk-size 5000] [--dry-run]
+
+id 순으로 chunk 단위로 읽어 값이 달라진 행만 executemany UPDATE 로 갱신합니다.
+갱신한 chunk 마다 같은 트랜잭션에서 재료 카탈로그 버전을 올리므로 실행 중인 워커도 다음 sync 에서 반영합니다.
+"""
+import argparse
+import sys
+import time
+from datetime import datetime
+
+sys.path.append("src")
+
+from sqlalchemy import update  # noqa: E402
+from sqlmodel import Session, select  # noqa: E402
+
+from core.catalog import bump_catalog_version  # noqa: E402
+from core.database import engine  # noqa: E402
+from core.export import next_export_version  # noqa: E402
+from models.common import Ingredient  # noqa: E402
+from utils.utils import get_chosung_batch  # noqa: E402
+
+
+def recompute_chosung(chunk_size: int, dry_run: bool = False) -> int:
+    updated = 0
+    last_id = 0
+
+    with Session(engine) as session:
+        while True:
+            rows = session.exec(
+                select(Ingredient.id, Ingredient.name, Ingredient.chosung)
+                .where(Ingredient.id > last_id)
+                .order_by(Ingredient.id)
+                .limit(chunk_size)
+            ).all()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+
+            chosungs = get_chosung_batch(name for _, name, _ in rows)
+            changes = [
+                {"id": ingredient_id, "chosung": chosung}
+                for (ingredient_id, _, old_chosung), chosung in zip(rows, chosungs)
+                if chosung != old_chosung
+            ]
+            if changes and not dry_run:
+                # bulk UPDATE 는 flush 이벤트를 거치지 않으므로 오프라인 동기화 버전을 직접 기록합니다.
+                version, now = next_export_version(session), datetime.utcnow()
+                for change in changes:
+                    change.update(sync_version=version, updated_at=now)
+                session.execute(update(Ingredient), changes)
+                bump_catalog_version(session, "ingredients")
+                session.commit()
+            updated += len(changes)
+
+    return updated
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recompute ingredient chosung")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    count = recompute_chosung(args.chunk_size, dry_run=args.dry_run)
+    elapsed = time.perf_counter() - started
+    action = "would update" if args.dry_run else "updated"
+    print(f"Chosung {action} for {count} ingredients in {elapsed:.2f}s")
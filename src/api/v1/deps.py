@@ -1,13 +1,17 @@
 from datetime import datetime, timedelta
-from typing import Generator
+from typing import AsyncGenerator, Callable, Generator, Optional
 
 import jwt
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from core.catalog import catalog
+from core.compression import strip_encoding_etag
 from core.config import settings
-from core.database import engine
+from core.database import async_engine, engine
+from core.read_routing import read_router
 from models.user import User, UserRole
 
 
@@ -16,6 +20,23 @@ def get_session() -> Generator[Session, None, None]:
         yield session
 
 
+def get_read_session(request: Request) -> Generator[Session, None, None]:
+    """
+    읽기 전용 엔드포인트용 세션. 복제본이 있으면 core.read_routing 이 복제본/primary 중 하나를 고르고,
+    SQLite 튜닝 모드에서는 쓰기와 분리된 읽기 전용(query_only) 풀을 사용합니다.
+    """
+    with Session(read_router.engine_for(request)) as session:
+        yield session
+
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    async def 엔드포인트용 세션. commit 뒤 속성 접근이 지연 로딩(I/O)을 일으키지 않도록 만료시키지 않습니다.
+    """
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=settings.API_V1_STR + "/auth/login")
@@ -32,7 +53,7 @@ def create_access_token(data: dict) -> str:
 
 
 async def get_current_user(
-    token: str = Depends(oauth2_scheme), session: Session = Depends(get_session)
+    token: str = Depends(oauth2_scheme), session: AsyncSession = Depends(get_async_session)
 ) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -49,7 +70,7 @@ async def get_current_user(
     except jwt.PyJWTError:
         raise credentials_exception
 
-    user = session.exec(select(User).where(User.email == email)).first()
+    user = (await session.exec(select(User).where(User.email == email))).first()
     if user is None:
         raise credentials_exception
     return user
@@ -64,3 +85,40 @@ async def get_current_superuser(
             detail="The user doesn't have enough privileges",
         )
     return current_user
+
+
+def _matching_etag(if_none_match: str, etag: str) -> Optional[str]:
+    """If-None-Match 에서 etag 와 같은 태그를 찾아 그대로 반환합니다 (없으면 None)."""
+    if if_none_match.strip() == "*":
+        return etag
+    # If-None-Match 는 약한 비교를 사용하고, 압축본 ETag 의 인코딩 접미사는 무시합니다.
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if strip_encoding_etag(tag.removeprefix("W/")) == etag:
+            return tag
+    return None
+
+
+def check_not_modified(request: Request, response: Response, *entities: str) -> None:
+    """
+    참조 데이터 버전으로 ETag 를 붙이고, If-None-Match 가 같으면 304 로 응답합니다.
+    DB 조회나 본문 직렬화 전에 호출해야 합니다.
+    """
+    etag = catalog.etag(*entities)
+    headers = {"ETag": etag, "Cache-Control": settings.CATALOG_CACHE_CONTROL}
+
+    if_none_match = request.headers.get("if-none-match")
+    matched = _matching_etag(if_none_match, etag) if if_none_match else None
+    if matched is not None:
+        # 304 에는 클라이언트가 가진 표현(압축본이면 접미사 포함)의 ETag 를 돌려줍니다.
+        raise HTTPException(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={**headers, "ETag": matched}
+        )
+    response.headers.update(headers)
+
+
+def conditional_get(*entities: str) -> Callable[[Request, Response], None]:
+    def dependency(request: Request, response: Response) -> None:
+        check_not_modified(request, response, *entities)
+
+    return dependency
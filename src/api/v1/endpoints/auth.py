@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from starlette import status
 
-from api.v1.deps import get_session, create_access_token
+from api.v1.deps import get_async_session, create_access_token
 from models.user import User
 
 router = APIRouter()
@@ -12,11 +14,12 @@ router = APIRouter()
 @router.post("/login")
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ) -> dict:
-    user = session.exec(select(User).where(User.email == form_data.username)).first()
+    user = (await session.exec(select(User).where(User.email == form_data.username))).first()
 
-    if not user or not user.verify_password(form_data.password):
+    # bcrypt 검증은 CPU 작업이라 이벤트 루프를 막지 않도록 스레드풀에서 실행합니다.
+    if not user or not await run_in_threadpool(user.verify_password, form_data.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
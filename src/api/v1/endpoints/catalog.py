@@ -0,0 +1,45 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlmodel import Session
+
+from api.v1.deps import get_read_session
+from core.compression import CompressedBody
+from core.export import build_export, full_export_cache, load_export_version
+from core.query_budget import query_budget
+from core.serialization import dumps, encoded_response
+
+router = APIRouter()
+
+
+@router.get("/export")
+@query_budget(9)
+def export_catalog(
+        *,
+        request: Request,
+        response: Response,
+        session: Session = Depends(get_read_session),
+        since: Optional[int] = Query(default=None, ge=0),
+):
+    """
+    오프라인용 참조 데이터 내보내기 (카테고리/조리도구/영양 태그/재료/조리 설정/팁)
+
+    - since 없이 호출하면 전체를, since=<version> 이면 그 이후 바뀐 행과 삭제된 id 만 돌려줍니다.
+    - 응답의 version 을 다음 호출의 since 로 넘기면 됩니다.
+    - since 가 서버 버전보다 크면 (DB 초기화 등) 전체를 다시 내려주며 full=true 입니다.
+    - 전체 내보내기는 버전별로 압축본까지 캐시합니다.
+    """
+    response.headers["Cache-Control"] = "no-cache"
+
+    version = load_export_version(session)
+    if since is not None and since > version:
+        since = None
+
+    if since is not None:
+        return encoded_response(request, response, dumps(build_export(session, version, since)))
+
+    body = full_export_cache.get(version)
+    if body is None:
+        body = CompressedBody(dumps(build_export(session, version)))
+        full_export_cache.set(version, body)
+    return encoded_response(request, response, body)
@@ -1,10 +1,30 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Query, Depends, UploadFile, File
+from fastapi import APIRouter, HTTPException, Query, Depends, UploadFile, File, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from sqlmodel import select, Session
-
-from api.v1.deps import get_session, get_current_superuser
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from api.v1.deps import (
+    conditional_get,
+    get_async_session,
+    get_current_superuser,
+    get_read_session,
+    get_session,
+)
+from api.v1.pagination import (
+    decode_cursor,
+    next_page_after,
+    paginate,
+    set_next_link_after,
+    slice_page,
+)
+from core.cache import MISSING, response_cache
+from core.catalog import bump_catalog_version, catalog
+from core.compression import CompressedBody
+from core.query_budget import query_budget
 from core.s3 import object_storage
+from core.serialization import encode_as, encoded_response
 from models.common import Category
 from models.response import CategoryResponse
 from models.user import User
@@ -20,25 +40,61 @@ def create_category(
         current_user: User = Depends(get_current_superuser),
 ):
     session.add(category)
+    bump_catalog_version(session, "categories")
     session.commit()
+    catalog.refresh(session, "categories")
     session.refresh(category)
     return category
 
 
-@router.get("/", response_model=List[CategoryResponse])
+@router.get(
+    "/",
+    response_model=List[CategoryResponse],
+    dependencies=[Depends(conditional_get("categories"))],
+)
+@query_budget(1)
 def read_categories(
         *,
-        session: Session = Depends(get_session),
+        request: Request,
+        response: Response,
+        session: Session = Depends(get_read_session),
         offset: int = 0,
+        after: Optional[str] = None,
         limit: int = Query(default=100, lte=100),
 ):
-    categories = session.exec(select(Category).offset(offset).limit(limit)).all()
-    return categories
-
-
-@router.get("/{category_id}", response_model=CategoryResponse)
-def read_category(*, session: Session = Depends(get_session), category_id: int):
-    category = session.get(Category, category_id)
+    after_id = decode_cursor(after)
+
+    # 인코딩된 본문(과 압축본)을 캐시하므로 같은 버전에서는 검증/직렬화/압축을 다시 하지 않습니다.
+    cache_key = response_cache.make_key("categories", ("list", after_id, offset, limit))
+    cached = response_cache.get(cache_key)
+    if cached is MISSING:
+        snapshot = catalog.current
+        if snapshot is not None:
+            page = slice_page(snapshot.categories, after_id, offset, limit)
+        else:
+            query = paginate(select(Category), Category, after_id, offset, limit)
+            page = session.exec(query).all()
+        body = CompressedBody(encode_as(List[CategoryResponse], page))
+        cached = (body, next_page_after(page, limit))
+        response_cache.set(cache_key, cached)
+
+    body, next_after = cached
+    set_next_link_after(request, response, next_after)
+    return encoded_response(request, response, body)
+
+
+@router.get(
+    "/{category_id}",
+    response_model=CategoryResponse,
+    dependencies=[Depends(conditional_get("categories"))],
+)
+@query_budget(1)
+def read_category(*, session: Session = Depends(get_read_session), category_id: int):
+    snapshot = catalog.current
+    if snapshot is not None:
+        category = snapshot.categories_by_id.get(category_id)
+    else:
+        category = session.get(Category, category_id)
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
     return category
@@ -61,7 +117,9 @@ def update_category(
         setattr(db_category, key, value)
 
     session.add(db_category)
+    bump_catalog_version(session, "categories")
     session.commit()
+    catalog.refresh(session, "categories")
     session.refresh(db_category)
     return db_category
 
@@ -78,27 +136,29 @@ def delete_category(
         raise HTTPException(status_code=404, detail="Category not found")
 
     session.delete(category)
+    bump_catalog_version(session, "categories")
     session.commit()
+    catalog.refresh(session, "categories")
     return {"ok": True}
 
 
 @router.post("/{category_id}/icon")
 async def upload_category_icon(
         *,
-        session: Session = Depends(get_session),
+        session: AsyncSession = Depends(get_async_session),
         category_id: int,
         file: UploadFile = File(...),
         current_user: User = Depends(get_current_superuser),
 ):
     """카테고리 아이콘 SVG 업로드"""
-    category = session.get(Category, category_id)
+    category = await session.get(Category, category_id)
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
 
     # 기존 이미지가 있다면 삭제
     if category.icon_url:
         key = category.icon_url.split('/')[-1]
-        object_storage.delete_image(key)
+        await run_in_threadpool(object_storage.delete_image, key)
 
     # 새 이미지 업로드
     result = await object_storage.upload_image(file, folder="categories")
@@ -108,8 +168,10 @@ async def upload_category_icon(
     # DB 업데이트
     category.icon_url = result["url"]
     session.add(category)
-    session.commit()
-    session.refresh(category)
+    await session.run_sync(bump_catalog_version, "categories")
+    await session.commit()
+    await catalog.refresh_async("categories")
+    await session.refresh(category)
 
     return {"icon_url": category.icon_url}
 
@@ -117,12 +179,12 @@ async def upload_category_icon(
 @router.delete("/{category_id}/icon")
 async def delete_category_icon(
         *,
-        session: Session = Depends(get_session),
+        session: AsyncSession = Depends(get_async_session),
         category_id: int,
         current_user: User = Depends(get_current_superuser),
 ):
     """카테고리 아이콘 삭제"""
-    category = session.get(Category, category_id)
+    category = await session.get(Category, category_id)
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
 
@@ -131,10 +193,12 @@ async def delete_category_icon(
 
     # Object Storage에서 이미지 삭제
     key = category.icon_url.split('/')[-1]
-    if object_storage.delete_image(key):
+    if await run_in_threadpool(object_storage.delete_image, key):
         category.icon_url = None
         session.add(category)
-        session.commit()
+        await session.run_sync(bump_catalog_version, "categories")
+        await session.commit()
+        await catalog.refresh_async("categories")
         return {"message": "Icon deleted successfully"}
 
     raise HTTPException(status_code=500, detail="Failed to delete icon")
@@ -1,11 +1,16 @@
 from typing import List
 
-from fastapi import APIRouter, Query, HTTPException, Depends
-from sqlalchemy.orm import selectinload
+from fastapi import APIRouter, Query, HTTPException, Depends, Request, Response
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy import tuple_
 from sqlmodel import select, Session
 
-from api.v1.deps import get_session, get_current_superuser
+from api.v1.deps import get_read_session, get_session, get_current_superuser
+from core.catalog import bump_catalog_version, catalog, cooking_setting_lookup, render_cooking_setting
+from core.query_budget import query_budget
+from core.serialization import dumps, encoded_response
 from models.common import CookingSetting, CookingSettingTip
+from models.response import CookingSettingBatchItem, CookingSettingBatchRequest
 from models.user import User
 
 router = APIRouter()
@@ -19,15 +24,23 @@ def create_cooking_setting(
         current_user: User = Depends(get_current_superuser)
 ):
     session.add(cooking_setting)
+    bump_catalog_version(session, "cooking_settings")
     session.commit()
+    catalog.refresh(session, "cooking_settings")
     session.refresh(cooking_setting)
+    cooking_setting_lookup.rebuild(
+        session, (cooking_setting.ingredient_id, cooking_setting.cooking_tool_id)
+    )
     return cooking_setting
 
 
 @router.get("/")
+@query_budget(2)
 def read_cooking_settings_with_tips(
         *,
-        session: Session = Depends(get_session),
+        request: Request,
+        response: Response,
+        session: Session = Depends(get_read_session),
         ingredient_id: int,
         cooking_tool_id: int,
 ):
@@ -35,11 +48,18 @@ def read_cooking_settings_with_tips(
     조리 설정과 관련된 팁을 함께 조회합니다.
     선택적으로 재료, 조리방법, 조리도구, 가열방법으로 필터링할 수 있습니다.
     """
+    if cooking_setting_lookup.is_ready():
+        payload = cooking_setting_lookup.get(ingredient_id, cooking_tool_id)
+        if payload is None:
+            raise HTTPException(status_code=404, detail="Cooking setting not found")
+        return encoded_response(request, response, dumps(payload))
+
     # 동적으로 where 절 구성
     query = (
         select(CookingSetting)
         .options(
-            selectinload(CookingSetting.tips)
+            selectinload(CookingSetting.tips),
+            joinedload(CookingSetting.ingredient),
         )
         .where(CookingSetting.ingredient_id == ingredient_id)
         .where(CookingSetting.cooking_tool_id == cooking_tool_id)
@@ -51,15 +71,56 @@ def read_cooking_settings_with_tips(
         raise HTTPException(status_code=404, detail="Cooking setting not found")
 
     # 응답 포맷 조정
-    setting_dict = {
-        "id": setting.id,
-        "temperature": setting.temperature,
-        "cooking_time": setting.cooking_time,
-        "color_theme": setting.ingredient.color_theme,
-        "tips": [{"tip_type": tip.tip_type, "message": tip.message} for tip in setting.tips] if setting.tips else []
-    }
+    payload = render_cooking_setting(setting, setting.ingredient.color_theme, setting.tips)
+    return encoded_response(request, response, dumps(payload))
+
 
-    return setting_dict
+@router.post("/batch", response_model=List[CookingSettingBatchItem])
+@query_budget(2)
+def read_cooking_settings_batch(
+        *,
+        session: Session = Depends(get_read_session),
+        batch: CookingSettingBatchRequest,
+):
+    """
+    (재료, 조리도구) 조합 여러 개의 조리 설정과 팁을 한 번에 조회합니다.
+    요청한 순서(중복 포함)대로 돌려주며, 없는 조합은 found=false 로 표시합니다.
+    """
+    keys = [(pair.ingredient_id, pair.cooking_tool_id) for pair in batch.pairs]
+
+    if cooking_setting_lookup.is_ready():
+        payloads = {key: cooking_setting_lookup.get(*key) for key in set(keys)}
+    else:
+        settings = session.exec(
+            select(CookingSetting)
+            .options(
+                selectinload(CookingSetting.tips),
+                joinedload(CookingSetting.ingredient),
+            )
+            .where(
+                tuple_(CookingSetting.ingredient_id, CookingSetting.cooking_tool_id).in_(set(keys))
+            )
+            .order_by(CookingSetting.id)
+        ).all()
+
+        payloads = {}
+        for setting in settings:
+            # 같은 조합이 여러 개면 가장 먼저 만든 설정을 사용
+            key = (setting.ingredient_id, setting.cooking_tool_id)
+            if key not in payloads:
+                payloads[key] = render_cooking_setting(
+                    setting, setting.ingredient.color_theme, setting.tips
+                )
+
+    return [
+        CookingSettingBatchItem(
+            ingredient_id=ingredient_id,
+            cooking_tool_id=cooking_tool_id,
+            found=payloads.get((ingredient_id, cooking_tool_id)) is not None,
+            cooking_setting=payloads.get((ingredient_id, cooking_tool_id)),
+        )
+        for ingredient_id, cooking_tool_id in keys
+    ]
 
 
 @router.patch("/{cooking_setting_id}", response_model=CookingSetting)
@@ -73,14 +134,20 @@ def update_cooking_setting(
     db_setting = session.get(CookingSetting, cooking_setting_id)
     if not db_setting:
         raise HTTPException(status_code=404, detail="Cooking setting not found")
+    old_pair = (db_setting.ingredient_id, db_setting.cooking_tool_id)
 
     setting_data = cooking_setting.dict(exclude_unset=True)
     for key, value in setting_data.items():
         setattr(db_setting, key, value)
 
     session.add(db_setting)
+    bump_catalog_version(session, "cooking_settings")
     session.commit()
+    catalog.refresh(session, "cooking_settings")
     session.refresh(db_setting)
+    cooking_setting_lookup.rebuild(
+        session, old_pair, (db_setting.ingredient_id, db_setting.cooking_tool_id)
+    )
     return db_setting
 
 
@@ -95,8 +162,12 @@ def delete_cooking_setting(
     if not setting:
         raise HTTPException(status_code=404, detail="Cooking setting not found")
 
+    pair = (setting.ingredient_id, setting.cooking_tool_id)
     session.delete(setting)
+    bump_catalog_version(session, "cooking_settings")
     session.commit()
+    catalog.refresh(session, "cooking_settings")
+    cooking_setting_lookup.rebuild(session, pair)
     return {"ok": True}
 
 
@@ -113,18 +184,28 @@ def create_cooking_setting_tip(
 
     tip.cooking_setting_id = cooking_setting_id
     session.add(tip)
+    bump_catalog_version(session, "cooking_settings")
     session.commit()
+    catalog.refresh(session, "cooking_settings")
     session.refresh(tip)
+    cooking_setting_lookup.rebuild_setting(session, cooking_setting_id)
     return tip
 
 
 @router.get("/{cooking_setting_id}/tips", response_model=List[CookingSettingTip])
+@query_budget(2)
 def read_cooking_setting_tips(
         cooking_setting_id: int,
         skip: int = 0,
         limit: int = Query(default=100, le=100),
-        session: Session = Depends(get_session),
+        session: Session = Depends(get_read_session),
 ):
+    snapshot = catalog.current
+    if snapshot is not None:
+        if cooking_setting_id not in snapshot.cooking_settings_by_id:
+            raise HTTPException(status_code=404, detail="Cooking setting not found")
+        return snapshot.tips_by_setting.get(cooking_setting_id, ())[skip:skip + limit]
+
     cooking_setting = session.get(CookingSetting, cooking_setting_id)
     if not cooking_setting:
         raise HTTPException(status_code=404, detail="Cooking setting not found")
@@ -139,9 +220,24 @@ def read_cooking_setting_tips(
 
 
 @router.get("/{cooking_setting_id}/tips/{tip_id}", response_model=CookingSettingTip)
+@query_budget(1)
 def read_cooking_setting_tip(
-        cooking_setting_id: int, tip_id: int, session: Session = Depends(get_session)
+        cooking_setting_id: int, tip_id: int, session: Session = Depends(get_read_session)
 ):
+    snapshot = catalog.current
+    if snapshot is not None:
+        tip = next(
+            (
+                tip
+                for tip in snapshot.tips_by_setting.get(cooking_setting_id, ())
+                if tip.id == tip_id
+            ),
+            None,
+        )
+        if not tip:
+            raise HTTPException(status_code=404, detail="Tip not found")
+        return tip
+
     tip = session.exec(
         select(CookingSettingTip).where(
             CookingSettingTip.cooking_setting_id == cooking_setting_id,
@@ -178,8 +274,11 @@ def update_cooking_setting_tip(
             setattr(tip, key, value)
 
     session.add(tip)
+    bump_catalog_version(session, "cooking_settings")
     session.commit()
+    catalog.refresh(session, "cooking_settings")
     session.refresh(tip)
+    cooking_setting_lookup.rebuild_setting(session, cooking_setting_id)
     return tip
 
 
@@ -201,5 +300,8 @@ def delete_cooking_setting_tip(
         raise HTTPException(status_code=404, detail="Tip not found")
 
     session.delete(tip)
+    bump_catalog_version(session, "cooking_settings")
     session.commit()
+    catalog.refresh(session, "cooking_settings")
+    cooking_setting_lookup.rebuild_setting(session, cooking_setting_id)
     return {"message": "Tip deleted successfully"}
@@ -1,10 +1,30 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Query, HTTPException, Depends, UploadFile, File
+from fastapi import APIRouter, Query, HTTPException, Depends, UploadFile, File, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from sqlmodel import select, Session
-
-from api.v1.deps import get_session, get_current_superuser
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from api.v1.deps import (
+    conditional_get,
+    get_async_session,
+    get_current_superuser,
+    get_read_session,
+    get_session,
+)
+from api.v1.pagination import (
+    decode_cursor,
+    next_page_after,
+    paginate,
+    set_next_link_after,
+    slice_page,
+)
+from core.cache import MISSING, response_cache
+from core.catalog import bump_catalog_version, catalog
+from core.compression import CompressedBody
+from core.query_budget import query_budget
 from core.s3 import object_storage
+from core.serialization import encode_as, encoded_response
 from models.common import CookingTool
 from models.response import CookingToolResponse
 from models.user import User
@@ -20,25 +40,61 @@ def create_cooking_tool(
         current_user: User = Depends(get_current_superuser),
 ):
     session.add(cooking_tool)
+    bump_catalog_version(session, "cooking_tools")
     session.commit()
+    catalog.refresh(session, "cooking_tools")
     session.refresh(cooking_tool)
     return cooking_tool
 
 
-@router.get("/", response_model=List[CookingToolResponse])
+@router.get(
+    "/",
+    response_model=List[CookingToolResponse],
+    dependencies=[Depends(conditional_get("cooking_tools"))],
+)
+@query_budget(1)
 def read_cooking_tools(
         *,
-        session: Session = Depends(get_session),
+        request: Request,
+        response: Response,
+        session: Session = Depends(get_read_session),
         offset: int = 0,
+        after: Optional[str] = None,
         limit: int = Query(default=100, lte=100),
 ):
-    tools = session.exec(select(CookingTool).offset(offset).limit(limit)).all()
-    return tools
-
-
-@router.get("/{tool_id}", response_model=CookingToolResponse)
-def read_cooking_tool(*, session: Session = Depends(get_session), tool_id: int):
-    tool = session.get(CookingTool, tool_id)
+    after_id = decode_cursor(after)
+
+    # 인코딩된 본문(과 압축본)을 캐시하므로 같은 버전에서는 검증/직렬화/압축을 다시 하지 않습니다.
+    cache_key = response_cache.make_key("cooking_tools", ("list", after_id, offset, limit))
+    cached = response_cache.get(cache_key)
+    if cached is MISSING:
+        snapshot = catalog.current
+        if snapshot is not None:
+            page = slice_page(snapshot.cooking_tools, after_id, offset, limit)
+        else:
+            query = paginate(select(CookingTool), CookingTool, after_id, offset, limit)
+            page = session.exec(query).all()
+        body = CompressedBody(encode_as(List[CookingToolResponse], page))
+        cached = (body, next_page_after(page, limit))
+        response_cache.set(cache_key, cached)
+
+    body, next_after = cached
+    set_next_link_after(request, response, next_after)
+    return encoded_response(request, response, body)
+
+
+@router.get(
+    "/{tool_id}",
+    response_model=CookingToolResponse,
+    dependencies=[Depends(conditional_get("cooking_tools"))],
+)
+@query_budget(1)
+def read_cooking_tool(*, session: Session = Depends(get_read_session), tool_id: int):
+    snapshot = catalog.current
+    if snapshot is not None:
+        tool = snapshot.cooking_tools_by_id.get(tool_id)
+    else:
+        tool = session.get(CookingTool, tool_id)
     if not tool:
         raise HTTPException(status_code=404, detail="Cooking tool not found")
     return tool
@@ -61,7 +117,9 @@ def update_cooking_tool(
         setattr(db_tool, key, value)
 
     session.add(db_tool)
+    bump_catalog_version(session, "cooking_tools")
     session.commit()
+    catalog.refresh(session, "cooking_tools")
     session.refresh(db_tool)
     return db_tool
 
@@ -78,27 +136,29 @@ def delete_cooking_tool(
         raise HTTPException(status_code=404, detail="Cooking tool not found")
 
     session.delete(tool)
+    bump_catalog_version(session, "cooking_tools")
     session.commit()
+    catalog.refresh(session, "cooking_tools")
     return {"ok": True}
 
 
 @router.post("/{tool_id}/icon")
 async def upload_cooking_tool_icon(
         *,
-        session: Session = Depends(get_session),
+        session: AsyncSession = Depends(get_async_session),
         tool_id: int,
         file: UploadFile = File(...),
         current_user: User = Depends(get_current_superuser),
 ):
     """요리 도구 아이콘 SVG 업로드"""
-    tool = session.get(CookingTool, tool_id)
+    tool = await session.get(CookingTool, tool_id)
     if not tool:
         raise HTTPException(status_code=404, detail="Cooking tool not found")
 
     # 기존 이미지가 있다면 삭제
     if tool.icon_url:
         key = tool.icon_url.split('/')[-1]
-        object_storage.delete_image(key)
+        await run_in_threadpool(object_storage.delete_image, key)
 
     # 새 이미지 업로드
     result = await object_storage.upload_image(file, folder="cooking_tools")
@@ -108,8 +168,10 @@ async def upload_cooking_tool_icon(
     # DB 업데이트
     tool.icon_url = result["url"]
     session.add(tool)
-    session.commit()
-    session.refresh(tool)
+    await session.run_sync(bump_catalog_version, "cooking_tools")
+    await session.commit()
+    await catalog.refresh_async("cooking_tools")
+    await session.refresh(tool)
 
     return {"icon_url": tool.icon_url}
 
@@ -117,12 +179,12 @@ async def upload_cooking_tool_icon(
 @router.delete("/{tool_id}/icon")
 async def delete_cooking_tool_icon(
         *,
-        session: Session = Depends(get_session),
+        session: AsyncSession = Depends(get_async_session),
         tool_id: int,
         current_user: User = Depends(get_current_superuser),
 ):
     """요리 도구 아이콘 삭제"""
-    tool = session.get(CookingTool, tool_id)
+    tool = await session.get(CookingTool, tool_id)
     if not tool:
         raise HTTPException(status_code=404, detail="Cooking tool not found")
 
@@ -131,10 +193,12 @@ async def delete_cooking_tool_icon(
 
     # Object Storage에서 이미지 삭제
     key = tool.icon_url.split('/')[-1]
-    if object_storage.delete_image(key):
+    if await run_in_threadpool(object_storage.delete_image, key):
         tool.icon_url = None
         session.add(tool)
-        session.commit()
+        await session.run_sync(bump_catalog_version, "cooking_tools")
+        await session.commit()
+        await catalog.refresh_async("cooking_tools")
         return {"message": "Icon deleted successfully"}
 
     raise HTTPException(status_code=500, detail="Failed to delete icon")
@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends
+
+from api.v1.deps import get_current_superuser
+from core.cache import response_cache
+from core.concurrency import concurrency_limiter
+from core.pool_stats import pool_monitor
+from core.read_routing import read_router
+from models.user import User
+
+router = APIRouter()
+
+
+@router.get("/cache")
+def read_cache_stats(current_user: User = Depends(get_current_superuser)):
+    """읽기 결과 캐시의 적중/미스/축출 통계 (현재 워커 기준)"""
+    return response_cache.stats()
+
+
+@router.get("/concurrency")
+async def read_concurrency_stats(current_user: User = Depends(get_current_superuser)):
+    """커넥션 checkout 대기열 길이와 대기 시간 분포 (현재 워커 기준)"""
+    return concurrency_limiter.stats()
+
+
+@router.get("/pool")
+async def read_pool_stats(current_user: User = Depends(get_current_superuser)):
+    """DB 커넥션 풀 상태와 checkout/ping 지연 분포 (현재 워커 기준, pid 로 구분)"""
+    return pool_monitor.snapshot()
+
+
+@router.get("/replica")
+async def read_replica_stats(current_user: User = Depends(get_current_superuser)):
+    """읽기 복제본 상태(지연, 참조 데이터 버전 뒤처짐)와 읽기 라우팅 횟수 (현재 워커 기준)"""
+    return read_router.stats()
@@ -1,9 +1,11 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Query, HTTPException, Depends
+from fastapi import APIRouter, Query, HTTPException, Depends, Request, Response
 from sqlmodel import select, Session
 
-from api.v1.deps import get_session, get_current_superuser
+from api.v1.deps import get_read_session, get_session, get_current_superuser
+from api.v1.pagination import decode_cursor, paginate, set_next_link
+from core.query_budget import query_budget
 from models.common import TimerFeedback, IngredientRequestFeedback
 from models.user import User
 
@@ -11,6 +13,7 @@ router = APIRouter()
 
 
 @router.post("/timer-feedback", response_model=TimerFeedback)
+@query_budget(2)
 def create_feedback(
     timer_feedback: TimerFeedback, session: Session = Depends(get_session)
 ):
@@ -22,19 +25,24 @@ def create_feedback(
 
 @router.get("/timer-feedback", response_model=List[TimerFeedback])
 def read_feedbacks(
-    session: Session = Depends(get_session),
+    request: Request,
+    response: Response,
+    session: Session = Depends(get_read_session),
     skip: int = 0,
+    after: Optional[str] = None,
     limit: int = Query(default=100, le=100),
     current_user: User = Depends(get_current_superuser),
 ):
-    feedbacks = session.exec(select(TimerFeedback).offset(skip).limit(limit)).all()
+    query = paginate(select(TimerFeedback), TimerFeedback, decode_cursor(after), skip, limit)
+    feedbacks = session.exec(query).all()
+    set_next_link(request, response, feedbacks, limit)
     return feedbacks
 
 
 @router.get("/timer-feedback/{timer_feedback_id}", response_model=TimerFeedback)
 def read_feedback(
     timer_feedback_id: int,
-    session: Session = Depends(get_session),
+    session: Session = Depends(get_read_session),
     current_user: User = Depends(get_current_superuser),
 ):
     feedback = session.get(TimerFeedback, timer_feedback_id)
@@ -59,6 +67,7 @@ def delete_feedback(
 
 
 @router.post("/ingredient-request-feedback", response_model=IngredientRequestFeedback)
+@query_budget(2)
 def create_ingredient_request_feedback(
     ingredient_request_feedback: IngredientRequestFeedback,
     session: Session = Depends(get_session),
@@ -73,14 +82,23 @@ def create_ingredient_request_feedback(
     "/ingredient-request-feedback", response_model=List[IngredientRequestFeedback]
 )
 def read_ingredient_request_feedbacks(
-    session: Session = Depends(get_session),
+    request: Request,
+    response: Response,
+    session: Session = Depends(get_read_session),
     skip: int = 0,
+    after: Optional[str] = None,
     limit: int = Query(default=100, le=100),
     current_user: User = Depends(get_current_superuser),
 ):
-    feedbacks = session.exec(
-        select(IngredientRequestFeedback).offset(skip).limit(limit)
-    ).all()
+    query = paginate(
+        select(IngredientRequestFeedback),
+        IngredientRequestFeedback,
+        decode_cursor(after),
+        skip,
+        limit,
+    )
+    feedbacks = session.exec(query).all()
+    set_next_link(request, response, feedbacks, limit)
     return feedbacks
 
 
@@ -90,7 +108,7 @@ def read_ingredient_request_feedbacks(
 )
 def read_ingredient_request_feedback(
     ingredient_request_feedback_id: int,
-    session: Session = Depends(get_session),
+    session: Session = Depends(get_read_session),
     current_user: User = Depends(get_current_superuser),
 ):
     feedback = session.get(IngredientRequestFeedback, ingredient_request_feedback_id)
@@ -1,15 +1,48 @@
+import random
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Query, Depends, UploadFile, File
-from sqlalchemy import func
+from fastapi import APIRouter, HTTPException, Query, Depends, UploadFile, File, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import case
+from sqlalchemy.orm import selectinload
 from sqlmodel import select, Session
-
-from api.v1.deps import get_session, get_current_superuser
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from api.v1.deps import (
+    check_not_modified,
+    conditional_get,
+    get_async_session,
+    get_current_superuser,
+    get_read_session,
+    get_session,
+)
+from api.v1.pagination import (
+    decode_cursor,
+    next_page_after,
+    paginate,
+    set_next_link_after,
+    slice_page,
+)
+from core.cache import MISSING, response_cache
+from core.catalog import bump_catalog_version, catalog, cooking_setting_lookup
+from core.compression import CompressedBody
+from core.config import settings
+from core.query_budget import query_budget
 from core.s3 import object_storage
+from core.sampling import sample_rows
+from core.search import AUTOCOMPLETE_TOP_K, db_contains, ingredient_index
+from core.serialization import encode_as, encoded_response
 from models.common import Ingredient, IngredientNutritionLink, NutritionTag, CookingTool, CookingSetting
-from models.response import IngredientResponse, IngredientSearchResponse, CookingToolResponse, IngredientListResponse
+from models.response import (
+    CookingToolResponse,
+    IngredientBatchItem,
+    IngredientBatchRequest,
+    IngredientListResponse,
+    IngredientResponse,
+    IngredientSearchResponse,
+)
 from models.user import User
-from utils.utils import is_chosung
+from utils.utils import get_chosung, is_chosung
 
 router = APIRouter()
 
@@ -22,27 +55,46 @@ def create_ingredient(
         current_user: User = Depends(get_current_superuser),
 ):
     session.add(ingredient)
+    bump_catalog_version(session, "ingredients")
     session.commit()
     session.refresh(ingredient)
+    ingredient_index.upsert(ingredient)
+    catalog.refresh(session, "ingredients")
     return ingredient
 
 
 @router.get("/search", response_model=List[IngredientSearchResponse])
+@query_budget(1)
 def search_ingredients(
         *,
-        session: Session = Depends(get_session),
+        session: Session = Depends(get_read_session),
         keyword: str = Query(..., min_length=1),
         category_id: Optional[int] = None,
         skip: int = 0,
         limit: int = Query(default=100, lte=100),
+        fuzzy: bool = Query(default=False),
 ):
+    cache_key = response_cache.make_key(
+        "ingredients", ("search", keyword.lower(), category_id, skip, limit, fuzzy)
+    )
+    cached = response_cache.get(cache_key)
+    if cached is not MISSING:
+        return cached
+
+    if settings.SEARCH_INDEX_ENABLED and ingredient_index.is_ready:
+        search = ingredient_index.fuzzy_search if fuzzy else ingredient_index.search
+        result = search(keyword, category_id=category_id, skip=skip, limit=limit)
+        response_cache.set(cache_key, result)
+        return result
+
     query = select(Ingredient)
+    dialect_name = session.get_bind().dialect.name
 
     if keyword:
         if is_chosung(keyword):
-            query = query.where(Ingredient.chosung.contains(keyword))
+            query = query.where(db_contains(Ingredient.chosung, keyword, dialect_name))
         else:
-            query = query.where(Ingredient.name.contains(keyword))
+            query = query.where(db_contains(Ingredient.name, keyword, dialect_name))
 
     if category_id is not None:
         query = query.where(Ingredient.category_id == category_id)
@@ -51,29 +103,128 @@ def search_ingredients(
     ingredients = session.exec(query).all()
 
     # DB에 저장된 URL들을 그대로 사용
+    result = [IngredientSearchResponse.model_validate(ingredient) for ingredient in ingredients]
+    response_cache.set(cache_key, result)
+    return result
+
+
+@router.get("/autocomplete", response_model=List[IngredientSearchResponse])
+@query_budget(1)
+def autocomplete_ingredients(
+        *,
+        session: Session = Depends(get_read_session),
+        keyword: str = Query(..., min_length=1),
+        limit: int = Query(default=AUTOCOMPLETE_TOP_K, le=AUTOCOMPLETE_TOP_K),
+):
+    """
+    재료 이름/초성 자동완성.
+    접두사 일치 > 부분 일치 > 인기도(타이머 사용 횟수) 순으로 정렬합니다.
+    """
+    if settings.SEARCH_INDEX_ENABLED and ingredient_index.is_ready:
+        return ingredient_index.autocomplete(keyword, limit=limit)
+
+    column = Ingredient.chosung if is_chosung(keyword) else Ingredient.name
+    query = (
+        select(Ingredient)
+        .where(db_contains(column, keyword, session.get_bind().dialect.name))
+        .order_by(case((column.startswith(keyword), 0), else_=1), Ingredient.name)
+        .limit(limit)
+    )
+    ingredients = session.exec(query).all()
     return [IngredientSearchResponse.model_validate(ingredient) for ingredient in ingredients]
 
 
 @router.get("/", response_model=List[IngredientListResponse])
+@query_budget(4)
 def read_ingredients(
         *,
-        session: Session = Depends(get_session),
+        request: Request,
+        response: Response,
+        session: Session = Depends(get_read_session),
         offset: int = 0,
+        after: Optional[str] = None,
         limit: int = Query(default=100, lte=100),
         is_random: bool = Query(default=False),
+        seed: Optional[int] = Query(default=None),
 ):
+    # seed 를 주면 같은 카탈로그에서 항상 같은 순서로 섞이므로 ETag 로 재검증할 수 있습니다.
+    if is_random and seed is None:
+        response.headers["Cache-Control"] = "no-store"
+    else:
+        check_not_modified(request, response, "ingredients")
+
+    after_id = decode_cursor(after)
+
+    if is_random and seed is None:
+        ingredients = _sample_ingredients(session, limit, random.Random())
+        return encoded_response(
+            request, response, encode_as(List[IngredientListResponse], ingredients)
+        )
+
+    # 인코딩된 본문(과 압축본)을 캐시하므로 같은 버전에서는 검증/직렬화/압축을 다시 하지 않습니다.
     if is_random:
-        query = select(Ingredient).order_by(func.random()).limit(limit)
+        cache_key = response_cache.make_key("ingredients", ("random", seed, limit))
     else:
-        query = select(Ingredient).offset(offset).limit(limit)
+        cache_key = response_cache.make_key("ingredients", ("list", after_id, offset, limit))
+    cached = response_cache.get(cache_key)
+    if cached is MISSING:
+        if is_random:
+            page, next_after = _sample_ingredients(session, limit, random.Random(seed)), None
+        else:
+            page = _read_ingredient_page(session, after_id, offset, limit)
+            next_after = next_page_after(page, limit)
+        cached = (CompressedBody(encode_as(List[IngredientListResponse], page)), next_after)
+        response_cache.set(cache_key, cached)
+
+    body, next_after = cached
+    set_next_link_after(request, response, next_after)
+    return encoded_response(request, response, body)
+
+
+def _sample_ingredients(session: Session, limit: int, rng: random.Random) -> list:
+    snapshot = catalog.current
+    if snapshot is not None:
+        return rng.sample(snapshot.ingredients, min(limit, len(snapshot.ingredients)))
+    return sample_rows(
+        session, Ingredient, limit, rng, options=[selectinload(Ingredient.nutrition_tags)]
+    )
 
-    ingredients = session.exec(query).all()
-    return [IngredientResponse.model_validate(ingredient) for ingredient in ingredients]
 
+def _read_ingredient_page(
+        session: Session, after_id: Optional[int], offset: int, limit: int
+) -> list:
+    snapshot = catalog.current
+    if snapshot is not None:
+        return slice_page(snapshot.ingredients, after_id, offset, limit)
 
-@router.get("/{ingredient_id}", response_model=IngredientResponse)
-def read_ingredient(*, session: Session = Depends(get_session), ingredient_id: int):
-    ingredient = session.get(Ingredient, ingredient_id)
+    query = paginate(
+        select(Ingredient).options(selectinload(Ingredient.nutrition_tags)),
+        Ingredient,
+        after_id,
+        offset,
+        limit,
+    )
+    return session.exec(query).all()
+
+
+@router.get(
+    "/{ingredient_id}",
+    response_model=IngredientResponse,
+    # available_cooking_tools 가 조리 설정/도구에 의존
+    dependencies=[Depends(conditional_get("ingredients", "cooking_settings", "cooking_tools"))],
+)
+@query_budget(3)
+def read_ingredient(*, session: Session = Depends(get_read_session), ingredient_id: int):
+    snapshot = catalog.current
+    if snapshot is not None:
+        ingredient = snapshot.ingredient_details_by_id.get(ingredient_id)
+        if not ingredient:
+            raise HTTPException(status_code=404, detail="Ingredient not found")
+        return ingredient
+
+    ingredient = session.get(
+        Ingredient, ingredient_id, options=[selectinload(Ingredient.nutrition_tags)]
+    )
     if not ingredient:
         raise HTTPException(status_code=404, detail="Ingredient not found")
 
@@ -91,6 +242,55 @@ def read_ingredient(*, session: Session = Depends(get_session), ingredient_id: i
     return response
 
 
+@router.post("/batch", response_model=List[IngredientBatchItem])
+@query_budget(3)
+def read_ingredients_batch(
+        *,
+        session: Session = Depends(get_read_session),
+        batch: IngredientBatchRequest,
+):
+    """
+    재료 상세를 여러 개 한 번에 조회합니다.
+    요청한 순서(중복 포함)대로 돌려주며, 없는 재료는 found=false 로 표시합니다.
+    """
+    snapshot = catalog.current
+    if snapshot is not None:
+        details = snapshot.ingredient_details_by_id
+    else:
+        ids = set(batch.ids)
+        ingredients = session.exec(
+            select(Ingredient)
+            .options(selectinload(Ingredient.nutrition_tags))
+            .where(Ingredient.id.in_(ids))
+        ).all()
+        tool_rows = session.exec(
+            select(CookingSetting.ingredient_id, CookingTool)
+            .join(CookingTool, CookingTool.id == CookingSetting.cooking_tool_id)
+            .where(CookingSetting.ingredient_id.in_(ids))
+            .distinct()
+            .order_by(CookingSetting.ingredient_id, CookingTool.id)
+        ).all()
+
+        tools: dict = {}
+        for ingredient_id, tool in tool_rows:
+            tools.setdefault(ingredient_id, []).append(CookingToolResponse.model_validate(tool))
+
+        details = {}
+        for ingredient in ingredients:
+            response = IngredientResponse.model_validate(ingredient)
+            response.available_cooking_tools = tools.get(ingredient.id, [])
+            details[ingredient.id] = response
+
+    return [
+        IngredientBatchItem(
+            id=ingredient_id,
+            found=ingredient_id in details,
+            ingredient=details.get(ingredient_id),
+        )
+        for ingredient_id in batch.ids
+    ]
+
+
 @router.patch("/{ingredient_id}", response_model=IngredientResponse)
 def update_ingredient(
         *,
@@ -107,9 +307,18 @@ def update_ingredient(
     for key, value in ingredient_data.items():
         setattr(db_ingredient, key, value)
 
+    # 이름이 바뀌면 초성도 함께 갱신
+    if "name" in ingredient_data:
+        db_ingredient.chosung = get_chosung(db_ingredient.name)
+
     session.add(db_ingredient)
+    bump_catalog_version(session, "ingredients")
     session.commit()
     session.refresh(db_ingredient)
+    ingredient_index.upsert(db_ingredient)
+    catalog.refresh(session, "ingredients")
+    if "color_theme" in ingredient_data:
+        cooking_setting_lookup.rebuild_ingredient(session, ingredient_id)
     return db_ingredient
 
 
@@ -125,7 +334,11 @@ def delete_ingredient(
         raise HTTPException(status_code=404, detail="Ingredient not found")
 
     session.delete(ingredient)
+    bump_catalog_version(session, "ingredients")
     session.commit()
+    ingredient_index.remove(ingredient_id)
+    catalog.refresh(session, "ingredients")
+    cooking_setting_lookup.rebuild_ingredient(session, ingredient_id)
     return {"ok": True}
 
 
@@ -176,7 +389,9 @@ def add_nutrition_tag(
     # 새 태그 연결 추가
     link = IngredientNutritionLink(ingredient_id=ingredient_id, nutrition_tag_id=tag_id)
     session.add(link)
+    bump_catalog_version(session, "ingredients")
     session.commit()
+    catalog.refresh(session, "ingredients")
 
     return {"ok": True}
 
@@ -204,15 +419,25 @@ def remove_nutrition_tag(
 
     # 연결 삭제
     session.delete(link)
+    bump_catalog_version(session, "ingredients")
     session.commit()
+    catalog.refresh(session, "ingredients")
 
     return {"ok": True}
 
 
 @router.get("/{ingredient_id}/tags", response_model=List[NutritionTag])
+@query_budget(2)
 def read_ingredient_nutrition_tags(
-        *, session: Session = Depends(get_session), ingredient_id: int
+        *, session: Session = Depends(get_read_session), ingredient_id: int
 ):
+    snapshot = catalog.current
+    if snapshot is not None:
+        ingredient = snapshot.ingredients_by_id.get(ingredient_id)
+        if not ingredient:
+            raise HTTPException(status_code=404, detail="Ingredient not found")
+        return ingredient.nutrition_tags
+
     # 재료 확인
     ingredient = session.get(Ingredient, ingredient_id)
     if not ingredient:
@@ -225,20 +450,20 @@ def read_ingredient_nutrition_tags(
 @router.post("/{ingredient_id}/icon")
 async def upload_ingredient_icon(
         *,
-        session: Session = Depends(get_session),
+        session: AsyncSession = Depends(get_async_session),
         ingredient_id: int,
         file: UploadFile = File(...),
         current_user: User = Depends(get_current_superuser),
 ):
     """일반 아이콘 SVG 업로드"""
-    ingredient = session.get(Ingredient, ingredient_id)
+    ingredient = await session.get(Ingredient, ingredient_id)
     if not ingredient:
         raise HTTPException(status_code=404, detail="Ingredient not found")
 
     # 기존 일반 이미지가 있다면 삭제
     if ingredient.icon_url:
         key = ingredient.icon_url.split('/')[-1]
-        object_storage.delete_image(key)
+        await run_in_threadpool(object_storage.delete_image, key)
 
     # 새 이미지 업로드
     result = await object_storage.upload_image(file, folder="ingredients")
@@ -248,8 +473,11 @@ async def upload_ingredient_icon(
     # DB 업데이트
     ingredient.icon_url = result["url"]
     session.add(ingredient)
-    session.commit()
-    session.refresh(ingredient)
+    await session.run_sync(bump_catalog_version, "ingredients")
+    await session.commit()
+    await session.refresh(ingredient)
+    ingredient_index.upsert(ingredient)
+    await catalog.refresh_async("ingredients")
 
     return {"icon_url": ingredient.icon_url}
 
@@ -257,13 +485,13 @@ async def upload_ingredient_icon(
 @router.post("/{ingredient_id}/home-icon")
 async def upload_ingredient_home_icon(
         *,
-        session: Session = Depends(get_session),
+        session: AsyncSession = Depends(get_async_session),
         ingredient_id: int,
         file: UploadFile = File(...),
         current_user: User = Depends(get_current_superuser),
 ):
     """홈화면용 아이콘 SVG 업로드"""
-    ingredient = session.get(Ingredient, ingredient_id)
+    ingredient = await session.get(Ingredient, ingredient_id)
     if not ingredient:
         raise HTTPException(status_code=404, detail="Ingredient not found")
 
@@ -273,7 +501,7 @@ async def upload_ingredient_home_icon(
     # 기존 홈화면 이미지가 있다면 삭제
     if ingredient.home_icon_url:
         key = ingredient.home_icon_url.split('/')[-1]
-        object_storage.delete_image(key)
+        await run_in_threadpool(object_storage.delete_image, key)
 
     # 새 이미지 업로드
     result = await object_storage.upload_image(
@@ -288,8 +516,11 @@ async def upload_ingredient_home_icon(
     # DB 업데이트
     ingredient.home_icon_url = result["url"]
     session.add(ingredient)
-    session.commit()
-    session.refresh(ingredient)
+    await session.run_sync(bump_catalog_version, "ingredients")
+    await session.commit()
+    await session.refresh(ingredient)
+    ingredient_index.upsert(ingredient)
+    await catalog.refresh_async("ingredients")
 
     return {"home_icon_url": ingredient.home_icon_url}
 
@@ -297,12 +528,12 @@ async def upload_ingredient_home_icon(
 @router.delete("/{ingredient_id}/icon")
 async def delete_ingredient_icon(
         *,
-        session: Session = Depends(get_session),
+        session: AsyncSession = Depends(get_async_session),
         ingredient_id: int,
         current_user: User = Depends(get_current_superuser),
 ):
     """일반 아이콘 삭제"""
-    ingredient = session.get(Ingredient, ingredient_id)
+    ingredient = await session.get(Ingredient, ingredient_id)
     if not ingredient:
         raise HTTPException(status_code=404, detail="Ingredient not found")
 
@@ -311,10 +542,13 @@ async def delete_ingredient_icon(
 
     # Object Storage에서 이미지 삭제
     key = ingredient.icon_url.split('/')[-1]
-    if object_storage.delete_image(key):
+    if await run_in_threadpool(object_storage.delete_image, key):
         ingredient.icon_url = None
         session.add(ingredient)
-        session.commit()
+        await session.run_sync(bump_catalog_version, "ingredients")
+        await session.commit()
+        ingredient_index.upsert(ingredient)
+        await catalog.refresh_async("ingredients")
         return {"message": "Icon deleted successfully"}
 
     raise HTTPException(status_code=500, detail="Failed to delete icon")
@@ -323,12 +557,12 @@ async def delete_ingredient_icon(
 @router.delete("/{ingredient_id}/home-icon")
 async def delete_ingredient_home_icon(
         *,
-        session: Session = Depends(get_session),
+        session: AsyncSession = Depends(get_async_session),
         ingredient_id: int,
         current_user: User = Depends(get_current_superuser),
 ):
     """홈화면용 아이콘 삭제"""
-    ingredient = session.get(Ingredient, ingredient_id)
+    ingredient = await session.get(Ingredient, ingredient_id)
     if not ingredient:
         raise HTTPException(status_code=404, detail="Ingredient not found")
 
@@ -337,10 +571,12 @@ async def delete_ingredient_home_icon(
 
     # Object Storage에서 이미지 삭제
     key = ingredient.home_icon_url.split('/')[-1]
-    if object_storage.delete_image(key):
+    if await run_in_threadpool(object_storage.delete_image, key):
         ingredient.home_icon_url = None
         session.add(ingredient)
-        session.commit()
+        await session.run_sync(bump_catalog_version, "ingredients")
+        await session.commit()
+        await catalog.refresh_async("ingredients")
         return {"message": "Home icon deleted successfully"}
 
     raise HTTPException(status_code=500, detail="Failed to delete home icon")
@@ -1,36 +1,54 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Query, HTTPException, Depends
+from fastapi import APIRouter, Query, HTTPException, Depends, Request, Response
 from sqlmodel import select, Session
 
-from api.v1.deps import get_session, get_current_superuser
-from models.common import Timer
+from api.v1.deps import get_read_session, get_session, get_current_superuser
+from api.v1.pagination import decode_cursor, paginate, set_next_link
+from core.catalog import POPULARITY_VERSION_ENTITY, bump_catalog_version
+from core.query_budget import query_budget
+from core.search import ingredient_index
+from models.common import CookingSetting, Timer
 from models.user import User
 
 router = APIRouter()
 
 
 @router.post("/", response_model=Timer)
+@query_budget(4)
 def create_timer(timer: Timer, session: Session = Depends(get_session)):
     session.add(timer)
+    # 다른 워커는 sync 에서 버전 변화를 보고 인기도를 DB 에서 다시 집계합니다.
+    bump_catalog_version(session, POPULARITY_VERSION_ENTITY)
     session.commit()
     session.refresh(timer)
+
+    # 이 워커의 자동완성 인기도는 바로 반영
+    cooking_setting = session.get(CookingSetting, timer.cooking_setting_id)
+    if cooking_setting:
+        ingredient_index.bump_popularity(cooking_setting.ingredient_id)
     return timer
 
 
 @router.get("/", response_model=List[Timer])
 def read_timers(
-        session: Session = Depends(get_session),
+        request: Request,
+        response: Response,
+        session: Session = Depends(get_read_session),
         skip: int = 0,
+        after: Optional[str] = None,
         limit: int = Query(default=100, le=100),
         current_user: User = Depends(get_current_superuser),
 ):
-    timers = session.exec(select(Timer).offset(skip).limit(limit)).all()
+    query = paginate(select(Timer), Timer, decode_cursor(after), skip, limit)
+    timers = session.exec(query).all()
+    set_next_link(request, response, timers, limit)
     return timers
 
 
 @router.get("/{timer_id}", response_model=Timer)
-def read_timer(timer_id: int, session: Session = Depends(get_session),
+@query_budget(1)
+def read_timer(timer_id: int, session: Session = Depends(get_read_session),
                ):
     timer = session.get(Timer, timer_id)
     if not timer:
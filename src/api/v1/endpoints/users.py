@@ -1,9 +1,12 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from api.v1.deps import get_session, get_current_superuser, get_current_user
+from api.v1.deps import get_async_session, get_current_superuser, get_current_user
+from api.v1.pagination import decode_cursor, paginate, set_next_link
 from models.response import UserResponse, UserCreate, UserUpdate
 from models.user import User
 
@@ -13,36 +16,36 @@ router = APIRouter()
 @router.post("/", response_model=UserResponse)
 async def create_user(
     *,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     user_in: UserCreate,
     current_user: User = Depends(get_current_superuser)
 ) -> User:
     # Check if email already exists
-    db_user = session.exec(select(User).where(User.email == user_in.email)).first()
+    db_user = (await session.exec(select(User).where(User.email == user_in.email))).first()
     if db_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered"
         )
 
     # Check if username already exists
-    db_user = session.exec(
-        select(User).where(User.username == user_in.username)
+    db_user = (
+        await session.exec(select(User).where(User.username == user_in.username))
     ).first()
     if db_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Username already taken"
         )
 
-    # Create new user
+    # Create new user (bcrypt 해시는 CPU 작업이라 스레드풀에서 계산)
     db_user = User(
         email=user_in.email,
         username=user_in.username,
-        hashed_password=User.get_password_hash(user_in.password),
+        hashed_password=await run_in_threadpool(User.get_password_hash, user_in.password),
         role=user_in.role,
     )
     session.add(db_user)
-    session.commit()
-    session.refresh(db_user)
+    await session.commit()
+    await session.refresh(db_user)
     return db_user
 
 
@@ -53,12 +56,17 @@ async def read_current_user(current_user: User = Depends(get_current_user)) -> U
 
 @router.get("/", response_model=List[UserResponse])
 async def read_users(
+    request: Request,
+    response: Response,
     skip: int = 0,
+    after: Optional[str] = None,
     limit: int = 100,
     current_user: User = Depends(get_current_superuser),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ) -> List[UserResponse]:
-    users = session.exec(select(User).offset(skip).limit(limit)).all()
+    query = paginate(select(User), User, decode_cursor(after), skip, limit)
+    users = (await session.exec(query)).all()
+    set_next_link(request, response, users, limit)
     return users
 
 
@@ -66,9 +74,9 @@ async def read_users(
 async def read_user(
     user_id: int,
     current_user: User = Depends(get_current_superuser),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ) -> User:
-    user = session.get(User, user_id)
+    user = await session.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
@@ -81,9 +89,9 @@ async def update_user(
     user_id: int,
     user_in: UserUpdate,
     current_user: User = Depends(get_current_superuser),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ) -> User:
-    db_user = session.get(User, user_id)
+    db_user = await session.get(User, user_id)
     if not db_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
@@ -91,14 +99,16 @@ async def update_user(
 
     user_data = user_in.dict(exclude_unset=True)
     if "password" in user_data:
-        user_data["hashed_password"] = User.get_password_hash(user_data.pop("password"))
+        user_data["hashed_password"] = await run_in_threadpool(
+            User.get_password_hash, user_data.pop("password")
+        )
 
     for field, value in user_data.items():
         setattr(db_user, field, value)
 
     session.add(db_user)
-    session.commit()
-    session.refresh(db_user)
+    await session.commit()
+    await session.refresh(db_user)
     return db_user
 
 
@@ -106,14 +116,14 @@ async def update_user(
 async def delete_user(
     user_id: int,
     current_user: User = Depends(get_current_superuser),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
-    user = session.get(User, user_id)
+    user = await session.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
-    session.delete(user)
-    session.commit()
+    await session.delete(user)
+    await session.commit()
     return {"ok": True}
@@ -0,0 +1,75 @@
+import base64
+import binascii
+import bisect
+from typing import Optional, Sequence
+
+from fastapi import HTTPException, Request, Response, status
+
+
+def encode_cursor(last_id: int) -> str:
+    return base64.urlsafe_b64encode(f"id:{last_id}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    """
+    after 파라미터(불투명 커서)를 마지막으로 받은 기본 키로 바꿉니다.
+    """
+    if cursor is None:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        prefix, _, value = raw.partition(":")
+        if prefix != "id":
+            raise ValueError(raw)
+        return int(value)
+    except (ValueError, UnicodeDecodeError, binascii.Error):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def paginate(query, model, after_id: Optional[int], offset: int, limit: int):
+    """
+    기본 키 순서로 정렬해 커서(after)가 있으면 keyset, 없으면 기존 offset 방식으로 자릅니다.
+    """
+    query = query.order_by(model.id)
+    if after_id is not None:
+        return query.where(model.id > after_id).limit(limit)
+    return query.offset(offset).limit(limit)
+
+
+def slice_page(items: Sequence, after_id: Optional[int], offset: int, limit: int) -> Sequence:
+    """
+    id 오름차순으로 정렬된 스냅샷 목록을 paginate 와 같은 규칙으로 자릅니다.
+    """
+    if after_id is not None:
+        offset = bisect.bisect_right(items, after_id, key=lambda item: item.id)
+    return items[offset:offset + limit]
+
+
+def next_page_after(items: Sequence, limit: int) -> Optional[int]:
+    """
+    페이지가 가득 찼으면 다음 페이지 커서로 쓸 마지막 id, 아니면 None.
+    """
+    if limit <= 0 or len(items) < limit:
+        return None
+    return items[-1].id
+
+
+def set_next_link(request: Request, response: Response, items: Sequence, limit: int) -> None:
+    """
+    페이지가 가득 찼으면 다음 페이지 주소를 Link 헤더(rel="next")로 알려줍니다.
+    응답 본문 형태는 바꾸지 않습니다.
+    """
+    set_next_link_after(request, response, next_page_after(items, limit))
+
+
+def set_next_link_after(request: Request, response: Response, after_id: Optional[int]) -> None:
+    """
+    next_page_after 결과로 Link 헤더를 붙입니다 (인코딩된 본문만 캐시한 경우).
+    """
+    if after_id is None:
+        return
+
+    url = request.url.remove_query_params(["offset", "skip"]).include_query_params(
+        after=encode_cursor(after_id)
+    )
+    response.headers["Link"] = f'<{url}>; rel="next"'
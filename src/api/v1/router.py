@@ -1,9 +1,11 @@
 from fastapi import APIRouter
 
 from api.v1.endpoints.auth import router as auth_router
+from api.v1.endpoints.catalog import router as catalog_router
 from api.v1.endpoints.categories import router as categories_router
 from api.v1.endpoints.cooking_settings import router as cooking_settings_router
 from api.v1.endpoints.cooking_tools import router as cooking_tools_router
+from api.v1.endpoints.diagnostics import router as diagnostics_router
 from api.v1.endpoints.feedback import router as feedback_router
 from api.v1.endpoints.ingredients import router as ingredients_router
 from api.v1.endpoints.timers import router as timers_router
@@ -30,5 +32,9 @@ api_router.include_router(timers_router, prefix="/timers", tags=["timers"])
 api_router.include_router(
     cooking_settings_router, prefix="/cooking-settings", tags=["cooking-settings"]
 )
+api_router.include_router(catalog_router, prefix="/catalog", tags=["catalog"])
 api_router.include_router(users_router, prefix="/users", tags=["users"])
 api_router.include_router(auth_router, prefix="/auth", tags=["auth"])
+api_router.include_router(
+    diagnostics_router, prefix="/diagnostics", tags=["diagnostics"]
+)
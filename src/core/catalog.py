@@ -0,0 +1,509 @@
+import asyncio
+import dataclasses
+import logging
+import threading
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+
+from core.cache import response_cache
+from core.database import engine
+from core.export import EXPORT_VERSION_ENTITY
+from models.common import (
+    CatalogVersion,
+    Category,
+    CookingSetting,
+    CookingSettingTip,
+    CookingTool,
+    Ingredient,
+    IngredientNutritionLink,
+    NutritionTag,
+)
+from models.response import CategoryResponse, CookingToolResponse, IngredientResponse
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷을 구성하는 엔티티 종류 (쓰기 시 해당 종류만 다시 읽음)
+CATALOG_ENTITIES = ("categories", "cooking_tools", "ingredients", "cooking_settings")
+# 스냅샷에는 없고 리스너만 다시 만드는 버전 (타이머 생성 시 증가, 자동완성 인기도)
+POPULARITY_VERSION_ENTITY = "popularity"
+# sync 가 비교하는 버전 종류
+SYNCED_ENTITIES = (*CATALOG_ENTITIES, POPULARITY_VERSION_ENTITY)
+
+
+def ensure_catalog_versions(session: Session) -> None:
+    """
+    엔티티 종류별 버전 행과 내보내기(export) 버전 행을 만들어 둡니다. 여러 워커가 동시에 시작해도 안전합니다.
+    """
+    existing = set(session.exec(select(CatalogVersion.entity)).all())
+    for entity in (*SYNCED_ENTITIES, EXPORT_VERSION_ENTITY):
+        if entity in existing:
+            continue
+        session.add(CatalogVersion(entity=entity, version=0))
+        try:
+            session.commit()
+        except IntegrityError:
+            # 다른 워커가 먼저 만든 경우
+            session.rollback()
+
+
+def bump_catalog_version(session: Session, *entities: str) -> None:
+    """
+    쓰기와 같은 트랜잭션 안에서 호출해야 합니다 (commit 직전).
+    다른 워커는 버전 변화를 보고 해당 종류만 다시 읽습니다.
+    """
+    for entity in entities:
+        session.exec(
+            update(CatalogVersion)
+            .where(CatalogVersion.entity == entity)
+            .values(version=CatalogVersion.version + 1)
+        )
+
+
+def load_catalog_versions(session: Session) -> Dict[str, int]:
+    rows = session.exec(select(CatalogVersion.entity, CatalogVersion.version)).all()
+    return {entity: version for entity, version in rows}
+
+
+def _frozen(data: dict) -> Mapping:
+    return MappingProxyType(data)
+
+
+@dataclasses.dataclass(frozen=True)
+class CatalogSnapshot:
+    """
+    카테고리/조리도구/재료/영양 태그/조리 설정/팁 참조 데이터의 불변 스냅샷.
+    목록은 id 오름차순 tuple, 단건 조회는 읽기 전용 매핑으로 보관합니다.
+    """
+
+    # categories
+    categories: Tuple[CategoryResponse, ...]
+    categories_by_id: Mapping[int, CategoryResponse]
+
+    # cooking_tools
+    cooking_tools: Tuple[CookingToolResponse, ...]
+    cooking_tools_by_id: Mapping[int, CookingToolResponse]
+
+    # ingredients (영양 태그 포함)
+    ingredients: Tuple[IngredientResponse, ...]
+    ingredients_by_id: Mapping[int, IngredientResponse]
+    nutrition_tags_by_id: Mapping[int, NutritionTag]
+
+    # cooking_settings (팁 포함)
+    cooking_settings_by_id: Mapping[int, CookingSetting]
+    tips_by_setting: Mapping[int, Tuple[CookingSettingTip, ...]]
+    tool_ids_by_ingredient: Mapping[int, Tuple[int, ...]]
+
+    # 재료 상세 응답 (영양 태그 + available_cooking_tools), 위 세 종류에서 파생
+    ingredient_details_by_id: Mapping[int, IngredientResponse] = dataclasses.field(
+        default_factory=lambda: _frozen({})
+    )
+
+    def available_cooking_tools(self, ingredient_id: int) -> list:
+        return [
+            self.cooking_tools_by_id[tool_id]
+            for tool_id in self.tool_ids_by_ingredient.get(ingredient_id, ())
+            if tool_id in self.cooking_tools_by_id
+        ]
+
+
+def _load_categories(session: Session) -> dict:
+    categories = tuple(
+        CategoryResponse.model_validate(category)
+        for category in session.exec(select(Category).order_by(Category.id)).all()
+    )
+    return {
+        "categories": categories,
+        "categories_by_id": _frozen({c.id: c for c in categories}),
+    }
+
+
+def _load_cooking_tools(session: Session) -> dict:
+    tools = tuple(
+        CookingToolResponse.model_validate(tool)
+        for tool in session.exec(select(CookingTool).order_by(CookingTool.id)).all()
+    )
+    return {
+        "cooking_tools": tools,
+        "cooking_tools_by_id": _frozen({t.id: t for t in tools}),
+    }
+
+
+def _load_ingredients(session: Session) -> dict:
+    # 세션과 분리된 복사본을 만들어 지연 로딩이 일어나지 않도록 합니다.
+    tags = {
+        tag.id: NutritionTag(id=tag.id, name=tag.name, description=tag.description)
+        for tag in session.exec(select(NutritionTag).order_by(NutritionTag.id)).all()
+    }
+
+    tag_ids: Dict[int, list] = {}
+    links = session.exec(
+        select(IngredientNutritionLink).order_by(
+            IngredientNutritionLink.ingredient_id,
+            IngredientNutritionLink.nutrition_tag_id,
+        )
+    ).all()
+    for link in links:
+        tag_ids.setdefault(link.ingredient_id, []).append(link.nutrition_tag_id)
+
+    ingredients = tuple(
+        IngredientResponse(
+            id=ingredient.id,
+            name=ingredient.name,
+            category_id=ingredient.category_id,
+            color_theme=ingredient.color_theme,
+            home_icon_url=ingredient.home_icon_url,
+            icon_url=ingredient.icon_url,
+            nutrition_tags=[
+                tags[tag_id] for tag_id in tag_ids.get(ingredient.id, []) if tag_id in tags
+            ],
+        )
+        for ingredient in session.exec(select(Ingredient).order_by(Ingredient.id)).all()
+    )
+    return {
+        "ingredients": ingredients,
+        "ingredients_by_id": _frozen({i.id: i for i in ingredients}),
+        "nutrition_tags_by_id": _frozen(tags),
+    }
+
+
+def _load_cooking_settings(session: Session) -> dict:
+    settings_by_id = {}
+    tool_ids: Dict[int, set] = {}
+    for setting in session.exec(select(CookingSetting).order_by(CookingSetting.id)).all():
+        detached = CookingSetting(
+            id=setting.id,
+            ingredient_id=setting.ingredient_id,
+            cooking_tool_id=setting.cooking_tool_id,
+            temperature=setting.temperature,
+            cooking_time=setting.cooking_time,
+        )
+        settings_by_id[setting.id] = detached
+        tool_ids.setdefault(setting.ingredient_id, set()).add(setting.cooking_tool_id)
+
+    tips: Dict[int, list] = {}
+    for tip in session.exec(select(CookingSettingTip).order_by(CookingSettingTip.id)).all():
+        tips.setdefault(tip.cooking_setting_id, []).append(
+            CookingSettingTip(
+                id=tip.id,
+                cooking_setting_id=tip.cooking_setting_id,
+                tip_type=tip.tip_type,
+                message=tip.message,
+            )
+        )
+
+    return {
+        "cooking_settings_by_id": _frozen(settings_by_id),
+        "tips_by_setting": _frozen({k: tuple(v) for k, v in tips.items()}),
+        "tool_ids_by_ingredient": _frozen(
+            {k: tuple(sorted(v)) for k, v in tool_ids.items()}
+        ),
+    }
+
+
+# 재료 상세 문서가 의존하는 엔티티 종류
+_INGREDIENT_DETAIL_SOURCES = {"ingredients", "cooking_settings", "cooking_tools"}
+
+
+def _ingredient_detail(snapshot: CatalogSnapshot, ingredient_id: int) -> IngredientResponse:
+    return snapshot.ingredients_by_id[ingredient_id].model_copy(
+        update={"available_cooking_tools": snapshot.available_cooking_tools(ingredient_id)}
+    )
+
+
+def _with_parts(
+    previous: Optional[CatalogSnapshot], parts: dict, entities
+) -> CatalogSnapshot:
+    """
+    새로 읽은 부분으로 스냅샷을 만들고 재료 상세 문서를 맞춰 갱신합니다.
+    조리 설정만 바뀌었으면 조리도구 목록이 달라진 재료의 문서만 다시 만듭니다.
+    """
+    snapshot = (
+        CatalogSnapshot(**parts) if previous is None else dataclasses.replace(previous, **parts)
+    )
+    entities = set(entities)
+    if previous is not None and not entities & _INGREDIENT_DETAIL_SOURCES:
+        return snapshot
+
+    if previous is not None and entities & _INGREDIENT_DETAIL_SOURCES == {"cooking_settings"}:
+        old_tools, new_tools = previous.tool_ids_by_ingredient, snapshot.tool_ids_by_ingredient
+        details = dict(previous.ingredient_details_by_id)
+        for ingredient_id in set(old_tools) | set(new_tools):
+            if old_tools.get(ingredient_id) == new_tools.get(ingredient_id):
+                continue
+            if ingredient_id in snapshot.ingredients_by_id:
+                details[ingredient_id] = _ingredient_detail(snapshot, ingredient_id)
+    else:
+        details = {
+            ingredient_id: _ingredient_detail(snapshot, ingredient_id)
+            for ingredient_id in snapshot.ingredients_by_id
+        }
+
+    return dataclasses.replace(snapshot, ingredient_details_by_id=_frozen(details))
+
+
+_LOADERS = {
+    "categories": _load_categories,
+    "cooking_tools": _load_cooking_tools,
+    "ingredients": _load_ingredients,
+    "cooking_settings": _load_cooking_settings,
+}
+
+
+class CatalogStore:
+    """
+    참조 데이터 스냅샷 보관소 (워커 단위).
+    시작 시 전체를 읽고, 쓰기가 일어나면 바뀐 엔티티 종류만 다시 읽어 새 스냅샷으로 교체합니다.
+    읽기는 current 를 한 번 가져와 사용하므로 락이 필요 없습니다.
+
+    다른 워커의 쓰기는 catalog_versions 테이블의 버전으로 감지합니다 (sync).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._versions: Dict[str, int] = {}
+        # 다른 워커의 변경을 반영할 때 함께 다시 만들어야 하는 워커 로컬 상태 (검색 색인 등)
+        self._listeners: Dict[str, List[Callable[[Session], None]]] = {}
+
+    @property
+    def current(self) -> Optional[CatalogSnapshot]:
+        return self._snapshot
+
+    @property
+    def versions(self) -> Dict[str, int]:
+        return dict(self._versions)
+
+    def etag(self, *entities: str) -> str:
+        """
+        응답이 의존하는 엔티티 종류의 버전으로 만든 강한 ETag.
+        버전은 DB 에 있으므로 모든 워커가 같은 값을 만듭니다.
+        """
+        versions = self._versions
+        return '"catalog-%s"' % ".".join(str(versions.get(entity, 0)) for entity in entities)
+
+    def subscribe(self, entity: str, listener: Callable[[Session], None]) -> None:
+        listeners = self._listeners.setdefault(entity, [])
+        if listener not in listeners:
+            listeners.append(listener)
+
+    def load(self, session: Session, snapshot: bool = True) -> Optional[CatalogSnapshot]:
+        # 버전을 먼저 읽어야 그 사이의 쓰기가 다음 sync 에서 다시 반영됩니다.
+        versions = load_catalog_versions(session)
+        parts = {}
+        if snapshot:
+            for entity in CATALOG_ENTITIES:
+                parts.update(_LOADERS[entity](session))
+
+        with self._lock:
+            if snapshot:
+                self._snapshot = _with_parts(None, parts, CATALOG_ENTITIES)
+            self._versions.update(versions)
+        response_cache.invalidate(*CATALOG_ENTITIES)
+        return self._snapshot
+
+    def refresh(self, session: Session, *entities: str) -> None:
+        """
+        이 워커에서 쓰기를 commit 한 뒤 호출합니다.
+        스냅샷과 버전(ETag, 캐시 키)은 항상 함께 DB 의 최신 값으로 맞춥니다.
+        버전이 이 쓰기 하나만큼(+1)보다 많이 올랐다면 다른 워커의 쓰기도 섞여 있으므로,
+        sync 를 기다리지 않고 해당 엔티티의 리스너(검색 색인 등)를 바로 실행합니다.
+        """
+        versions = load_catalog_versions(session)
+        parts = {}
+        if self._snapshot is not None:
+            for entity in entities:
+                if entity in _LOADERS:
+                    parts.update(_LOADERS[entity](session))
+
+        with self._lock:
+            if self._snapshot is not None:
+                self._snapshot = _with_parts(self._snapshot, parts, entities)
+            skipped = []
+            for entity in entities:
+                seen = self._versions.get(entity)
+                version = versions.get(entity)
+                if version is None or (seen is not None and version <= seen):
+                    # 이 워커의 다른 refresh 가 이미 더 새 버전을 반영함
+                    continue
+                if seen is None or version != seen + 1:
+                    skipped.append(entity)
+                self._versions[entity] = version
+
+        for entity in skipped:
+            for listener in self._listeners.get(entity, ()):
+                listener(session)
+
+        # 새 스냅샷이 보인 뒤에 무효화해야 이전 데이터가 새 버전으로 캐시되지 않습니다.
+        response_cache.invalidate(*entities)
+
+    def _refresh_once(self, entities: Tuple[str, ...]) -> None:
+        with Session(engine) as session:
+            self.refresh(session, *entities)
+
+    async def refresh_async(self, *entities: str) -> None:
+        """
+        async 엔드포인트(AsyncSession)에서 commit 한 뒤 호출합니다.
+        스냅샷 재구성은 DB/CPU 작업이므로 스레드풀에서 별도 동기 세션으로 실행합니다.
+        """
+        await run_in_threadpool(self._refresh_once, entities)
+
+    def sync(self, session: Session) -> List[str]:
+        """
+        DB 의 버전과 비교해 다른 워커에서 바뀐 엔티티 종류만 다시 읽습니다.
+        바뀐 것이 없으면 버전 조회 한 번으로 끝납니다.
+        """
+        versions = load_catalog_versions(session)
+        changed = [
+            entity
+            for entity in SYNCED_ENTITIES
+            if entity in versions and versions[entity] != self._versions.get(entity)
+        ]
+        if not changed:
+            return changed
+
+        seen = {entity: self._versions.get(entity) for entity in changed}
+        loaded = {}
+        if self._snapshot is not None:
+            for entity in changed:
+                if entity in _LOADERS:
+                    loaded[entity] = _LOADERS[entity](session)
+
+        with self._lock:
+            # 읽는 동안 이 워커의 쓰기가 더 새 데이터를 반영했다면 덮어쓰지 않습니다.
+            changed = [e for e in changed if self._versions.get(e) == seen[e]]
+            if self._snapshot is not None:
+                parts = {}
+                for entity in changed:
+                    parts.update(loaded.get(entity, {}))
+                self._snapshot = _with_parts(self._snapshot, parts, changed)
+            for entity in changed:
+                self._versions[entity] = versions[entity]
+
+        for entity in changed:
+            for listener in self._listeners.get(entity, ()):
+                listener(session)
+
+        response_cache.invalidate(*changed)
+        logger.info("Catalog synced: %s", ", ".join(changed))
+        return changed
+
+    def _sync_once(self) -> None:
+        with Session(engine) as session:
+            self.sync(session)
+
+    async def run_sync_loop(self, interval: float) -> None:
+        """
+        lifespan 에서 태스크로 실행합니다. 요청 경로에는 DB 조회를 추가하지 않습니다.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await run_in_threadpool(self._sync_once)
+            except Exception:
+                logger.exception("Catalog sync failed")
+
+
+def render_cooking_setting(setting: CookingSetting, color_theme, tips) -> dict:
+    """
+    GET /cooking-settings 응답 형태.
+    """
+    return {
+        "id": setting.id,
+        "temperature": setting.temperature,
+        "cooking_time": setting.cooking_time,
+        "color_theme": color_theme,
+        "tips": [{"tip_type": tip.tip_type, "message": tip.message} for tip in tips],
+    }
+
+
+class CookingSettingLookup:
+    """
+    GET /cooking-settings 응답을 (재료 id, 조리도구 id) 조합별로 미리 만들어 둔 표 (워커 단위).
+    조리 설정/팁/재료가 바뀌면 해당 조합만 다시 만듭니다.
+    반환하는 dict 는 공유 객체이므로 수정하면 안 됩니다.
+    """
+
+    def __init__(self):
+        # 부분 갱신과 전체 갱신이 서로의 결과를 덮어쓰지 않도록 DB 조회까지 락 안에서 수행합니다.
+        self._lock = threading.Lock()
+        self._payloads: Optional[Dict[Tuple[int, int], dict]] = None
+
+    def is_ready(self) -> bool:
+        return self._payloads is not None
+
+    def get(self, ingredient_id: int, cooking_tool_id: int) -> Optional[dict]:
+        return self._payloads.get((ingredient_id, cooking_tool_id))
+
+    def build(self, session: Session) -> None:
+        with self._lock:
+            self._payloads = self._load(session)
+
+    def rebuild(self, session: Session, *pairs: Tuple[int, int]) -> None:
+        with self._lock:
+            if self._payloads is None:
+                return
+            for ingredient_id, cooking_tool_id in set(pairs):
+                loaded = self._load(
+                    session,
+                    CookingSetting.ingredient_id == ingredient_id,
+                    CookingSetting.cooking_tool_id == cooking_tool_id,
+                )
+                payload = loaded.get((ingredient_id, cooking_tool_id))
+                if payload is None:
+                    self._payloads.pop((ingredient_id, cooking_tool_id), None)
+                else:
+                    self._payloads[(ingredient_id, cooking_tool_id)] = payload
+
+    def rebuild_setting(self, session: Session, cooking_setting_id: int) -> None:
+        setting = session.get(CookingSetting, cooking_setting_id)
+        if setting is not None:
+            self.rebuild(session, (setting.ingredient_id, setting.cooking_tool_id))
+
+    def rebuild_ingredient(self, session: Session, ingredient_id: int) -> None:
+        with self._lock:
+            if self._payloads is None:
+                return
+            loaded = self._load(session, CookingSetting.ingredient_id == ingredient_id)
+            for pair in [pair for pair in self._payloads if pair[0] == ingredient_id]:
+                if pair not in loaded:
+                    del self._payloads[pair]
+            self._payloads.update(loaded)
+
+    def _load(self, session: Session, *conditions) -> Dict[Tuple[int, int], dict]:
+        # 같은 조합이 여러 개면 가장 먼저 만든 설정을 사용 (스냅샷과 동일)
+        settings = {}
+        query = select(CookingSetting).where(*conditions).order_by(CookingSetting.id)
+        for setting in session.exec(query).all():
+            settings.setdefault((setting.ingredient_id, setting.cooking_tool_id), setting)
+        if not settings:
+            return {}
+
+        tip_query = select(CookingSettingTip).order_by(CookingSettingTip.id)
+        color_query = select(Ingredient.id, Ingredient.color_theme)
+        if conditions:
+            tip_query = tip_query.where(
+                CookingSettingTip.cooking_setting_id.in_([s.id for s in settings.values()])
+            )
+            color_query = color_query.where(Ingredient.id.in_({pair[0] for pair in settings}))
+
+        tips: Dict[int, list] = {}
+        for tip in session.exec(tip_query).all():
+            tips.setdefault(tip.cooking_setting_id, []).append(tip)
+        colors = dict(session.exec(color_query).all())
+
+        return {
+            pair: render_cooking_setting(setting, colors[pair[0]], tips.get(setting.id, ()))
+            for pair, setting in settings.items()
+            # 재료가 없는 설정은 조회 시 404 (스냅샷과 동일)
+            if pair[0] in colors
+        }
+
+
+# 싱글톤 인스턴스
+catalog = CatalogStore()
+cooking_setting_lookup = CookingSettingLookup()
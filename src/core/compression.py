@@ -0,0 +1,175 @@
+import gzip
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성: 없으면 gzip 만 사용
+    brotli = None
+
+# 요청마다 압축할 때의 수준 (지연 시간 우선)
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+# 캐시할 본문을 한 번만 압축할 때의 수준 (크기 우선)
+PRECOMPRESSED_GZIP_LEVEL = 9
+PRECOMPRESSED_BROTLI_QUALITY = 11
+
+# 선호 순서 (q 값이 같으면 앞쪽)
+SUPPORTED_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "image/svg+xml")
+
+# 압축본의 ETag 에 붙이는 접미사 대상 (brotli 가 없는 워커도 br 접미사는 알아봐야 함)
+ETAG_ENCODINGS = ("br", "gzip")
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Accept-Encoding 에서 사용할 압축 방식을 고릅니다 (없으면 None = 압축 안 함).
+    q 값을 따르고 q=0 은 거부로 취급하며, * 는 따로 적지 않은 방식에 적용합니다.
+    """
+    if not accept_encoding:
+        return None
+
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[coding.strip()] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(body: bytes, encoding: str, precompressed: bool = False) -> bytes:
+    if encoding == "br":
+        quality = PRECOMPRESSED_BROTLI_QUALITY if precompressed else BROTLI_QUALITY
+        return brotli.compress(body, quality=quality)
+    level = PRECOMPRESSED_GZIP_LEVEL if precompressed else GZIP_LEVEL
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+class CompressedBody:
+    """
+    인코딩된 응답 본문과 압축본을 함께 보관합니다 (캐시 값으로 사용).
+    압축은 방식별로 처음 요청될 때 한 번만 하므로 카탈로그 버전당 CPU 비용을 한 번만 냅니다.
+    """
+
+    __slots__ = ("identity", "_variants")
+
+    def __init__(self, body: bytes):
+        self.identity = body
+        self._variants: Dict[str, bytes] = {}
+
+    def get(self, encoding: Optional[str]) -> bytes:
+        if encoding is None:
+            return self.identity
+        variant = self._variants.get(encoding)
+        if variant is None:
+            # 동시에 처음 요청되면 두 번 압축될 수 있지만 결과는 같습니다.
+            variant = compress(self.identity, encoding, precompressed=True)
+            self._variants[encoding] = variant
+        return variant
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    return bool(content_type) and content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def add_vary(headers: MutableHeaders) -> None:
+    vary = headers.get("vary")
+    if vary is None:
+        headers["Vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        headers["Vary"] = f"{vary}, Accept-Encoding"
+
+
+def encoding_etag(etag: str, encoding: str) -> str:
+    """
+    압축본은 바이트가 다른 별도 표현이므로 강한 ETag 에 인코딩을 붙입니다 ("<tag>" -> "<tag>-gzip").
+    """
+    if not etag.endswith('"'):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def strip_encoding_etag(etag: str) -> str:
+    """encoding_etag 로 붙인 접미사를 떼어 원래 ETag 로 되돌립니다 (If-None-Match 비교용)."""
+    for encoding in ETAG_ENCODINGS:
+        suffix = f'-{encoding}"'
+        if etag.endswith(suffix):
+            return etag[: -len(suffix)] + '"'
+    return etag
+
+
+def set_content_encoding(headers: MutableHeaders, encoding: str) -> None:
+    headers["Content-Encoding"] = encoding
+    etag = headers.get("etag")
+    if etag is not None:
+        headers["ETag"] = encoding_etag(etag, encoding)
+
+
+class CompressionMiddleware:
+    """
+    minimum_size 이상인 JSON/텍스트 응답을 Accept-Encoding 에 맞춰 압축합니다.
+    이미 Content-Encoding 이 있는 응답(미리 압축한 캐시 본문 등)과 스트리밍 응답은 그대로 보냅니다.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        start: Optional[Message] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, passthrough
+
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if passthrough or message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+
+            # 첫 본문 조각에서 압축 여부를 정합니다.
+            passthrough = True
+            headers = MutableHeaders(raw=list(start["headers"]))
+            body = message.get("body", b"")
+            eligible = (
+                "content-encoding" not in headers
+                and is_compressible(headers.get("content-type"))
+                and not message.get("more_body", False)
+                and len(body) >= self.minimum_size
+            )
+
+            if eligible:
+                add_vary(headers)
+                if encoding is not None:
+                    body = compress(body, encoding)
+                    set_content_encoding(headers, encoding)
+                    headers["Content-Length"] = str(len(body))
+                    message = {**message, "body": body}
+
+            await send({**start, "headers": headers.raw})
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
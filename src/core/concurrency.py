@@ -0,0 +1,110 @@
+import threading
+import time
+from typing import Callable, TypeVar
+
+import anyio.to_thread
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from core.config import settings
+from core.metrics import LatencyHistogram
+
+T = TypeVar("T")
+
+
+class ConcurrencyLimitExceeded(RuntimeError):
+    pass
+
+
+class ConcurrencyLimiter:
+    """
+    DB 커넥션 checkout 단계에서 워커의 동시 처리량을 제한합니다.
+    스냅샷/캐시/304 처럼 DB 를 쓰지 않는 요청은 checkout 이 없으므로 제한받지 않습니다.
+
+    풀에 여유가 있으면 바로 통과하고, 풀이 가득 찬 경우에만 최대 queue_size 개의 checkout 이
+    풀의 pool_timeout(DB_POOL_TIMEOUT_SECONDS) 동안 반납을 기다립니다.
+    대기열이 가득 차면 ConcurrencyLimitExceeded, 기다리다 시간이 지나면 SQLAlchemy 의 TimeoutError 가 나며
+    둘 다 server_busy_handler 가 503 + Retry-After 로 응답합니다.
+    동기 엔드포인트의 스레드에서도 호출되므로 잠금으로 보호합니다.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._waiting = 0
+
+        self.admitted = 0
+        self.queued = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+        self.max_queue_depth = 0
+        # 풀이 가득 차 기다린 checkout 만 기록합니다 (바로 처리된 checkout 제외)
+        self.wait_latency = LatencyHistogram()
+
+    def checkout(self, connect: Callable[[], T], exhausted: bool) -> T:
+        """exhausted 는 checkout 직전에 풀의 커넥션이 모두 사용 중이었는지 여부입니다."""
+        with self._lock:
+            if not exhausted:
+                self.admitted += 1
+            elif self._waiting >= self.queue_size:
+                self.rejected_queue_full += 1
+                raise ConcurrencyLimitExceeded("queue full")
+            else:
+                self._waiting += 1
+                self.queued += 1
+                self.max_queue_depth = max(self.max_queue_depth, self._waiting)
+        if not exhausted:
+            return connect()
+
+        started = time.monotonic()
+        try:
+            connection = connect()
+        except PoolTimeoutError:
+            with self._lock:
+                self.rejected_timeout += 1
+            raise
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+        with self._lock:
+            self.admitted += 1
+        self.wait_latency.record((time.monotonic() - started) * 1000)
+        return connection
+
+    def stats(self) -> dict:
+        return {
+            "queue_depth": self._waiting,
+            "max_queue_depth": self.max_queue_depth,
+            "queue_size": self.queue_size,
+            "queue_timeout_seconds": settings.DB_POOL_TIMEOUT_SECONDS,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+            "wait": self.wait_latency.snapshot(),
+        }
+
+
+def align_thread_limiter(limit: int) -> None:
+    """
+    동기 엔드포인트가 쓰는 AnyIO 스레드풀이 limit 보다 작지 않게 맞춥니다.
+    이벤트 루프 안(lifespan)에서 호출해야 합니다.
+    """
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    if limiter.total_tokens < limit:
+        limiter.total_tokens = limit
+
+
+async def server_busy_handler(request: Request, exc: Exception) -> JSONResponse:
+    """checkout 대기열이 가득 찼거나 풀 대기 시간이 지난 요청에 503 + Retry-After 로 응답합니다."""
+    return JSONResponse(
+        {"detail": "Server is busy, please retry later"},
+        status_code=503,
+        headers={"Retry-After": str(settings.CONCURRENCY_RETRY_AFTER_SECONDS)},
+    )
+
+
+# 싱글톤 인스턴스
+concurrency_limiter = ConcurrencyLimiter(queue_size=settings.CONCURRENCY_QUEUE_SIZE)
@@ -19,6 +19,59 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "SECRET_KEY"
     ALGORITHM: str = "HS256"
 
+    # 재료 검색을 인메모리 색인으로 처리할지 여부 (False 면 DB LIKE 검색)
+    SEARCH_INDEX_ENABLED: bool = True
+
+    # 참조 데이터(카테고리/도구/재료/조리 설정)를 메모리 스냅샷에서 제공할지 여부
+    CATALOG_SNAPSHOT_ENABLED: bool = True
+
+    # 다른 워커의 참조 데이터 변경을 확인하는 주기 (초, 0 이하면 확인하지 않음)
+    CATALOG_SYNC_INTERVAL_SECONDS: float = 2.0
+
+    # 참조 데이터 GET 응답의 Cache-Control (ETag 로 재검증)
+    CATALOG_CACHE_CONTROL: str = "public, max-age=60, must-revalidate"
+
+    # 읽기 엔드포인트 결과 캐시 (워커 단위 LRU + TTL)
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1024
+    RESPONSE_CACHE_TTL_SECONDS: int = 300
+
+    # 응답 압축 (gzip, brotli 패키지가 있으면 br 도 사용). 이보다 작은 본문은 압축하지 않음 (bytes)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+
+    # DB 커넥션 풀 (워커당, 동기/비동기 엔진 각각)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 3600
+    # 끊긴 연결 처리: pre_ping 은 checkout 마다 ping 한 번 (왕복 추가),
+    # optimistic 은 ping 없이 쿼리 실패로 감지해 풀을 무효화하고 GET/HEAD 는 한 번 재시도
+    DB_DISCONNECT_HANDLING: Literal["pre_ping", "optimistic"] = "pre_ping"
+
+    # DB 커넥션 checkout 단계의 동시 처리 제한 (워커당, DB 를 쓰지 않는 요청은 제외)
+    # 풀이 가득 차면 최대 CONCURRENCY_QUEUE_SIZE 개가 DB_POOL_TIMEOUT_SECONDS 동안 기다리고,
+    # 대기열이 차거나 시간이 지나면 503 + Retry-After
+    CONCURRENCY_LIMIT_ENABLED: bool = True
+    CONCURRENCY_QUEUE_SIZE: int = 100
+    CONCURRENCY_RETRY_AFTER_SECONDS: int = 1
+
+    # 읽기 복제본 (SQLAlchemy URL, 비우면 사용 안 함). 예: postgresql://user:pw@replica/db, sqlite:///replica.db
+    # 읽기 전용 엔드포인트만 사용하고, 지연이 DB_REPLICA_MAX_LAG_SECONDS 를 넘거나 확인에 실패하면 primary 로 보냄
+    DB_REPLICA_URL: str = ""
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5.0
+    DB_REPLICA_CHECK_INTERVAL_SECONDS: float = 1.0
+    # 쓰기 요청 뒤 이 시간 동안 같은 클라이언트의 읽기는 primary 에서 처리 (쿠키로 전달, 초)
+    DB_READ_YOUR_WRITES_SECONDS: float = 5.0
+
+    # SQLite 사용 (local 은 항상 사용, 그 외 환경은 SQLITE_ENABLED=true 인 단일 노드 배포)
+    SQLITE_ENABLED: bool = False
+    SQLITE_PATH: str = "test.db"
+    # WAL/synchronous=NORMAL 등 연결 설정과 GET 전용 읽기 풀 사용 여부
+    SQLITE_TUNED: bool = True
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    SQLITE_CACHE_SIZE_KIB: int = 64 * 1024
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+
     # POSTGRES_SERVER: str
     # POSTGRES_PORT: int = 5432
     # POSTGRES_USER: str
@@ -1,9 +1,19 @@
-from sqlalchemy import QueuePool, create_engine, Engine
+from sqlalchemy import create_engine, Engine, make_url
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import Session, select
 
+from core.concurrency import concurrency_limiter
 from core.config import settings
 from core.enums import UserRole
+from core.pool_stats import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    pool_monitor,
+)
+from core.sqlite import tune_sqlite
 from models.common import (
+    CatalogTombstone,
+    CatalogVersion,
     Category,
     Ingredient,
     CookingSettingTip,
@@ -18,22 +28,96 @@ from models.common import (
 )
 from models.user import User
 
-if settings.ENVIRONMENT == "local":
+# 풀 설정은 동기/비동기 엔진이 같은 값을 사용합니다 (각각 워커당 한 벌).
+pool_options = dict(
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=settings.DB_DISCONNECT_HANDLING == "pre_ping",
+)
+
+dbschema = "db,public"
+
+# async def 엔드포인트는 async_engine(AsyncSession)을 사용해 이벤트 루프를 막지 않습니다.
+# 읽기 전용 엔드포인트는 read_engine 을 사용합니다 (SQLite 튜닝 모드에서만 별도 풀).
+if settings.ENVIRONMENT == "local" or settings.SQLITE_ENABLED:
+    sqlite_url = f"sqlite:///{settings.SQLITE_PATH}"
     engine = create_engine(
-        "sqlite:///test.db", connect_args={"check_same_thread": False}
+        sqlite_url,
+        connect_args={"check_same_thread": False},
+        poolclass=InstrumentedQueuePool,
+        **pool_options,
+    )
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{settings.SQLITE_PATH}",
+        poolclass=InstrumentedAsyncQueuePool,
+        **pool_options,
     )
-else:
-    dbschema = "db,public"
 
+    if settings.SQLITE_TUNED:
+        tune_sqlite(engine)
+        tune_sqlite(async_engine.sync_engine)
+        read_engine = create_engine(
+            sqlite_url,
+            connect_args={"check_same_thread": False},
+            poolclass=InstrumentedQueuePool,
+            **pool_options,
+        )
+        tune_sqlite(read_engine, read_only=True)
+    else:
+        read_engine = engine
+else:
     engine = create_engine(
         "postgresql://",
-        poolclass=QueuePool,
-        pool_pre_ping=True,
-        pool_size=10,
-        max_overflow=20,
-        pool_recycle=3600,
+        poolclass=InstrumentedQueuePool,
         connect_args={"options": f"-c search_path={dbschema}"},
+        **pool_options,
     )
+    # 접속 정보는 동기 엔진과 같이 PG* 환경 변수에서 읽습니다.
+    async_engine = create_async_engine(
+        "postgresql+asyncpg://",
+        poolclass=InstrumentedAsyncQueuePool,
+        connect_args={"server_settings": {"search_path": dbschema}},
+        **pool_options,
+    )
+    read_engine = engine
+
+
+def create_replica_engine(url: str) -> Engine:
+    if make_url(url).get_backend_name() == "sqlite":
+        replica = create_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            poolclass=InstrumentedQueuePool,
+            **pool_options,
+        )
+        if settings.SQLITE_TUNED:
+            tune_sqlite(replica, read_only=True)
+        return replica
+
+    return create_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        connect_args={"options": f"-c search_path={dbschema}"},
+        **pool_options,
+    )
+
+
+# 읽기 복제본 (없으면 None). 어떤 읽기를 보낼지는 core.read_routing 이 정합니다.
+replica_engine = create_replica_engine(settings.DB_REPLICA_URL) if settings.DB_REPLICA_URL else None
+
+pool_monitor.attach("sync", engine)
+pool_monitor.attach("async", async_engine.sync_engine)
+if read_engine is not engine:
+    pool_monitor.attach("read", read_engine)
+if replica_engine is not None:
+    pool_monitor.attach("replica", replica_engine)
+
+# DB 를 쓰는 요청만 커넥션 checkout 단계에서 제한합니다 (core.concurrency).
+if settings.CONCURRENCY_LIMIT_ENABLED:
+    for pool_engine in {engine, async_engine.sync_engine, read_engine, replica_engine} - {None}:
+        pool_engine.pool.limiter = concurrency_limiter
 
 
 async def init_db(session: Session, engine: Engine) -> None:
@@ -50,6 +134,8 @@ async def init_db(session: Session, engine: Engine) -> None:
     NutritionTag.metadata.create_all(engine)
     Ingredient.metadata.create_all(engine)
     Timer.metadata.create_all(engine)
+    CatalogVersion.metadata.create_all(engine)
+    CatalogTombstone.metadata.create_all(engine)
 
     # Check if superuser exists
     superuser = session.exec(
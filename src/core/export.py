@@ -0,0 +1,195 @@
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event, insert, update
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import Session, select
+
+from core.compression import CompressedBody
+from models.common import (
+    CatalogTombstone,
+    CatalogVersion,
+    Category,
+    CookingSetting,
+    CookingSettingTip,
+    CookingTool,
+    Ingredient,
+    IngredientNutritionLink,
+    NutritionTag,
+    SyncTracked,
+)
+
+# catalog_versions 에서 내보내기 버전(전체 참조 데이터의 단조 증가 변경 번호)을 담는 행
+EXPORT_VERSION_ENTITY = "export"
+
+# 내보내기 순서 (클라이언트가 외래 키 순서대로 적용할 수 있도록)
+EXPORT_MODELS = (
+    ("categories", Category),
+    ("cooking_tools", CookingTool),
+    ("nutrition_tags", NutritionTag),
+    ("ingredients", Ingredient),
+    ("cooking_settings", CookingSetting),
+    ("cooking_setting_tips", CookingSettingTip),
+)
+
+_SESSION_VERSION_KEY = "export_sync_version"
+
+
+def next_export_version(session: OrmSession) -> int:
+    """
+    현재 트랜잭션에 내보내기 버전을 하나 할당합니다 (트랜잭션당 한 번).
+    catalog_versions 행을 먼저 갱신해 잠그므로 동시에 쓰는 트랜잭션은 커밋 순서대로 더 큰 버전을 받습니다.
+    """
+    version = session.info.get(_SESSION_VERSION_KEY)
+    if version is not None:
+        return version
+
+    connection = session.connection()
+    table = CatalogVersion.__table__
+    result = connection.execute(
+        update(table)
+        .where(table.c.entity == EXPORT_VERSION_ENTITY)
+        .values(version=table.c.version + 1)
+    )
+    if result.rowcount == 0:
+        connection.execute(insert(table).values(entity=EXPORT_VERSION_ENTITY, version=1))
+    version = connection.execute(
+        select(table.c.version).where(table.c.entity == EXPORT_VERSION_ENTITY)
+    ).scalar_one()
+
+    session.info[_SESSION_VERSION_KEY] = version
+    return version
+
+
+@event.listens_for(OrmSession, "before_flush")
+def _track_catalog_changes(session: OrmSession, flush_context, instances) -> None:
+    """
+    참조 데이터가 추가/수정되면 updated_at, sync_version 을 채우고 삭제되면 tombstone 을 남깁니다.
+    영양 태그 연결이 바뀌면 재료의 sync_version 을 올립니다.
+    """
+    changed = [
+        obj
+        for obj in (*session.new, *session.dirty)
+        if isinstance(obj, SyncTracked) and (obj in session.new or session.is_modified(obj))
+    ]
+    deleted = [obj for obj in session.deleted if isinstance(obj, SyncTracked)]
+    linked_ingredient_ids = {
+        obj.ingredient_id
+        for obj in (*session.new, *session.deleted)
+        if isinstance(obj, IngredientNutritionLink)
+    }
+    if not (changed or deleted or linked_ingredient_ids):
+        return
+
+    version = next_export_version(session)
+    now = datetime.utcnow()
+
+    for obj in changed:
+        obj.updated_at = now
+        obj.sync_version = version
+
+    for obj in deleted:
+        if obj.id is not None:
+            session.add(
+                CatalogTombstone(
+                    entity=obj.__tablename__, row_id=obj.id, sync_version=version, deleted_at=now
+                )
+            )
+
+    linked_ingredient_ids.discard(None)
+    if linked_ingredient_ids:
+        table = Ingredient.__table__
+        session.connection().execute(
+            update(table)
+            .where(table.c.id.in_(linked_ingredient_ids))
+            .values(sync_version=version, updated_at=now)
+        )
+
+
+@event.listens_for(OrmSession, "after_transaction_end")
+def _reset_export_version(session: OrmSession, transaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(_SESSION_VERSION_KEY, None)
+
+
+def load_export_version(session: Session) -> int:
+    version = session.exec(
+        select(CatalogVersion.version).where(CatalogVersion.entity == EXPORT_VERSION_ENTITY)
+    ).first()
+    return version or 0
+
+
+def build_export(session: Session, version: int, since: Optional[int] = None) -> dict:
+    """
+    version 시점까지의 참조 데이터를 내보냅니다.
+    since 가 있으면 since 이후에 바뀐 행과 삭제된 행의 id 만 담습니다 (delta).
+    version 보다 뒤에 커밋된 변경은 다음 동기화에서 내려가도록 제외합니다.
+    """
+    data: Dict[str, List[dict]] = {}
+    for entity, model in EXPORT_MODELS:
+        query = select(model).where(model.sync_version <= version).order_by(model.id)
+        if since is not None:
+            query = query.where(model.sync_version > since)
+        data[entity] = [row.model_dump(mode="json") for row in session.exec(query)]
+
+    # 재료는 영양 태그 id 목록을 함께 내려줍니다.
+    ingredients = data["ingredients"]
+    if ingredients:
+        links = select(IngredientNutritionLink).order_by(
+            IngredientNutritionLink.ingredient_id, IngredientNutritionLink.nutrition_tag_id
+        )
+        if since is not None:
+            links = links.where(
+                IngredientNutritionLink.ingredient_id.in_([row["id"] for row in ingredients])
+            )
+        tag_ids: Dict[int, list] = {}
+        for link in session.exec(links):
+            tag_ids.setdefault(link.ingredient_id, []).append(link.nutrition_tag_id)
+        for row in ingredients:
+            row["nutrition_tag_ids"] = tag_ids.get(row["id"], [])
+
+    deleted: Dict[str, List[int]] = {entity: [] for entity, _ in EXPORT_MODELS}
+    if since is not None:
+        tombstones = session.exec(
+            select(CatalogTombstone.entity, CatalogTombstone.row_id)
+            .where(CatalogTombstone.sync_version > since, CatalogTombstone.sync_version <= version)
+            .order_by(CatalogTombstone.id)
+        )
+        for entity, row_id in tombstones:
+            if entity in deleted:
+                deleted[entity].append(row_id)
+
+    return {
+        "version": version,
+        "since": since,
+        "full": since is None,
+        "data": data,
+        "deleted": deleted,
+    }
+
+
+class FullExportCache:
+    """
+    전체 내보내기 결과를 버전 하나만 보관합니다 (워커 단위).
+    버전이 같으면 테이블을 다시 읽거나 인코딩/압축하지 않습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entry: Optional[Tuple[int, CompressedBody]] = None
+
+    def get(self, version: int) -> Optional[CompressedBody]:
+        entry = self._entry
+        if entry is None or entry[0] != version:
+            return None
+        return entry[1]
+
+    def set(self, version: int, body: CompressedBody) -> None:
+        with self._lock:
+            if self._entry is None or self._entry[0] <= version:
+                self._entry = (version, body)
+
+
+# 싱글톤 인스턴스
+full_export_cache = FullExportCache()
@@ -0,0 +1,37 @@
+import threading
+from bisect import bisect_left
+from typing import Tuple
+
+# 지연 시간 히스토그램 구간 상한 (ms). 마지막 구간은 그보다 긴 값
+DEFAULT_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+
+class LatencyHistogram:
+    """
+    지연 시간(ms)의 개수/평균/최대와 구간별 분포를 집계합니다 (워커 단위, 스레드 안전).
+    """
+
+    def __init__(self, buckets_ms: Tuple[float, ...] = DEFAULT_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self._lock = threading.Lock()
+        self._counts = [0] * (len(buckets_ms) + 1)
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+
+    def record(self, value_ms: float) -> None:
+        with self._lock:
+            self._count += 1
+            self._total_ms += value_ms
+            self._max_ms = max(self._max_ms, value_ms)
+            self._counts[bisect_left(self.buckets_ms, value_ms)] += 1
+
+    def snapshot(self) -> dict:
+        labels = [f"<={bound}ms" for bound in self.buckets_ms] + [f">{self.buckets_ms[-1]}ms"]
+        with self._lock:
+            return {
+                "count": self._count,
+                "avg_ms": self._total_ms / self._count if self._count else 0.0,
+                "max_ms": self._max_ms,
+                "histogram": dict(zip(labels, self._counts)),
+            }
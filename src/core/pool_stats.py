@@ -0,0 +1,201 @@
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.metrics import LatencyHistogram
+
+
+class PoolStats:
+    """
+    엔진 하나의 커넥션 풀 이벤트를 집계합니다 (워커 단위).
+    checkout 지연은 풀 대기 + (켜져 있으면) pre-ping 까지 포함하고, ping 지연은 따로 기록합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkout_errors = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.disconnects = 0
+        self.max_overflow_seen = 0
+        self.checkout_latency = LatencyHistogram()
+        self.ping_latency = LatencyHistogram()
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def record_checkout(self, latency_ms: float, overflow: int) -> None:
+        self.checkout_latency.record(latency_ms)
+        with self._lock:
+            self.checkouts += 1
+            self.max_overflow_seen = max(self.max_overflow_seen, overflow)
+
+
+class _TimedCheckoutMixin:
+    """
+    checkout(connect) 에 걸린 시간을 PoolStats 에 기록하는 QueuePool 확장.
+    limiter(core.concurrency.ConcurrencyLimiter)가 있으면 풀이 가득 찼을 때의 대기 수를 제한합니다.
+    """
+
+    stats: Optional[PoolStats] = None
+    limiter = None
+
+    def connect(self):
+        limiter = self.limiter
+        if limiter is None:
+            return self._timed_connect()
+        exhausted = self._max_overflow > -1 and self.checkedout() >= self.size() + self._max_overflow
+        return limiter.checkout(self._timed_connect, exhausted)
+
+    def _timed_connect(self):
+        stats = self.stats
+        if stats is None:
+            return super().connect()
+
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except Exception:
+            stats.increment("checkout_errors")
+            raise
+        stats.record_checkout((time.perf_counter() - started) * 1000, max(self.overflow(), 0))
+        return connection
+
+    def recreate(self):
+        # dispose() 등으로 풀이 다시 만들어져도 같은 집계를 이어갑니다.
+        pool = super().recreate()
+        pool.stats = self.stats
+        pool.limiter = self.limiter
+        return pool
+
+
+class InstrumentedQueuePool(_TimedCheckoutMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+class PoolMonitor:
+    """
+    워커의 엔진별 PoolStats 를 모아 진단 엔드포인트에 제공합니다.
+    엔진은 Instrumented*QueuePool 을 poolclass 로 만들어야 checkout 지연이 기록됩니다.
+    """
+
+    def __init__(self):
+        self._engines: Dict[str, Engine] = {}
+        self._stats: Dict[str, PoolStats] = {}
+        self.disconnect_retries = 0
+
+    def attach(self, name: str, engine: Engine) -> None:
+        """비동기 엔진은 async_engine.sync_engine 을 넘깁니다."""
+        stats = PoolStats()
+        self._engines[name] = engine
+        self._stats[name] = stats
+        engine.pool.stats = stats
+
+        @event.listens_for(engine, "connect")
+        def _on_connect(dbapi_connection, connection_record):
+            stats.increment("connects")
+
+        @event.listens_for(engine, "checkin")
+        def _on_checkin(dbapi_connection, connection_record):
+            stats.increment("checkins")
+
+        @event.listens_for(engine, "invalidate")
+        def _on_invalidate(dbapi_connection, connection_record, exception):
+            stats.increment("invalidations")
+
+        @event.listens_for(engine, "handle_error")
+        def _on_error(context):
+            if context.is_disconnect:
+                stats.increment("disconnects")
+
+        # pre-ping 비용을 따로 보기 위해 dialect 의 ping 을 감쌉니다.
+        do_ping = engine.dialect.do_ping
+
+        def timed_ping(dbapi_connection):
+            started = time.perf_counter()
+            try:
+                return do_ping(dbapi_connection)
+            finally:
+                stats.ping_latency.record((time.perf_counter() - started) * 1000)
+
+        engine.dialect.do_ping = timed_ping
+
+    def snapshot(self) -> dict:
+        engines = {}
+        for name, engine in self._engines.items():
+            pool = engine.pool
+            stats = self._stats[name]
+            engines[name] = {
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+                "max_overflow": pool._max_overflow,
+                "timeout_seconds": pool.timeout(),
+                "recycle_seconds": pool._recycle,
+                "pre_ping": pool._pre_ping,
+                "connects": stats.connects,
+                "checkouts": stats.checkouts,
+                "checkout_errors": stats.checkout_errors,
+                "checkins": stats.checkins,
+                "invalidations": stats.invalidations,
+                "disconnects": stats.disconnects,
+                "max_overflow_seen": stats.max_overflow_seen,
+                "checkout_latency": stats.checkout_latency.snapshot(),
+                "ping_latency": stats.ping_latency.snapshot(),
+            }
+        return {
+            "pid": os.getpid(),
+            "engines": engines,
+            "disconnect_retries": self.disconnect_retries,
+        }
+
+
+# 싱글톤 인스턴스
+pool_monitor = PoolMonitor()
+
+
+class DisconnectRetryMiddleware:
+    """
+    pre-ping 을 끈 낙관적 처리용 미들웨어.
+    끊긴 연결은 쿼리 실패로 감지되고 SQLAlchemy 가 해당 연결과 그 이전의 풀 연결을 모두 무효화합니다.
+    아직 응답을 보내기 전이고 GET/HEAD 요청이면 새 연결로 한 번 다시 처리하고, 쓰기 요청은 그대로 실패시킵니다.
+    """
+
+    def __init__(self, app: ASGIApp, monitor: PoolMonitor):
+        self.app = app
+        self.monitor = monitor
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal started
+            started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except DBAPIError as e:
+            if started or not e.connection_invalidated:
+                raise
+            self.monitor.disconnect_retries += 1
+            await self.app(scope, receive, send)
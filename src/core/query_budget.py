@@ -0,0 +1,98 @@
+import logging
+from contextvars import ContextVar
+from typing import Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_HEADER = "X-Query-Count"
+# 쿼리 수는 내부 구조를 드러내므로 개발/테스트 환경에서만 응답 헤더로 보냅니다.
+QUERY_COUNT_HEADER_ENVIRONMENTS = ("local", "test")
+
+
+class QueryBudgetExceeded(RuntimeError):
+    pass
+
+
+class QueryCounter:
+    __slots__ = ("count",)
+
+    def __init__(self):
+        self.count = 0
+
+
+# 요청마다 새 카운터를 넣습니다. 스레드풀로 넘어가도 같은 객체를 공유하므로 합산됩니다.
+_current_counter: ContextVar[Optional[QueryCounter]] = ContextVar("query_counter", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    counter = _current_counter.get()
+    if counter is not None:
+        counter.count += 1
+
+
+def query_budget(max_queries: int) -> Callable:
+    """
+    엔드포인트가 한 요청에서 실행할 수 있는 최대 쿼리 수를 선언합니다.
+    캐시/스냅샷 없이 DB 로 처리하는 최악의 경우를 기준으로 잡습니다.
+
+        @router.get("/")
+        @query_budget(2)
+        def read_items(...): ...
+    """
+
+    def decorator(endpoint: Callable) -> Callable:
+        endpoint.__query_budget__ = max_queries
+        return endpoint
+
+    return decorator
+
+
+class QueryBudgetMiddleware:
+    """
+    요청별 쿼리 수를 세고, 선언된 예산을 넘으면 test 환경에서는 예외(500), 그 외에는 경고 로그를 남깁니다.
+    local/test 환경에서만 응답에 X-Query-Count 헤더를 붙입니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        counter = QueryCounter()
+        token = _current_counter.set(counter)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                self._check(scope, counter.count)
+                if settings.ENVIRONMENT in QUERY_COUNT_HEADER_ENVIRONMENTS:
+                    headers = list(message.get("headers", []))
+                    headers.append((QUERY_COUNT_HEADER.lower().encode(), str(counter.count).encode()))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_counter.reset(token)
+
+    @staticmethod
+    def _check(scope: Scope, count: int) -> None:
+        route = scope.get("route")
+        budget = getattr(getattr(route, "endpoint", None), "__query_budget__", None)
+        if budget is None or count <= budget:
+            return
+
+        detail = f"{scope['method']} {route.path}: {count} queries (budget {budget})"
+        if settings.ENVIRONMENT == "test":
+            raise QueryBudgetExceeded(detail)
+        logger.warning("Query budget exceeded - %s", detail)
@@ -0,0 +1,222 @@
+import asyncio
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import Session
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.catalog import POPULARITY_VERSION_ENTITY, catalog, load_catalog_versions
+from core.config import settings
+from core.database import read_engine, replica_engine
+
+logger = logging.getLogger(__name__)
+
+# 쓰기 응답에 붙이는 쿠키. 값은 이 시각(epoch 초)까지 읽기를 primary 로 보내라는 뜻입니다.
+READ_YOUR_WRITES_COOKIE = "welldone_rw_until"
+
+
+class WriteTracker:
+    __slots__ = ("committed",)
+
+    def __init__(self):
+        self.committed = False
+
+
+# 요청마다 새 트래커를 넣습니다. 스레드풀로 넘어가도 같은 객체를 공유하므로 커밋이 기록됩니다.
+_current_tracker: ContextVar[Optional[WriteTracker]] = ContextVar("write_tracker", default=None)
+
+
+@event.listens_for(OrmSession, "after_commit")
+def _track_commit(session):
+    # AsyncSession 도 내부 Session 으로 커밋하므로 함께 기록됩니다.
+    tracker = _current_tracker.get()
+    if tracker is not None:
+        tracker.committed = True
+
+
+# 복제본에서 마지막으로 반영한 트랜잭션 이후 경과 시간 (WAL 을 모두 반영했으면 0)
+PG_REPLICATION_LAG = text(
+    "SELECT CASE"
+    " WHEN NOT pg_is_in_recovery() THEN 0"
+    " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+    " END"
+)
+
+
+class ReadRouter:
+    """
+    읽기 전용 세션의 엔진을 고릅니다 (쓰기는 항상 primary).
+    복제본이 없거나 아래 경우에는 primary 의 읽기 엔진을 사용합니다.
+    - 쓰기 직후 read-your-writes 기간 (쿠키)
+    - 복제본 확인 실패, 또는 복제 지연이 max_lag 초과
+    - 이 워커가 아는 참조 데이터 버전을 복제본이 아직 반영하지 못함 (지연 확인 사이에도 즉시 판단)
+    복제 지연은 Postgres 면 replay 시각으로, 그 외(SQLite 파일 등)는 버전이 뒤처진 시간으로 잽니다.
+    """
+
+    def __init__(self, primary: Engine, replica: Optional[Engine], max_lag: float):
+        self.primary = primary
+        self.replica = replica
+        self.max_lag = max_lag
+        self._lock = threading.Lock()
+
+        self.healthy = False
+        self.lag_seconds: Optional[float] = None
+        self.last_checked: Optional[float] = None
+        self._replica_versions: Dict[str, int] = {}
+        self._behind_since: Optional[float] = None
+
+        self.replica_reads = 0
+        self.primary_reads = 0
+        self.read_your_writes_reads = 0
+        self.check_errors = 0
+
+    def engine_for(self, request: Optional[Request] = None) -> Engine:
+        if self.replica is None:
+            return self.primary
+
+        if request is not None and _in_write_window(request):
+            self._count("read_your_writes_reads")
+            return self.primary
+
+        if self.healthy and self.lag_seconds <= self.max_lag and not self._catalog_behind():
+            self._count("replica_reads")
+            return self.replica
+
+        self._count("primary_reads")
+        return self.primary
+
+    def _catalog_behind(self) -> bool:
+        replica_versions = self._replica_versions
+        # 인기도 버전은 타이머마다 오르므로 복제 지연(lag_seconds)으로만 판단합니다.
+        return any(
+            version > replica_versions.get(entity, version)
+            for entity, version in catalog.versions.items()
+            if entity != POPULARITY_VERSION_ENTITY
+        )
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def check(self) -> None:
+        """복제본의 참조 데이터 버전과 복제 지연을 확인합니다. 실패하면 복구될 때까지 primary 를 씁니다."""
+        if self.replica is None:
+            return
+
+        try:
+            with Session(self.replica) as session:
+                versions = load_catalog_versions(session)
+                lag = None
+                if self.replica.dialect.name == "postgresql":
+                    lag = float(session.exec(PG_REPLICATION_LAG).scalar_one())
+        except Exception:
+            if self.healthy:
+                logger.exception("Read replica check failed, routing reads to primary")
+            self.healthy = False
+            self._count("check_errors")
+            return
+
+        now = time.monotonic()
+        self._replica_versions = versions
+        if self._catalog_behind():
+            if self._behind_since is None:
+                self._behind_since = now
+        else:
+            self._behind_since = None
+        if lag is None:
+            lag = now - self._behind_since if self._behind_since is not None else 0.0
+
+        self.lag_seconds = lag
+        self.healthy = True
+        self.last_checked = time.time()
+
+    async def run_check_loop(self, interval: float) -> None:
+        """lifespan 에서 태스크로 실행합니다."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await run_in_threadpool(self.check)
+            except Exception:
+                logger.exception("Read replica check failed")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "replica_configured": self.replica is not None,
+                "healthy": self.healthy,
+                "lag_seconds": self.lag_seconds,
+                "max_lag_seconds": self.max_lag,
+                "catalog_behind": self.replica is not None and self._catalog_behind(),
+                "last_checked": self.last_checked,
+                "replica_reads": self.replica_reads,
+                "primary_reads": self.primary_reads,
+                "read_your_writes_reads": self.read_your_writes_reads,
+                "check_errors": self.check_errors,
+            }
+
+
+def _in_write_window(request: Request) -> bool:
+    until = request.cookies.get(READ_YOUR_WRITES_COOKIE)
+    if not until:
+        return False
+    try:
+        return float(until) > time.time()
+    except ValueError:
+        return False
+
+
+class ReadYourWritesMiddleware:
+    """
+    DB 커밋이 있었던 성공 응답에 read-your-writes 쿠키를 붙입니다 (로그인처럼 쓰기가 없는 POST 제외).
+    쿠키는 워커와 무관하게 전달되므로 다른 워커로 간 다음 읽기도 primary 에서 처리됩니다.
+    """
+
+    def __init__(self, app: ASGIApp, window_seconds: float):
+        self.app = app
+        self.window_seconds = window_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        tracker = WriteTracker()
+        token = _current_tracker.set(tracker)
+
+        async def send_wrapper(message: Message) -> None:
+            if (
+                message["type"] == "http.response.start"
+                and message["status"] < 400
+                and tracker.committed
+            ):
+                until = time.time() + self.window_seconds
+                cookie = (
+                    f"{READ_YOUR_WRITES_COOKIE}={until:.3f}; Max-Age={int(self.window_seconds) + 1};"
+                    " Path=/; HttpOnly; SameSite=Lax"
+                )
+                headers = list(message.get("headers", []))
+                headers.append((b"set-cookie", cookie.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_tracker.reset(token)
+
+
+# 싱글톤 인스턴스
+read_router = ReadRouter(
+    primary=read_engine,
+    replica=replica_engine,
+    max_lag=settings.DB_REPLICA_MAX_LAG_SECONDS,
+)
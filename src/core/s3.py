@@ -4,6 +4,7 @@ from typing import Optional
 import boto3
 from botocore.config import Config
 from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
 
 from core.config import settings
 
@@ -50,7 +51,9 @@ class ObjectStorage:
 
             filename = self._generate_filename(file.filename, folder)
 
-            self.s3.put_object(
+            # boto3 는 동기 호출이므로 이벤트 루프를 막지 않도록 스레드풀에서 실행
+            await run_in_threadpool(
+                self.s3.put_object,
                 Bucket=self.bucket,
                 Key=filename,
                 Body=contents,
@@ -0,0 +1,73 @@
+import random
+from typing import List, Sequence, Type
+
+from sqlalchemy import func
+from sqlmodel import Session, SQLModel, select
+
+# id 구간 추출을 몇 번까지 시도할지 (id 에 빈 곳이 많으면 나머지는 ORDER BY random() 으로 채움)
+SAMPLE_MAX_ROUNDS = 4
+# 삭제된 id 를 감안해 한 번에 필요한 개수보다 넉넉히 뽑는 배수
+SAMPLE_OVERDRAW = 2
+
+
+def sample_rows(
+    session: Session,
+    model: Type[SQLModel],
+    limit: int,
+    rng: random.Random,
+    options: Sequence = (),
+) -> List[SQLModel]:
+    """
+    정수 기본 키 id 를 가진 테이블에서 limit 개를 무작위로 가져옵니다.
+    min/max(id) 구간에서 id 를 뽑아 IN 조회로 확인하므로(기각 추출) 테이블 전체를 정렬하지 않습니다.
+    결과 순서도 무작위이며, 같은 데이터와 같은 rng 상태면 같은 결과를 돌려줍니다.
+    id 를 모두 고른 뒤 한 번에 행을 읽으므로 options(eager loading)도 한 번만 실행됩니다.
+    """
+    if limit <= 0:
+        return []
+
+    # min/max 를 한 SELECT 에 같이 쓰면 SQLite 가 색인 최적화를 못 하므로 서브쿼리로 나눕니다.
+    low, high = session.exec(
+        select(
+            select(func.min(model.id)).scalar_subquery(),
+            select(func.max(model.id)).scalar_subquery(),
+        )
+    ).one()
+    if low is None:
+        return []
+
+    span = high - low + 1
+    order: List[int] = []
+    tried = set()
+
+    for _ in range(SAMPLE_MAX_ROUNDS):
+        needed = limit - len(order)
+        if needed <= 0 or len(tried) >= span:
+            break
+
+        draw = min(needed * SAMPLE_OVERDRAW, span - len(tried))
+        candidates = []
+        while len(candidates) < draw:
+            candidate = rng.randint(low, high)
+            if candidate not in tried:
+                tried.add(candidate)
+                candidates.append(candidate)
+
+        existing = set(session.exec(select(model.id).where(model.id.in_(candidates))).all())
+        for candidate in candidates:
+            if candidate in existing and len(order) < limit:
+                order.append(candidate)
+
+    if len(order) < limit and len(tried) < span:
+        # id 가 매우 듬성듬성한 경우 (구간의 id 를 모두 확인했다면 더 찾을 행이 없음)
+        query = select(model.id).order_by(func.random()).limit(limit - len(order))
+        if order:
+            query = query.where(model.id.not_in(order))
+        order.extend(session.exec(query).all())
+
+    if not order:
+        return []
+
+    rows = session.exec(select(model).options(*options).where(model.id.in_(order))).all()
+    by_id = {row.id: row for row in rows}
+    return [by_id[row_id] for row_id in order if row_id in by_id]
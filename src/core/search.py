@@ -0,0 +1,810 @@
+import bisect
+import heapq
+import threading
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from models.common import CookingSetting, Ingredient, Timer
+from models.response import IngredientSearchResponse
+from utils.utils import (
+    decompose_jamo,
+    edit_distance,
+    get_chosung,
+    has_jamo,
+    is_chosung,
+)
+
+# 역색인에 사용하는 n-gram 길이 (n 보다 짧은 검색어는 unigram 으로 처리)
+NGRAM_SIZE = 2
+# 자모열은 글자 종류가 적어 bigram 의 선택도가 낮으므로 trigram 을 사용
+JAMO_NGRAM_SIZE = 3
+
+EMPTY_POSTING: FrozenSet[int] = frozenset()
+
+# 후보가 이보다 많으면 정렬 대신 id 순으로 전체를 훑으며 멤버십만 확인
+LARGE_CANDIDATE_SET = 1000
+
+# 자동완성 결과 최대 개수 (trie 노드마다 이 개수만큼 상위 결과를 미리 보관)
+AUTOCOMPLETE_TOP_K = 10
+# trie 노드를 만드는 최대 깊이 (이보다 긴 접두사는 마지막 노드의 키 목록을 훑음)
+TRIE_MAX_DEPTH = 6
+
+# 오타 허용 검색의 최대 편집 거리 (자모 단위)
+FUZZY_MAX_DISTANCE = 2
+# 이 길이 이하의 자모열(대략 3글자)은 편집 거리 1 까지만 허용
+FUZZY_SHORT_KEY_LENGTH = 10
+# BK-tree 가 이보다 크면 거리 2 조회에서 편집 거리를 계산할 최대 노드 수 (노드당 약 15µs)
+FUZZY_MAX_VISITS = 5000
+
+
+class IndexedIngredient(NamedTuple):
+    id: int
+    name: str
+    search_name: str
+    chosung: str
+    jamo: str
+    category_id: Optional[int]
+    icon_url: Optional[str]
+
+
+def _normalize(text: str) -> str:
+    return text.lower()
+
+
+def _ngrams(text: str, n: int) -> set:
+    """
+    문자열의 unigram 과 n-gram 집합을 반환합니다.
+    """
+    grams = set(text)
+    for i in range(len(text) - n + 1):
+        grams.add(text[i : i + n])
+    return grams
+
+
+def _query_grams(keyword: str, n: int) -> set:
+    if len(keyword) < n:
+        return set(keyword)
+    return {keyword[i : i + n] for i in range(len(keyword) - n + 1)}
+
+
+class _NgramField:
+    """
+    하나의 필드(name, chosung, jamo)에 대한 n-gram 역색인.
+    posting 은 frozenset 이고, 쓰기는 clone() 한 사본에만 하므로 읽기는 락 없이 수행합니다.
+    """
+
+    def __init__(
+        self,
+        n: int = NGRAM_SIZE,
+        postings: Optional[Dict[str, FrozenSet[int]]] = None,
+    ):
+        self.n = n
+        self.postings: Dict[str, FrozenSet[int]] = postings or {}
+
+    @classmethod
+    def from_texts(
+        cls, texts: Iterable[Tuple[int, str]], n: int = NGRAM_SIZE
+    ) -> "_NgramField":
+        postings: Dict[str, set] = {}
+        for ingredient_id, text in texts:
+            for gram in _ngrams(text, n):
+                postings.setdefault(gram, set()).add(ingredient_id)
+        return cls(n, {gram: frozenset(ids) for gram, ids in postings.items()})
+
+    def clone(self) -> "_NgramField":
+        return _NgramField(self.n, dict(self.postings))
+
+    def add(self, ingredient_id: int, text: str) -> None:
+        for gram in _ngrams(text, self.n):
+            self.postings[gram] = self.postings.get(gram, EMPTY_POSTING) | {ingredient_id}
+
+    def remove(self, ingredient_id: int, text: str) -> None:
+        for gram in _ngrams(text, self.n):
+            posting = self.postings.get(gram, EMPTY_POSTING) - {ingredient_id}
+            if posting:
+                self.postings[gram] = posting
+            else:
+                self.postings.pop(gram, None)
+
+    def candidates(self, keyword: str) -> FrozenSet[int]:
+        postings = []
+        for gram in _query_grams(keyword, self.n):
+            posting = self.postings.get(gram)
+            if not posting:
+                return EMPTY_POSTING
+            postings.append(posting)
+
+        postings.sort(key=len)
+        result = postings[0]
+        for posting in postings[1:]:
+            result = result & posting
+            if not result:
+                break
+        return result
+
+
+class _TrieNode:
+    __slots__ = ("children", "keys", "top")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        # 경로가 이 노드에서 끝나는 (재료 id, 키) 목록
+        self.keys: set = set()
+        # 하위 트리 전체에서 순위가 가장 높은 재료 id (최대 AUTOCOMPLETE_TOP_K 개)
+        self.top: Tuple[int, ...] = ()
+
+    def copy(self) -> "_TrieNode":
+        node = _TrieNode()
+        node.children = dict(self.children)
+        node.keys = set(self.keys)
+        node.top = self.top
+        return node
+
+
+class _PrefixTrie:
+    """
+    접두사 자동완성용 trie.
+    각 노드가 하위 트리의 상위 K 개 결과를 보관하므로 조회는 O(접두사 길이 + K) 입니다.
+    노드는 TRIE_MAX_DEPTH 글자까지만 만들고, 더 긴 키는 마지막 노드에 모아 두어
+    자모열처럼 긴 키 때문에 노드 수가 폭증하지 않도록 합니다.
+
+    쓰기는 clone() 한 trie 에서 하며, 바뀌는 경로의 노드만 복사합니다 (path copying).
+    원래 trie 의 노드는 건드리지 않으므로 읽는 쪽은 락 없이 조회합니다.
+    """
+
+    def __init__(self, rank: Callable[[int], tuple]):
+        self.root = _TrieNode()
+        self._rank = rank
+        # 이 trie 에서 새로 만든(복사한) 노드. 이미 복사한 노드는 다시 복사하지 않습니다.
+        self._owned: set = set()
+
+    def clone(self, rank: Callable[[int], tuple]) -> "_PrefixTrie":
+        trie = _PrefixTrie(rank)
+        trie.root = self.root
+        return trie
+
+    @classmethod
+    def from_keys(
+        cls, keys: Iterable[Tuple[int, str]], rank: Callable[[int], tuple]
+    ) -> "_PrefixTrie":
+        trie = cls(rank)
+        for ingredient_id, key in keys:
+            trie._walk(key, create=True)[-1].keys.add((ingredient_id, key))
+        trie._compute_top(trie.root)
+        trie._owned = set()
+        return trie
+
+    def lookup(self, prefix: str) -> Tuple[int, ...]:
+        node = self.root
+        for char in prefix[:TRIE_MAX_DEPTH]:
+            node = node.children.get(char)
+            if node is None:
+                return ()
+
+        if len(prefix) <= TRIE_MAX_DEPTH:
+            return node.top
+        return self._best(
+            ingredient_id
+            for ingredient_id, key in node.keys
+            if key.startswith(prefix)
+        )
+
+    def add(self, ingredient_id: int, key: str) -> None:
+        path = self._walk(key, create=True)
+        path[-1].keys.add((ingredient_id, key))
+        for node in path:
+            if ingredient_id not in node.top:
+                node.top = self._best(node.top + (ingredient_id,))
+
+    def remove(self, ingredient_id: int, key: str) -> None:
+        path = self._walk(key)
+        if len(path) != len(key[:TRIE_MAX_DEPTH]) + 1:
+            return
+
+        path[-1].keys.discard((ingredient_id, key))
+        # 아래에서 위로 올라가며 상위 K 개를 다시 계산하고 빈 노드는 정리합니다.
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            if ingredient_id in node.top:
+                self._refresh_top(node)
+            if depth and not node.keys and not node.children:
+                path[depth - 1].children.pop(key[depth - 1], None)
+
+    def rerank(self, ingredient_id: int, key: str, increased: bool = True) -> None:
+        """
+        인기도가 바뀐 재료의 경로에 있는 상위 K 개를 다시 정렬합니다.
+        순위가 내려간 경우에는 다른 재료가 올라올 수 있으므로 아래에서 위로 자식 결과를 다시 합칩니다.
+        """
+        path = self._walk(key)
+        if increased:
+            for node in path:
+                node.top = self._best(set(node.top) | {ingredient_id})
+            return
+        for node in reversed(path):
+            self._refresh_top(node)
+
+    def _walk(self, key: str, create: bool = False) -> List[_TrieNode]:
+        """key 경로의 노드를 수정 가능한 사본으로 바꿔 root 부터 반환합니다."""
+        node = self.root = self._own(self.root)
+        path = [node]
+        for char in key[:TRIE_MAX_DEPTH]:
+            child = node.children.get(char)
+            if child is None:
+                if not create:
+                    break
+                child = _TrieNode()
+                self._owned.add(child)
+            else:
+                child = self._own(child)
+            node.children[char] = child
+            node = child
+            path.append(node)
+        return path
+
+    def _own(self, node: _TrieNode) -> _TrieNode:
+        if node in self._owned:
+            return node
+        copy = node.copy()
+        self._owned.add(copy)
+        return copy
+
+    def _best(self, ids: Iterable[int]) -> Tuple[int, ...]:
+        return tuple(heapq.nsmallest(AUTOCOMPLETE_TOP_K, set(ids), key=self._rank))
+
+    def _refresh_top(self, node: _TrieNode) -> None:
+        if not node.keys and len(node.children) == 1:
+            # 분기 없는 경로는 자식의 결과를 그대로 공유
+            node.top = next(iter(node.children.values())).top
+            return
+        ids = {ingredient_id for ingredient_id, _ in node.keys}
+        for child in node.children.values():
+            ids.update(child.top)
+        node.top = self._best(ids)
+
+    def _compute_top(self, node: _TrieNode) -> None:
+        stack = [(node, False)]
+        while stack:
+            current, visited = stack.pop()
+            if visited:
+                self._refresh_top(current)
+                continue
+            stack.append((current, True))
+            stack.extend((child, False) for child in current.children.values())
+
+
+class _BKTree:
+    """
+    자모열 편집 거리 기반 BK-tree.
+    삼각 부등식으로 가지를 쳐서 모든 재료와 거리를 계산하지 않고 유사 이름을 찾습니다.
+    삭제는 노드의 id 만 지우고, 빈 노드가 절반을 넘으면 다시 빌드합니다.
+    trie 와 같이 쓰기는 clone() 한 트리에서 바뀌는 경로의 노드만 복사하므로 읽기는 락 없이 수행합니다.
+    """
+
+    __slots__ = ("root", "size", "empty_nodes", "_owned")
+
+    def __init__(self):
+        # 노드: [키, 재료 id 집합, {거리: 자식 노드}]
+        self.root: Optional[list] = None
+        self.size = 0
+        self.empty_nodes = 0
+        # 이 트리에서 새로 만든(복사한) 노드의 id()
+        self._owned: set = set()
+
+    @classmethod
+    def from_keys(cls, keys: Iterable[Tuple[int, str]]) -> "_BKTree":
+        tree = cls()
+        for ingredient_id, key in keys:
+            tree.add(ingredient_id, key)
+        tree._owned = set()
+        return tree
+
+    def clone(self) -> "_BKTree":
+        tree = _BKTree()
+        tree.root = self.root
+        tree.size = self.size
+        tree.empty_nodes = self.empty_nodes
+        return tree
+
+    def add(self, ingredient_id: int, key: str) -> None:
+        if self.root is None:
+            self.root = self._new_node(key, ingredient_id)
+            self.size = 1
+            return
+
+        node = self.root = self._own(self.root)
+        while True:
+            distance = edit_distance(key, node[0])
+            if distance == 0:
+                if not node[1]:
+                    self.empty_nodes -= 1
+                node[1].add(ingredient_id)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = self._new_node(key, ingredient_id)
+                self.size += 1
+                return
+            child = node[2][distance] = self._own(child)
+            node = child
+
+    def remove(self, ingredient_id: int, key: str) -> None:
+        # 먼저 찾기만 하고, 지울 id 가 있을 때만 경로를 복사합니다.
+        distances = []
+        node = self.root
+        while node is not None:
+            distance = edit_distance(key, node[0])
+            if distance == 0:
+                break
+            distances.append(distance)
+            node = node[2].get(distance)
+        if node is None or ingredient_id not in node[1]:
+            return
+
+        node = self.root = self._own(self.root)
+        for distance in distances:
+            child = node[2][distance] = self._own(node[2][distance])
+            node = child
+        node[1].discard(ingredient_id)
+        if not node[1]:
+            self.empty_nodes += 1
+
+    def _new_node(self, key: str, ingredient_id: int) -> list:
+        node = [key, {ingredient_id}, {}]
+        self._owned.add(id(node))
+        return node
+
+    def _own(self, node: list) -> list:
+        if id(node) in self._owned:
+            return node
+        copy = [node[0], set(node[1]), dict(node[2])]
+        self._owned.add(id(copy))
+        return copy
+
+    def query(
+        self, key: str, max_distance: int, max_visits: Optional[int] = None
+    ) -> List[Tuple[int, int]]:
+        """
+        max_distance 이내의 (거리, 재료 id) 목록을 반환합니다.
+        max_visits 를 주면 그만큼의 노드만 확인하고 멈춥니다 (결과가 일부 빠질 수 있음).
+        """
+        if self.root is None:
+            return []
+
+        result = []
+        stack = [self.root]
+        visits = 0
+        while stack:
+            if max_visits is not None and visits >= max_visits:
+                break
+            visits += 1
+            node = stack.pop()
+            distance = edit_distance(key, node[0])
+            if distance <= max_distance:
+                result.extend((distance, ingredient_id) for ingredient_id in node[1])
+            low, high = distance - max_distance, distance + max_distance
+            stack.extend(
+                child for d, child in node[2].items() if low <= d <= high
+            )
+        return result
+
+    def items(self) -> Iterable[Tuple[int, str]]:
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            for ingredient_id in node[1]:
+                yield ingredient_id, node[0]
+            stack.extend(node[2].values())
+
+
+def db_contains(column, keyword: str, dialect_name: str):
+    """
+    DB 부분 일치 검색 조건.
+    Postgres 에서는 pg_trgm GIN 색인(migrations 0001)을 사용할 수 있도록 ILIKE 패턴으로,
+    그 외(로컬 SQLite)에서는 기존과 같이 LIKE 로 비교합니다.
+    """
+    if dialect_name == "postgresql":
+        escaped = keyword.replace("/", "//").replace("%", "/%").replace("_", "/_")
+        return column.ilike(f"%{escaped}%", escape="/")
+    return column.contains(keyword)
+
+
+def fuzzy_max_distance(key: str) -> int:
+    return 1 if len(key) <= FUZZY_SHORT_KEY_LENGTH else FUZZY_MAX_DISTANCE
+
+
+def load_ingredient_popularity(session: Session) -> Dict[int, int]:
+    """
+    재료별 타이머 사용 횟수를 인기도로 집계합니다.
+    """
+    rows = session.exec(
+        select(CookingSetting.ingredient_id, func.count(Timer.id))
+        .join(Timer, Timer.cooking_setting_id == CookingSetting.id)
+        .group_by(CookingSetting.ingredient_id)
+    ).all()
+    return {ingredient_id: count for ingredient_id, count in rows}
+
+
+def rebuild_ingredient_index(session: Session) -> None:
+    ingredient_index.build(
+        session.exec(select(Ingredient)).all(),
+        popularity=load_ingredient_popularity(session),
+    )
+
+
+def sync_ingredient_popularity(session: Session) -> None:
+    """
+    다른 워커에서 타이머가 만들어졌을 때(catalog sync) 호출합니다.
+    인기도는 DB 의 타이머 수로 다시 집계하므로 워커 재시작/배포 후에도 모든 워커가 같은 순위를 봅니다.
+    """
+    ingredient_index.update_popularity(load_ingredient_popularity(session))
+
+
+def sync_ingredient_index(session: Session) -> None:
+    """
+    다른 워커에서 재료가 바뀌었을 때(catalog sync) 호출합니다.
+    전체 빌드 대신 바뀐 재료만 색인에 반영합니다.
+    """
+    ingredient_index.sync(session.exec(select(Ingredient)).all())
+
+
+class _IndexState(NamedTuple):
+    """
+    검색 색인의 한 시점 상태.
+    읽기는 _state 를 한 번 가져와 그 값만 사용하고, 쓰기는 바뀌는 구조를 복사한 새 상태를 만들어
+    락 안에서 교체합니다 (copy-on-write). 읽는 도중 다른 요청의 쓰기가 끼어들어도 결과가 섞이지 않습니다.
+    """
+
+    entries: Dict[int, IndexedIngredient]
+    sorted_ids: List[int]
+    name: _NgramField
+    chosung: _NgramField
+    jamo: _NgramField
+    bktree: _BKTree
+    popularity: Dict[int, int]
+    trie: _PrefixTrie
+
+    def rank(self, ingredient_id: int) -> tuple:
+        return _rank(self.entries, self.popularity, ingredient_id)
+
+
+def _rank(
+    entries: Dict[int, IndexedIngredient], popularity: Dict[int, int], ingredient_id: int
+) -> tuple:
+    # 인기도 내림차순, 이름 오름차순
+    entry = entries.get(ingredient_id)
+    return (
+        -popularity.get(ingredient_id, 0),
+        entry.name if entry else "",
+        ingredient_id,
+    )
+
+
+def _ranker(
+    entries: Dict[int, IndexedIngredient], popularity: Dict[int, int]
+) -> Callable[[int], tuple]:
+    return lambda ingredient_id: _rank(entries, popularity, ingredient_id)
+
+
+class IngredientSearchIndex:
+    """
+    재료 이름/초성/자모 검색용 인메모리 n-gram 역색인.
+    워커마다 하나씩 존재하며 시작 시 DB 에서 빌드하고, 재료 쓰기 시 갱신합니다.
+    자모 분해 등 파생 값은 재료를 색인에 넣을 때 한 번만 계산합니다.
+    쓰기는 _IndexState 를 통째로 교체하므로 읽기는 락이 필요 없습니다.
+    """
+
+    def __init__(self):
+        # 쓰기끼리만 직렬화합니다.
+        self._lock = threading.Lock()
+        self._state = _IndexState(
+            entries={},
+            sorted_ids=[],
+            name=_NgramField(),
+            chosung=_NgramField(),
+            jamo=_NgramField(JAMO_NGRAM_SIZE),
+            bktree=_BKTree(),
+            popularity={},
+            trie=_PrefixTrie(_ranker({}, {})),
+        )
+        self.is_ready = False
+
+    def build(
+        self,
+        ingredients: Iterable[Ingredient],
+        popularity: Optional[Dict[int, int]] = None,
+    ) -> None:
+        entries = {}
+        for ingredient in ingredients:
+            entry = self._to_entry(ingredient)
+            entries[entry.id] = entry
+        popularity = dict(popularity or {})
+
+        # 완성된 색인으로 한 번에 교체하여 빌드 중에도 검색이 가능하도록 합니다.
+        state = _IndexState(
+            entries=entries,
+            sorted_ids=sorted(entries),
+            name=_NgramField.from_texts((e.id, e.search_name) for e in entries.values()),
+            chosung=_NgramField.from_texts((e.id, e.chosung) for e in entries.values()),
+            jamo=_NgramField.from_texts(
+                ((e.id, e.jamo) for e in entries.values()), JAMO_NGRAM_SIZE
+            ),
+            bktree=_BKTree.from_keys((e.id, e.jamo) for e in entries.values()),
+            popularity=popularity,
+            trie=_PrefixTrie.from_keys(
+                ((e.id, key) for e in entries.values() for key in self._trie_keys(e)),
+                _ranker(entries, popularity),
+            ),
+        )
+        with self._lock:
+            self._state = state
+            self.is_ready = True
+
+    def upsert(self, ingredient: Ingredient) -> None:
+        entry = self._to_entry(ingredient)
+        with self._lock:
+            state = self._writable()
+            previous = state.entries.get(entry.id)
+            if previous is not None:
+                self._remove(state, previous)
+            self._add(state, entry)
+            self._publish(state)
+
+    def remove(self, ingredient_id: int) -> None:
+        with self._lock:
+            previous = self._state.entries.get(ingredient_id)
+            if previous is None:
+                return
+            state = self._writable()
+            self._remove(state, previous)
+            self._publish(state)
+
+    def sync(self, ingredients: Iterable[Ingredient]) -> None:
+        """
+        색인의 재료와 DB 의 현재 재료 목록을 비교해 추가/변경/삭제된 재료만 갱신합니다.
+        이름/카테고리/아이콘이 같으면 파생 값(자모 분해 등)도 다시 계산하지 않습니다.
+        """
+        with self._lock:
+            entries = self._state.entries
+            state = None
+            current = set()
+            for ingredient in ingredients:
+                current.add(ingredient.id)
+                previous = entries.get(ingredient.id)
+                if previous is not None and (
+                    previous.name == ingredient.name
+                    and previous.category_id == ingredient.category_id
+                    and previous.icon_url == ingredient.icon_url
+                ):
+                    continue
+                state = state or self._writable()
+                if previous is not None:
+                    self._remove(state, previous)
+                self._add(state, self._to_entry(ingredient))
+
+            for ingredient_id in [i for i in entries if i not in current]:
+                state = state or self._writable()
+                self._remove(state, entries[ingredient_id])
+
+            if state is not None:
+                self._publish(state)
+
+    def bump_popularity(self, ingredient_id: int, amount: int = 1) -> None:
+        """이 워커의 타이머 생성을 바로 반영합니다. 다른 워커에는 sync 로 전달됩니다."""
+        with self._lock:
+            popularity = dict(self._state.popularity)
+            popularity[ingredient_id] = popularity.get(ingredient_id, 0) + amount
+            self._set_popularity(popularity)
+
+    def update_popularity(self, popularity: Dict[int, int]) -> None:
+        """DB 에서 집계한 인기도로 교체하고, 값이 바뀐 재료의 자동완성 순위만 다시 계산합니다."""
+        with self._lock:
+            self._set_popularity(dict(popularity))
+
+    def _set_popularity(self, popularity: Dict[int, int]) -> None:
+        state = self._state
+        previous = state.popularity
+        changed = [
+            ingredient_id
+            for ingredient_id in previous.keys() | popularity.keys()
+            if previous.get(ingredient_id, 0) != popularity.get(ingredient_id, 0)
+            and ingredient_id in state.entries
+        ]
+        trie = state.trie.clone(_ranker(state.entries, popularity))
+        # 순위가 오른 재료를 먼저 반영한 뒤, 내려간 재료의 경로를 자식부터 다시 합칩니다.
+        changed.sort(key=lambda i: popularity.get(i, 0) < previous.get(i, 0))
+        for ingredient_id in changed:
+            increased = popularity.get(ingredient_id, 0) > previous.get(ingredient_id, 0)
+            for key in self._trie_keys(state.entries[ingredient_id]):
+                trie.rerank(ingredient_id, key, increased)
+        self._state = state._replace(popularity=popularity, trie=trie)
+
+    def autocomplete(
+        self, keyword: str, limit: int = AUTOCOMPLETE_TOP_K
+    ) -> List[IngredientSearchResponse]:
+        """
+        접두사 일치 결과를 먼저, 부족하면 부분 일치 결과를 인기도 순으로 채워 반환합니다.
+        """
+        state = self._state
+        field, attr, keyword = self._match_field(state, keyword)
+        entries = state.entries
+
+        ranked = [i for i in state.trie.lookup(keyword)[:limit] if i in entries]
+
+        if len(ranked) < limit:
+            seen = set(ranked)
+            substring_ids = [
+                i
+                for i in field.candidates(keyword)
+                if i not in seen and i in entries and keyword in getattr(entries[i], attr)
+            ]
+            ranked.extend(
+                heapq.nsmallest(limit - len(ranked), substring_ids, key=state.rank)
+            )
+
+        return [self._to_response(entries[i]) for i in ranked]
+
+    def fuzzy_search(
+        self,
+        keyword: str,
+        category_id: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> List[IngredientSearchResponse]:
+        """
+        자모 단위 편집 거리가 작은 이름을 찾습니다 (오타 허용).
+        짧은 검색어는 거리 1, 그 외에는 FUZZY_MAX_DISTANCE 까지 허용하며
+        거리 오름차순, 인기도 순으로 정렬합니다.
+
+        BK-tree 노드가 FUZZY_MAX_VISITS 개를 넘으면 거리 1 로 먼저 조회하고, 결과가
+        skip + limit 개보다 적을 때만 노드 수를 제한해 반경을 넓힙니다. 이 경우 거리 2 결과가
+        일부 빠질 수 있습니다 (재료 10만 개 기준 질의당 약 85ms, 제한 없이는 약 200ms).
+        """
+        state = self._state
+        key = decompose_jamo(_normalize(keyword))
+        max_distance = fuzzy_max_distance(key)
+        entries = state.entries
+        bktree = state.bktree
+
+        if max_distance == 1 or bktree.size <= FUZZY_MAX_VISITS:
+            found = bktree.query(key, max_distance)
+        else:
+            found = set(bktree.query(key, 1))
+            if len(found) < skip + limit:
+                found.update(bktree.query(key, max_distance, FUZZY_MAX_VISITS))
+
+        matched = []
+        for distance, ingredient_id in found:
+            entry = entries.get(ingredient_id)
+            if entry is None or (category_id is not None and entry.category_id != category_id):
+                continue
+            matched.append((distance, state.rank(ingredient_id), entry))
+        matched.sort(key=lambda item: item[:2])
+        return [self._to_response(entry) for _, _, entry in matched[skip : skip + limit]]
+
+    def search(
+        self,
+        keyword: str,
+        category_id: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> List[IngredientSearchResponse]:
+        """
+        검색어가 초성으로만 이루어져 있으면 초성, 미완성 자모가 섞여 있으면 자모열,
+        아니면 이름에서 부분 일치 검색합니다. 결과는 id 오름차순입니다.
+        """
+        state = self._state
+        field, attr, keyword = self._match_field(state, keyword)
+        entries = state.entries
+
+        candidates = field.candidates(keyword)
+        if len(candidates) > LARGE_CANDIDATE_SET:
+            ordered_ids = (i for i in state.sorted_ids if i in candidates)
+        else:
+            ordered_ids = sorted(candidates)
+
+        matched = []
+        for ingredient_id in ordered_ids:
+            entry = entries.get(ingredient_id)
+            if entry is None or keyword not in getattr(entry, attr):
+                continue
+            if category_id is not None and entry.category_id != category_id:
+                continue
+            matched.append(entry)
+            if len(matched) >= skip + limit:
+                break
+
+        return [self._to_response(entry) for entry in matched[skip:]]
+
+    @staticmethod
+    def _match_field(state: _IndexState, keyword: str) -> Tuple[_NgramField, str, str]:
+        """검색어 형태에 맞는 (색인 필드, 비교할 속성, 정규화된 검색어)를 고릅니다."""
+        keyword = _normalize(keyword)
+        if is_chosung(keyword):
+            return state.chosung, "chosung", keyword
+        if has_jamo(keyword):
+            return state.jamo, "jamo", decompose_jamo(keyword)
+        return state.name, "search_name", keyword
+
+    @staticmethod
+    def _trie_keys(entry: IndexedIngredient) -> set:
+        return {entry.search_name, entry.chosung, entry.jamo}
+
+    @staticmethod
+    def _to_entry(ingredient: Ingredient) -> IndexedIngredient:
+        return IndexedIngredient(
+            id=ingredient.id,
+            name=ingredient.name,
+            search_name=_normalize(ingredient.name),
+            chosung=_normalize(get_chosung(ingredient.name)),
+            jamo=decompose_jamo(_normalize(ingredient.name)),
+            category_id=ingredient.category_id,
+            icon_url=ingredient.icon_url,
+        )
+
+    @staticmethod
+    def _to_response(entry: IndexedIngredient) -> IngredientSearchResponse:
+        return IngredientSearchResponse(
+            id=entry.id,
+            name=entry.name,
+            category_id=entry.category_id,
+            icon_url=entry.icon_url,
+        )
+
+    def _writable(self) -> _IndexState:
+        """재료 추가/삭제로 바뀌는 구조를 복사한 새 상태 (락 안에서 호출, 교체 전까지 읽는 쪽에 보이지 않음)."""
+        state = self._state
+        entries = dict(state.entries)
+        return state._replace(
+            entries=entries,
+            sorted_ids=list(state.sorted_ids),
+            name=state.name.clone(),
+            chosung=state.chosung.clone(),
+            jamo=state.jamo.clone(),
+            bktree=state.bktree.clone(),
+            trie=state.trie.clone(_ranker(entries, state.popularity)),
+        )
+
+    def _publish(self, state: _IndexState) -> None:
+        bktree = state.bktree
+        if bktree.empty_nodes * 2 > bktree.size:
+            state = state._replace(bktree=_BKTree.from_keys(bktree.items()))
+        self._state = state
+
+    def _add(self, state: _IndexState, entry: IndexedIngredient) -> None:
+        if entry.id not in state.entries:
+            bisect.insort(state.sorted_ids, entry.id)
+        state.entries[entry.id] = entry
+        state.name.add(entry.id, entry.search_name)
+        state.chosung.add(entry.id, entry.chosung)
+        state.jamo.add(entry.id, entry.jamo)
+        state.bktree.add(entry.id, entry.jamo)
+        for key in self._trie_keys(entry):
+            state.trie.add(entry.id, key)
+
+    def _remove(self, state: _IndexState, entry: IndexedIngredient) -> None:
+        sorted_ids = state.sorted_ids
+        position = bisect.bisect_left(sorted_ids, entry.id)
+        if position < len(sorted_ids) and sorted_ids[position] == entry.id:
+            del sorted_ids[position]
+        state.entries.pop(entry.id, None)
+        for key in self._trie_keys(entry):
+            state.trie.remove(entry.id, key)
+        state.name.remove(entry.id, entry.search_name)
+        state.chosung.remove(entry.id, entry.chosung)
+        state.jamo.remove(entry.id, entry.jamo)
+        state.bktree.remove(entry.id, entry.jamo)
+
+
+# 싱글톤 인스턴스
+ingredient_index = IngredientSearchIndex()
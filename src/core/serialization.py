@@ -0,0 +1,66 @@
+import json
+from functools import lru_cache
+from typing import Any, Union
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+
+from core.compression import CompressedBody, add_vary, negotiate_encoding, set_content_encoding
+from core.config import settings
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성: 없으면 표준 json 사용
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """
+    JSONResponse 와 같은 형태(공백 없음, UTF-8)로 직렬화합니다. orjson 이 설치되어 있으면 사용합니다.
+    """
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+
+@lru_cache(maxsize=None)
+def _adapter(type_: Any) -> TypeAdapter:
+    return TypeAdapter(type_)
+
+
+def encode_as(type_: Any, content: Any) -> bytes:
+    """
+    response_model=type_ 로 반환했을 때와 같은 JSON bytes 를 만듭니다.
+    jsonable_encoder 를 거치지 않고 pydantic-core 직렬화기로 한 번에 인코딩합니다.
+    """
+    adapter = _adapter(type_)
+    return adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+
+
+def encoded_response(
+    request: Request, response: Response, body: Union[bytes, CompressedBody]
+) -> Response:
+    """
+    미리 인코딩한 본문을 그대로 돌려줍니다.
+    Response 를 직접 반환하면 FastAPI 가 주입한 response 의 헤더(ETag, Link 등)를 합치지 않으므로 옮겨 담습니다.
+    CompressedBody 면 Accept-Encoding 에 맞는 압축본을 보내므로 미들웨어가 다시 압축하지 않습니다.
+    """
+    encoding = None
+    if isinstance(body, CompressedBody):
+        compressible = (
+            settings.COMPRESSION_ENABLED
+            and len(body.identity) >= settings.COMPRESSION_MINIMUM_SIZE
+        )
+        if compressible:
+            encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+        body = body.get(encoding)
+    else:
+        compressible = False
+
+    raw = Response(content=body, media_type="application/json")
+    raw.headers.raw.extend(response.headers.raw)
+    if compressible:
+        add_vary(raw.headers)
+    if encoding is not None:
+        set_content_encoding(raw.headers, encoding)
+    return raw
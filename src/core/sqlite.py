@@ -0,0 +1,40 @@
+from typing import List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from core.config import settings
+
+
+def sqlite_pragmas(read_only: bool = False) -> List[str]:
+    """
+    동시 읽기/쓰기에 맞춘 SQLite 연결 설정.
+    WAL 에서는 읽기가 쓰기를 기다리지 않고, synchronous=NORMAL 은 커밋마다 fsync 하지 않습니다
+    (전원이 나가면 마지막 커밋 일부를 잃을 수 있지만 DB 가 깨지지는 않음).
+    journal_mode 는 DB 파일에 저장되므로 쓰기 연결에서만 바꿉니다.
+    """
+    pragmas = [
+        f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}",
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}",
+        # 음수는 페이지 수가 아닌 KiB 단위
+        f"PRAGMA cache_size=-{settings.SQLITE_CACHE_SIZE_KIB}",
+        "PRAGMA temp_store=MEMORY",
+    ]
+    if read_only:
+        pragmas.append("PRAGMA query_only=ON")
+    else:
+        pragmas.insert(0, "PRAGMA journal_mode=WAL")
+    return pragmas
+
+
+def tune_sqlite(engine: Engine, read_only: bool = False) -> None:
+    """새 연결마다 sqlite_pragmas 를 적용합니다. 비동기 엔진은 async_engine.sync_engine 을 넘깁니다."""
+    pragmas = sqlite_pragmas(read_only)
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
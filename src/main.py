@@ -1,9 +1,11 @@
+import asyncio
 import logging
 import sys
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.routing import APIRoute
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlmodel import Session, select
 from starlette.middleware.cors import CORSMiddleware
 
@@ -11,7 +13,27 @@ sys.path.append("src")
 
 from api.v1.router import api_router
 from core.config import settings
-from core.database import engine, init_db
+from core.catalog import (
+    POPULARITY_VERSION_ENTITY,
+    catalog,
+    cooking_setting_lookup,
+    ensure_catalog_versions,
+)
+from core.compression import CompressionMiddleware
+from core.concurrency import (
+    ConcurrencyLimitExceeded,
+    align_thread_limiter,
+    server_busy_handler,
+)
+from core.database import async_engine, engine, init_db
+from core.pool_stats import DisconnectRetryMiddleware, pool_monitor
+from core.query_budget import QueryBudgetMiddleware
+from core.read_routing import ReadYourWritesMiddleware, read_router
+from core.search import (
+    rebuild_ingredient_index,
+    sync_ingredient_index,
+    sync_ingredient_popularity,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -28,15 +50,53 @@ async def lifespan(app: FastAPI):
         with Session(engine) as session:
             session.exec(select(1))
             await init_db(session, engine)
+
+            ensure_catalog_versions(session)
+            catalog.load(session, snapshot=settings.CATALOG_SNAPSHOT_ENABLED)
+            if settings.CATALOG_SNAPSHOT_ENABLED:
+                cooking_setting_lookup.build(session)
+                catalog.subscribe("cooking_settings", cooking_setting_lookup.build)
+                catalog.subscribe("ingredients", cooking_setting_lookup.build)
+                logger.info("Catalog snapshot loaded")
+
+            if settings.SEARCH_INDEX_ENABLED:
+                rebuild_ingredient_index(session)
+                catalog.subscribe("ingredients", sync_ingredient_index)
+                catalog.subscribe(POPULARITY_VERSION_ENTITY, sync_ingredient_popularity)
+                logger.info("Ingredient search index built")
     except Exception as e:
         logger.error(e)
         raise e
 
+    if settings.CONCURRENCY_LIMIT_ENABLED:
+        # 풀 대기열의 스레드가 DB 를 쓰지 않는 요청의 스레드까지 차지하지 않도록 넉넉히 둡니다.
+        align_thread_limiter(
+            settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW + settings.CONCURRENCY_QUEUE_SIZE
+        )
+
+    sync_task = None
+    if settings.CATALOG_SYNC_INTERVAL_SECONDS > 0:
+        sync_task = asyncio.create_task(
+            catalog.run_sync_loop(settings.CATALOG_SYNC_INTERVAL_SECONDS)
+        )
+
+    replica_task = None
+    if read_router.replica is not None:
+        read_router.check()
+        replica_task = asyncio.create_task(
+            read_router.run_check_loop(settings.DB_REPLICA_CHECK_INTERVAL_SECONDS)
+        )
+
     logger.info("Service finished initializing")
 
     yield
 
     logger.info("Service is shutting down")
+    if sync_task is not None:
+        sync_task.cancel()
+    if replica_task is not None:
+        replica_task.cancel()
+    await async_engine.dispose()
 
 
 app = FastAPI(
@@ -48,6 +108,23 @@ app = FastAPI(
 
 app.include_router(api_router)
 
+app.add_middleware(QueryBudgetMiddleware)
+
+if read_router.replica is not None:
+    app.add_middleware(
+        ReadYourWritesMiddleware, window_seconds=settings.DB_READ_YOUR_WRITES_SECONDS
+    )
+
+if settings.DB_DISCONNECT_HANDLING == "optimistic":
+    app.add_middleware(DisconnectRetryMiddleware, monitor=pool_monitor)
+
+# 커넥션 checkout 대기열이 가득 찼거나 풀 대기 시간이 지나면 503 + Retry-After
+app.add_exception_handler(ConcurrencyLimitExceeded, server_busy_handler)
+app.add_exception_handler(PoolTimeoutError, server_busy_handler)
+
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MINIMUM_SIZE)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -1,12 +1,26 @@
+from datetime import datetime
 from typing import Optional, List
 
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
 
 from core.enums import TipType, TimerFeedbackType, ColorTheme
 from utils.utils import get_chosung
 
 
-class Category(SQLModel, table=True):
+class SyncTracked(SQLModel):
+    """
+    오프라인 내보내기(delta 동기화) 대상 참조 데이터에 붙는 변경 추적 컬럼.
+    flush 시 core.export 가 채우므로 직접 설정하지 않으며, API 응답에는 포함하지 않습니다.
+    """
+
+    updated_at: Optional[datetime] = Field(default=None, exclude=True)
+    sync_version: int = Field(
+        default=0, index=True, exclude=True, sa_column_kwargs={"server_default": "0"}
+    )
+
+
+class Category(SyncTracked, table=True):
     __tablename__ = "categories"
 
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -24,12 +38,13 @@ class IngredientNutritionLink(SQLModel, table=True):
     ingredient_id: Optional[int] = Field(
         default=None, foreign_key="ingredients.id", primary_key=True
     )
+    # 기본 키는 (ingredient_id, nutrition_tag_id) 순서라 태그 기준 조회용 색인을 따로 둡니다.
     nutrition_tag_id: Optional[int] = Field(
-        default=None, foreign_key="nutrition_tags.id", primary_key=True
+        default=None, foreign_key="nutrition_tags.id", primary_key=True, index=True
     )
 
 
-class NutritionTag(SQLModel, table=True):
+class NutritionTag(SyncTracked, table=True):
     __tablename__ = "nutrition_tags"
 
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -42,7 +57,7 @@ class NutritionTag(SQLModel, table=True):
     )
 
 
-class Ingredient(SQLModel, table=True):
+class Ingredient(SyncTracked, table=True):
     __tablename__ = "ingredients"
 
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -80,7 +95,7 @@ class CookingMethod(SQLModel, table=True):
     # )
 
 
-class CookingTool(SQLModel, table=True):
+class CookingTool(SyncTracked, table=True):
     __tablename__ = "cooking_tools"
 
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -108,8 +123,16 @@ class HeatingMethod(SQLModel, table=True):
     # )
 
 
-class CookingSetting(SQLModel, table=True):
+class CookingSetting(SyncTracked, table=True):
     __tablename__ = "cooking_settings"
+    __table_args__ = (
+        # (재료, 조리도구) 조회와 재료별 조리도구 조회에 함께 사용
+        Index(
+            "ix_cooking_settings_ingredient_id_cooking_tool_id",
+            "ingredient_id",
+            "cooking_tool_id",
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     ingredient_id: int = Field(foreign_key="ingredients.id")
@@ -128,11 +151,11 @@ class CookingSetting(SQLModel, table=True):
     timers: List["Timer"] = Relationship(back_populates="cooking_setting")
 
 
-class CookingSettingTip(SQLModel, table=True):
+class CookingSettingTip(SyncTracked, table=True):
     __tablename__ = "cooking_setting_tips"
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    cooking_setting_id: int = Field(foreign_key="cooking_settings.id")
+    cooking_setting_id: int = Field(foreign_key="cooking_settings.id", index=True)
     tip_type: TipType = Field(index=True)
     message: str
 
@@ -144,7 +167,7 @@ class Timer(SQLModel, table=True):
     __tablename__ = "timers"
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    cooking_setting_id: int = Field(foreign_key="cooking_settings.id")
+    cooking_setting_id: int = Field(foreign_key="cooking_settings.id", index=True)
 
     # Relationships
     cooking_setting: CookingSetting = Relationship(back_populates="timers")
@@ -155,7 +178,7 @@ class TimerFeedback(SQLModel, table=True):
     __tablename__ = "timer_feedbacks"
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    timer_id: int = Field(foreign_key="timers.id")
+    timer_id: int = Field(foreign_key="timers.id", index=True)
     timer_feedback_type: TimerFeedbackType = Field(index=True)
     comment: Optional[str] = None
     # star_rating: Optional[int] = Field(default=None, ge=1, le=5)
@@ -169,3 +192,23 @@ class IngredientRequestFeedback(SQLModel, table=True):
 
     id: Optional[int] = Field(default=None, primary_key=True)
     comment: Optional[str] = None
+
+
+class CatalogVersion(SQLModel, table=True):
+    __tablename__ = "catalog_versions"
+
+    # 참조 데이터 종류 (categories, cooking_tools, ingredients, cooking_settings)
+    # 또는 오프라인 내보내기 버전(export)
+    entity: str = Field(primary_key=True)
+    version: int = Field(default=0)
+
+
+class CatalogTombstone(SQLModel, table=True):
+    __tablename__ = "catalog_tombstones"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    # 삭제된 행의 종류 (SyncTracked 테이블 이름)와 기본 키
+    entity: str
+    row_id: int
+    sync_version: int = Field(index=True)
+    deleted_at: datetime = Field(default_factory=datetime.utcnow)
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional, List
 
-from pydantic import BaseModel, EmailStr, ConfigDict
+from pydantic import BaseModel, EmailStr, ConfigDict, Field
 
 from core.enums import ColorTheme
 from models.common import CookingSettingTip, NutritionTag
@@ -76,6 +76,37 @@ class CookingToolResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+# 한 번에 조회할 수 있는 최대 개수
+BATCH_MAX_ITEMS = 100
+
+
+class IngredientBatchRequest(BaseModel):
+    ids: List[int] = Field(min_length=1, max_length=BATCH_MAX_ITEMS)
+
+
+class IngredientBatchItem(BaseModel):
+    id: int
+    found: bool
+    ingredient: Optional[IngredientResponse] = None
+
+
+class CookingSettingKey(BaseModel):
+    ingredient_id: int
+    cooking_tool_id: int
+
+
+class CookingSettingBatchRequest(BaseModel):
+    pairs: List[CookingSettingKey] = Field(min_length=1, max_length=BATCH_MAX_ITEMS)
+
+
+class CookingSettingBatchItem(BaseModel):
+    ingredient_id: int
+    cooking_tool_id: int
+    found: bool
+    # GET /cooking-settings 응답과 같은 형태
+    cooking_setting: Optional[dict] = None
+
+
 class UserCreate(BaseModel):
     email: EmailStr
     username: str
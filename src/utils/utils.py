@@ -1,3 +1,5 @@
+from typing import Iterable, List
+
 # 한글 유니코드 범위
 CHOSUNG_START_LETTER = 4352
 JAMO_START_LETTER = 44032
@@ -28,19 +30,137 @@ CHOSUNG_LIST = [
 ]
 
 
+# 중성 리스트
+JUNGSUNG_LIST = [
+    "ㅏ",
+    "ㅐ",
+    "ㅑ",
+    "ㅒ",
+    "ㅓ",
+    "ㅔ",
+    "ㅕ",
+    "ㅖ",
+    "ㅗ",
+    "ㅘ",
+    "ㅙ",
+    "ㅚ",
+    "ㅛ",
+    "ㅜ",
+    "ㅝ",
+    "ㅞ",
+    "ㅟ",
+    "ㅠ",
+    "ㅡ",
+    "ㅢ",
+    "ㅣ",
+]
+
+# 종성 리스트 (첫 번째는 받침 없음)
+JONGSUNG_LIST = [
+    "",
+    "ㄱ",
+    "ㄲ",
+    "ㄳ",
+    "ㄴ",
+    "ㄵ",
+    "ㄶ",
+    "ㄷ",
+    "ㄹ",
+    "ㄺ",
+    "ㄻ",
+    "ㄼ",
+    "ㄽ",
+    "ㄾ",
+    "ㄿ",
+    "ㅀ",
+    "ㅁ",
+    "ㅂ",
+    "ㅄ",
+    "ㅅ",
+    "ㅆ",
+    "ㅇ",
+    "ㅈ",
+    "ㅊ",
+    "ㅋ",
+    "ㅌ",
+    "ㅍ",
+    "ㅎ",
+]
+
+JUNGSUNG_COUNT = 21
+JONGSUNG_COUNT = 28
+
+# 한글 호환 자모 범위 (ㄱ ~ ㅣ)
+COMPAT_JAMO_START_LETTER = 0x3131
+COMPAT_JAMO_END_LETTER = 0x3163
+
+# 겹자음/겹모음 분해 (입력 중인 글자와 완성된 글자를 같은 기준으로 비교하기 위함)
+COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ",
+    "ㄵ": "ㄴㅈ",
+    "ㄶ": "ㄴㅎ",
+    "ㄺ": "ㄹㄱ",
+    "ㄻ": "ㄹㅁ",
+    "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ",
+    "ㄿ": "ㄹㅍ",
+    "ㅀ": "ㄹㅎ",
+    "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ",
+    "ㅙ": "ㅗㅐ",
+    "ㅚ": "ㅗㅣ",
+    "ㅝ": "ㅜㅓ",
+    "ㅞ": "ㅜㅔ",
+    "ㅟ": "ㅜㅣ",
+    "ㅢ": "ㅡㅣ",
+}
+
+
+def _build_chosung_table() -> dict:
+    """
+    한글 음절(가~힣) 코드포인트 -> 초성 변환 테이블 (str.translate 용)
+    """
+    return {
+        code: CHOSUNG_LIST[(code - JAMO_START_LETTER) // JAMO_CYCLES]
+        for code in range(JAMO_START_LETTER, JAMO_END_LETTER + 1)
+    }
+
+
+def _build_jamo_table() -> dict:
+    """
+    한글 음절/겹자모 코드포인트 -> 낱자 자모열 변환 테이블 (str.translate 용)
+    """
+    table = {ord(jamo): letters for jamo, letters in COMPOUND_JAMO.items()}
+    for code in range(JAMO_START_LETTER, JAMO_END_LETTER + 1):
+        char_code = code - JAMO_START_LETTER
+        jungsung = JUNGSUNG_LIST[(char_code % JAMO_CYCLES) // JONGSUNG_COUNT]
+        jongsung = JONGSUNG_LIST[char_code % JONGSUNG_COUNT]
+        table[code] = (
+            CHOSUNG_LIST[char_code // JAMO_CYCLES]
+            + COMPOUND_JAMO.get(jungsung, jungsung)
+            + COMPOUND_JAMO.get(jongsung, jongsung)
+        )
+    return table
+
+
+CHOSUNG_TABLE = _build_chosung_table()
+JAMO_TABLE = _build_jamo_table()
+
+
 def get_chosung(text: str) -> str:
     """
     한글 문자열의 초성을 추출합니다.
     """
-    result = []
-    for char in text:
-        if "가" <= char <= "힣":
-            char_code = ord(char) - JAMO_START_LETTER
-            char_code = char_code // JAMO_CYCLES
-            result.append(CHOSUNG_LIST[char_code])
-        else:
-            result.append(char)
-    return "".join(result)
+    return text.translate(CHOSUNG_TABLE)
+
+
+def get_chosung_batch(texts: Iterable[str]) -> List[str]:
+    """
+    여러 문자열의 초성을 한 번에 추출합니다.
+    """
+    table = CHOSUNG_TABLE
+    return [text.translate(table) for text in texts]
 
 
 def is_chosung(keyword: str) -> bool:
@@ -48,3 +168,55 @@ def is_chosung(keyword: str) -> bool:
     문자열이 초성으로만 이루어져 있는지 확인합니다.
     """
     return all(char in CHOSUNG_LIST for char in keyword)
+
+
+def has_jamo(keyword: str) -> bool:
+    """
+    문자열에 완성되지 않은 자모(ㄱ, ㅏ 등)가 포함되어 있는지 확인합니다.
+    """
+    return any(
+        COMPAT_JAMO_START_LETTER <= ord(char) <= COMPAT_JAMO_END_LETTER
+        for char in keyword
+    )
+
+
+def decompose_jamo(text: str) -> str:
+    """
+    한글 문자열을 초성/중성/종성 자모열로 분해합니다.
+    겹자음/겹모음도 낱자로 분해하므로 입력 중인 "감ㅈ" 은 "감자" 의 자모열과 부분 일치합니다.
+    """
+    return text.translate(JAMO_TABLE)
+
+
+def edit_distance(a: str, b: str) -> int:
+    """
+    두 문자열의 레벤슈타인 편집 거리를 계산합니다.
+    짧은 쪽 문자열을 비트열로 표현하는 Myers 비트 병렬 알고리즘을 사용합니다.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return len(a)
+
+    peq = {}
+    for i, char in enumerate(b):
+        peq[char] = peq.get(char, 0) | (1 << i)
+
+    mask = (1 << len(b)) - 1
+    last = 1 << (len(b) - 1)
+    pv, mv, score = mask, 0, len(b)
+    for char in a:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+    return score
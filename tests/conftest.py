@@ -0,0 +1,96 @@
+"""
+pytest 공통 설정.
+
+설정(core.config.settings)과 엔진은 import 시점에 만들어지므로 앱을 import 하기 전에
+환경 변수를 지정합니다. 임시 SQLite DB 를 쓰고, 스냅샷/검색 색인/응답 캐시를 꺼서
+엔드포인트가 DB 로 처리하는 최악의 경우를 검사합니다.
+"""
+import os
+import tempfile
+
+import pytest
+
+os.environ.update(
+    ENVIRONMENT="test",
+    SQLITE_ENABLED="true",
+    SQLITE_PATH=os.path.join(tempfile.mkdtemp(prefix="welldone-test-"), "test.db"),
+    CATALOG_SNAPSHOT_ENABLED="false",
+    SEARCH_INDEX_ENABLED="false",
+    RESPONSE_CACHE_MAX_ENTRIES="0",
+    CATALOG_SYNC_INTERVAL_SECONDS="0",
+)
+# 이미지 업로드용 스토리지 설정 (테스트에서는 호출하지 않음)
+for key, value in {
+    "NAVER_CLOUD_ACCESS_KEY": "test",
+    "NAVER_CLOUD_SECRET_KEY": "test",
+    "NAVER_CLOUD_ENDPOINT": "http://localhost",
+    "NAVER_CLOUD_REGION": "kr-standard",
+    "NAVER_CLOUD_BUCKET": "test",
+}.items():
+    os.environ.setdefault(key, value)
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+
+from core.database import engine  # noqa: E402
+from core.enums import TipType  # noqa: E402
+from main import app  # noqa: E402
+from models.common import (  # noqa: E402
+    Category,
+    CookingSetting,
+    CookingSettingTip,
+    CookingTool,
+    Ingredient,
+    IngredientNutritionLink,
+    NutritionTag,
+    Timer,
+)
+from utils.utils import get_chosung  # noqa: E402
+
+
+def seed(session: Session) -> dict:
+    """각 엔드포인트가 한 건 이상 찾을 수 있도록 최소한의 참조 데이터를 넣고 id 를 돌려줍니다."""
+    category = Category(name="채소")
+    tool = CookingTool(name="에어프라이어")
+    tag = NutritionTag(name="식이섬유")
+    session.add_all([category, tool, tag])
+    session.flush()
+
+    ingredient = Ingredient(name="감자", chosung=get_chosung("감자"), category_id=category.id)
+    session.add(ingredient)
+    session.flush()
+
+    setting = CookingSetting(
+        ingredient_id=ingredient.id, cooking_tool_id=tool.id, temperature=180, cooking_time=900
+    )
+    session.add_all(
+        [setting, IngredientNutritionLink(ingredient_id=ingredient.id, nutrition_tag_id=tag.id)]
+    )
+    session.flush()
+
+    tip = CookingSettingTip(
+        cooking_setting_id=setting.id, tip_type=TipType.COOKING, message="중간에 뒤집어 주세요"
+    )
+    timer = Timer(cooking_setting_id=setting.id)
+    session.add_all([tip, timer])
+    session.commit()
+    return {
+        "category_id": category.id,
+        "tool_id": tool.id,
+        "ingredient_id": ingredient.id,
+        "cooking_setting_id": setting.id,
+        "tip_id": tip.id,
+        "timer_id": timer.id,
+    }
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def ids(client) -> dict:
+    with Session(engine) as session:
+        return seed(session)
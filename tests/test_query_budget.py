@@ -0,0 +1,105 @@
+"""
+@query_budget 으로 예산을 선언한 엔드포인트가 DB 로 처리하는 최악의 경우에도 예산 안에서 끝나는지 확인합니다.
+test 환경에서는 예산을 넘으면 QueryBudgetMiddleware 가 QueryBudgetExceeded 를 발생시킵니다.
+"""
+import pytest
+from fastapi.routing import APIRoute
+
+from core.config import settings
+from core.query_budget import QUERY_COUNT_HEADER, QueryBudgetExceeded
+from main import app
+
+API = settings.API_V1_STR
+
+# (메서드, 라우트 경로, 쿼리 파라미터, JSON 본문). {..} 는 conftest.seed 의 id 로 채웁니다.
+CASES = [
+    ("GET", "/categories/", {}, None),
+    ("GET", "/categories/{category_id}", {}, None),
+    ("GET", "/cooking-tools/", {}, None),
+    ("GET", "/cooking-tools/{tool_id}", {}, None),
+    ("GET", "/ingredients/", {}, None),
+    ("GET", "/ingredients/", {"is_random": True, "limit": 10}, None),
+    ("GET", "/ingredients/{ingredient_id}", {}, None),
+    ("GET", "/ingredients/{ingredient_id}/tags", {}, None),
+    ("GET", "/ingredients/search", {"keyword": "감"}, None),
+    ("GET", "/ingredients/search", {"keyword": "ㄱㅈ"}, None),
+    ("GET", "/ingredients/autocomplete", {"keyword": "감"}, None),
+    ("POST", "/ingredients/batch", {}, {"ids": ["{ingredient_id}", 0]}),
+    (
+        "GET",
+        "/cooking-settings/",
+        {"ingredient_id": "{ingredient_id}", "cooking_tool_id": "{tool_id}"},
+        None,
+    ),
+    (
+        "POST",
+        "/cooking-settings/batch",
+        {},
+        {"pairs": [{"ingredient_id": "{ingredient_id}", "cooking_tool_id": "{tool_id}"}]},
+    ),
+    ("GET", "/cooking-settings/{cooking_setting_id}/tips", {}, None),
+    ("GET", "/cooking-settings/{cooking_setting_id}/tips/{tip_id}", {}, None),
+    ("GET", "/catalog/export", {}, None),
+    ("GET", "/catalog/export", {"since": 0}, None),
+    ("POST", "/timers/", {}, {"cooking_setting_id": "{cooking_setting_id}"}),
+    ("GET", "/timers/{timer_id}", {}, None),
+    ("POST", "/feedback/timer-feedback", {}, {"timer_id": "{timer_id}", "timer_feedback_type": "good"}),
+    ("POST", "/feedback/ingredient-request-feedback", {}, {"comment": "고구마"}),
+]
+
+
+def _fill(value, ids: dict):
+    """템플릿의 "{name}" 값을 seed id 로 바꿉니다 (문자열 하나가 통째로 자리표시자면 int 로)."""
+    if isinstance(value, str):
+        if value.startswith("{") and value.endswith("}") and value[1:-1] in ids:
+            return ids[value[1:-1]]
+        return value.format(**ids)
+    if isinstance(value, list):
+        return [_fill(item, ids) for item in value]
+    if isinstance(value, dict):
+        return {key: _fill(item, ids) for key, item in value.items()}
+    return value
+
+
+def _budget_routes() -> dict:
+    return {
+        (method, route.path): route.endpoint.__query_budget__
+        for route in app.routes
+        if isinstance(route, APIRoute) and hasattr(route.endpoint, "__query_budget__")
+        for method in route.methods
+    }
+
+
+def test_every_budgeted_endpoint_is_covered():
+    covered = {(method, API + path) for method, path, _, _ in CASES}
+    assert set(_budget_routes()) <= covered
+
+
+@pytest.mark.parametrize("method, path, params, body", CASES)
+def test_query_budget(client, ids, method, path, params, body):
+    response = client.request(
+        method, API + _fill(path, ids), params=_fill(params, ids), json=_fill(body, ids)
+    )
+    assert response.status_code < 400, response.text
+
+    budget = _budget_routes()[(method, API + path)]
+    assert int(response.headers[QUERY_COUNT_HEADER]) <= budget
+
+
+def test_query_budget_exceeded_raises(client, ids, monkeypatch):
+    route = next(
+        route for route in app.routes
+        if isinstance(route, APIRoute) and route.path == f"{API}/timers/{{timer_id}}"
+    )
+    monkeypatch.setattr(route.endpoint, "__query_budget__", 0)
+    with pytest.raises(QueryBudgetExceeded):
+        client.get(f"{API}/timers/{ids['timer_id']}")
+
+
+def test_query_count_header_only_in_local_and_test(client, ids, monkeypatch):
+    path = f"{API}/timers/{ids['timer_id']}"
+    assert QUERY_COUNT_HEADER in client.get(path).headers
+
+    for environment in ("staging", "production"):
+        monkeypatch.setattr(settings, "ENVIRONMENT", environment)
+        assert QUERY_COUNT_HEADER not in client.get(path).headers